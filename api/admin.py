@@ -7,9 +7,11 @@ class UserAdmin(BaseUserAdmin):
     list_display = ('username', 'email', 'first_name', 'last_name', 'is_employee', 'annual_leave_days')
     list_filter = ('is_employee', 'is_staff', 'is_superuser')
     fieldsets = BaseUserAdmin.fieldsets + (
-        ('Çalışan Bilgisi', {'fields': ('is_employee', 'annual_leave_days', 'resume', 'low_leave_notified')}),
+        ('Çalışan Bilgisi', {'fields': ('is_employee', 'annual_leave_days', 'resume', 'low_leave_notified', 'work_schedule')}),
     )
 
 admin.site.register(User, UserAdmin)
 admin.site.register(Attendance)
-admin.site.register(LeaveRequest)
\ No newline at end of file
+admin.site.register(LeaveRequest)
+admin.site.register(Holiday)
+admin.site.register(WorkSchedule)
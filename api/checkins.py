@@ -0,0 +1,160 @@
+"""Buffered check-ins for the shift-start rush (``CHECK_IN_FAST_PATH``).
+
+The request only claims a per-user, per-day marker in Redis and queues the
+check-in; ``flush_check_ins_task`` writes queued check-ins to ``Attendance``
+with one ``bulk_create`` per batch and applies lateness deductions in bulk.
+"""
+
+import json
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .models import Attendance, User
+from .schedules import shift_resolver
+from .utils import get_redis
+
+CHECK_IN_BUFFER_KEY = "check-ins:buffer"
+CHECK_IN_FLUSH_KEY = "check-ins:flush-scheduled"
+# Markers outlive the day they guard so late flushes are still deduplicated
+CHECK_IN_MARKER_TTL = 2 * 24 * 60 * 60
+
+
+def check_in_marker_key(user_id, day):
+    return f"check-ins:{day}:{user_id}"
+
+
+def buffer_check_in(user_id, start_time, day):
+    """Queue a check-in; returns ``False`` if the user already checked in that day."""
+    client = get_redis()
+    if not client.set(
+        check_in_marker_key(user_id, day), 1, nx=True, ex=CHECK_IN_MARKER_TTL
+    ):
+        return False
+
+    client.rpush(
+        CHECK_IN_BUFFER_KEY,
+        json.dumps(
+            {
+                "user_id": user_id,
+                "start_time": start_time.isoformat(),
+                "date": day.isoformat(),
+            }
+        ),
+    )
+    schedule_check_in_flush(client, settings.CHECK_IN_FLUSH_WINDOW)
+    return True
+
+
+def schedule_check_in_flush(client, countdown):
+    """Schedule a flush unless one is already pending.
+
+    The key expires on its own in case that flush is lost.
+    """
+    from .tasks import flush_check_ins_task
+
+    if client.set(CHECK_IN_FLUSH_KEY, 1, nx=True, ex=countdown + 60):
+        flush_check_ins_task.apply_async(countdown=countdown)
+
+
+def is_check_in_pending(user_id, day):
+    """True if a check-in was buffered for the day; callers rule out a written row."""
+    try:
+        return bool(get_redis().exists(check_in_marker_key(user_id, day)))
+    except Exception as e:
+        print(f"Check-in marker lookup failed: {e}")
+        return False
+
+
+def insert_check_in(user_id, start_time, day, late_minutes):
+    """Insert the day's attendance in one statement.
+
+    Returns ``False`` if the user already has a row for ``day``. Like
+    ``write_check_ins`` this bypasses ``Attendance.save``, so the caller
+    supplies ``late_minutes``; the rollup signal ignores open sessions anyway.
+    """
+    opts = Attendance._meta
+    columns = {
+        "user": user_id,
+        "date": day,
+        "start_time": start_time,
+        "late_minutes": late_minutes,
+        "updated_at": start_time,
+    }
+    fields = [opts.get_field(name) for name in columns]
+    quote = connection.ops.quote_name
+    sql = (
+        f"INSERT INTO {quote(opts.db_table)} "
+        f"({', '.join(quote(field.column) for field in fields)}) "
+        f"VALUES ({', '.join(['%s'] * len(fields))}) "
+        f"ON CONFLICT ({quote(opts.get_field('user').column)}, {quote(opts.get_field('date').column)}) "
+        f"DO NOTHING RETURNING {quote(opts.pk.column)}"
+    )
+    params = [
+        field.get_db_prep_save(value, connection)
+        for field, value in zip(fields, columns.values())
+    ]
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchone() is not None
+
+
+def write_check_ins(events):
+    """Insert buffered check-ins and deduct leave for late ones.
+
+    ``bulk_create`` skips ``Attendance.save``, so ``late_minutes`` is computed
+    here. Rows that already existed are skipped by ``ignore_conflicts`` and
+    are not charged again. Returns the late attendances that were inserted.
+    """
+    schedule_ids = dict(
+        User.objects.filter(
+            id__in={event["user_id"] for event in events}
+        ).values_list("id", "work_schedule_id")
+    )
+
+    resolve_shift = shift_resolver()
+    attendances = []
+    for event in events:
+        if event["user_id"] not in schedule_ids:
+            continue
+        start_time = parse_datetime(event["start_time"])
+        shift = resolve_shift(schedule_ids[event["user_id"]])
+        attendances.append(
+            Attendance(
+                user_id=event["user_id"],
+                date=parse_date(event["date"]),
+                start_time=start_time,
+                late_minutes=shift.late_minutes(start_time),
+            )
+        )
+    if not attendances:
+        return []
+
+    with transaction.atomic():
+        Attendance.objects.bulk_create(
+            attendances,
+            batch_size=settings.CHECK_IN_FLUSH_MAX_BATCH,
+            ignore_conflicts=True,
+        )
+        # ignore_conflicts leaves pk unset; find our rows by their exact start
+        inserted = set(
+            Attendance.objects.filter(
+                user_id__in={attendance.user_id for attendance in attendances},
+                date__in={attendance.date for attendance in attendances},
+            ).values_list("user_id", "date", "start_time")
+        )
+        late = [
+            attendance
+            for attendance in attendances
+            if attendance.late_minutes
+            and (attendance.user_id, attendance.date, attendance.start_time) in inserted
+        ]
+        User.bulk_deduct_leave_days(
+            {
+                attendance.user_id: attendance.late_minutes
+                / resolve_shift(schedule_ids[attendance.user_id]).minutes_per_day
+                for attendance in late
+            }
+        )
+    return late
@@ -1,8 +1,20 @@
+from datetime import time
+
 NOTIFICATION_TYPE_INFO = 'info'
 NOTIFICATION_TYPE_SUCCESS = 'success'
 NOTIFICATION_TYPE_WARNING = 'warning'
 NOTIFICATION_TYPE_ERROR = 'error'
 
+# Company working hours (local time)
+WORK_START_TIME = time(8, 0)
+WORK_END_TIME = time(18, 0)
+
+# date.weekday() values that are never working days
+WEEKEND_DAYS = (5, 6)
+
+# Admins are notified once an employee's remaining leave drops below this
+LOW_LEAVE_THRESHOLD = 3
+
 
 def create_notification(message, notif_type=NOTIFICATION_TYPE_INFO):
     return {
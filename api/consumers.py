@@ -1,6 +1,8 @@
 import json
 from channels.generic.websocket import AsyncWebsocketConsumer
 
+from .utils import ADMINS_GROUP
+
 class NotificationConsumer(AsyncWebsocketConsumer):
     async def connect(self):
         if self.scope["user"].is_anonymous:
@@ -11,6 +13,11 @@ class NotificationConsumer(AsyncWebsocketConsumer):
                 self.group_name,
                 self.channel_name
             )
+            if self.scope["user"].is_superuser:
+                await self.channel_layer.group_add(
+                    ADMINS_GROUP,
+                    self.channel_name
+                )
             await self.accept()
 
     async def disconnect(self, close_code):
@@ -19,6 +26,11 @@ class NotificationConsumer(AsyncWebsocketConsumer):
                 self.group_name,
                 self.channel_name
             )
+            if self.scope["user"].is_superuser:
+                await self.channel_layer.group_discard(
+                    ADMINS_GROUP,
+                    self.channel_name
+                )
 
     async def send_notification(self, event):
         message = event['message']
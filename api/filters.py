@@ -0,0 +1,48 @@
+from django_filters import rest_framework as filters
+
+from .models import Attendance, LeaveRequest
+
+
+class AttendanceFilter(filters.FilterSet):
+    user = filters.NumberFilter(field_name="user_id", help_text="Kullanıcı kimliği.")
+    date_from = filters.DateFilter(
+        field_name="date", lookup_expr="gte", help_text="Bu tarihten itibaren."
+    )
+    date_to = filters.DateFilter(
+        field_name="date", lookup_expr="lte", help_text="Bu tarihe kadar (dahil)."
+    )
+    late = filters.BooleanFilter(
+        method="filter_late", help_text="Sadece geç kalınan kayıtlar."
+    )
+    open = filters.BooleanFilter(
+        field_name="end_time",
+        lookup_expr="isnull",
+        help_text="Henüz check-out yapılmamış oturumlar.",
+    )
+
+    class Meta:
+        model = Attendance
+        fields = ["user", "date_from", "date_to", "late", "open"]
+
+    def filter_late(self, queryset, name, value):
+        if value:
+            return queryset.filter(late_minutes__gt=0)
+        return queryset.filter(late_minutes=0)
+
+
+class LeaveRequestFilter(filters.FilterSet):
+    user = filters.NumberFilter(field_name="user_id", help_text="Kullanıcı kimliği.")
+    overlaps_from = filters.DateFilter(
+        field_name="end_date",
+        lookup_expr="gte",
+        help_text="Bu tarihte veya sonrasında biten izinler.",
+    )
+    overlaps_to = filters.DateFilter(
+        field_name="start_date",
+        lookup_expr="lte",
+        help_text="Bu tarihte veya öncesinde başlayan izinler.",
+    )
+
+    class Meta:
+        model = LeaveRequest
+        fields = ["status", "user", "overlaps_from", "overlaps_to"]
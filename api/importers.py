@@ -0,0 +1,295 @@
+import csv
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .models import User, Attendance
+from .summaries import rebuild_work_summaries
+from .schedules import shift_resolver
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+TRUE_VALUES = {"1", "true", "yes", "evet"}
+
+IMPORT_CONFLICT_ERROR = (
+    "Kayıtlar içe aktarma sırasında başka bir işlemle çakıştı; hiçbir kayıt eklenmedi."
+)
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    rejected: list = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self):
+        total = self.created + len(self.rejected)
+        return round(total / self.elapsed, 1) if self.elapsed else float(total)
+
+    def as_dict(self):
+        return {
+            "created": self.created,
+            "rejected": len(self.rejected),
+            "rejected_rows": [
+                {"line": line, "errors": errors}
+                for line, errors in sorted(self.rejected)
+            ],
+            "elapsed_seconds": round(self.elapsed, 3),
+            "rows_per_second": self.rows_per_second,
+        }
+
+
+def iter_records(stream, file_format):
+    """Yield ``(line_number, dict)`` pairs from a text stream without loading it whole."""
+    if file_format == "csv":
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, record
+    else:
+        for line_number, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            yield line_number, record if isinstance(record, dict) else {}
+
+
+def open_text(binary_file):
+    return io.TextIOWrapper(binary_file, encoding="utf-8-sig", newline="")
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _text(record, key):
+    value = record.get(key)
+    return "" if value is None else str(value).strip()
+
+
+def _init_worker():
+    # Spawned workers (non-fork platforms) need Django configured for the hashers
+    import django
+
+    django.setup()
+
+
+def _hash_passwords(passwords, executor):
+    # Unusable passwords are cheap; only real ones go through the pool
+    to_hash = [password for password in passwords if password]
+    if executor is None:
+        hashed = iter(map(make_password, to_hash))
+    else:
+        hashed = iter(executor.map(make_password, to_hash, chunksize=32) if to_hash else [])
+    return [next(hashed) if password else make_password(None) for password in passwords]
+
+
+def _validate_employee(record, seen_usernames):
+    errors = []
+    username = _text(record, "username")
+    email = _text(record, "email")
+
+    if not username:
+        errors.append("username gereklidir.")
+    else:
+        try:
+            UnicodeUsernameValidator()(username)
+        except ValidationError as e:
+            errors.extend(e.messages)
+        if username in seen_usernames:
+            errors.append("username dosyada tekrar ediyor.")
+    if email:
+        try:
+            validate_email(email)
+        except ValidationError as e:
+            errors.extend(e.messages)
+
+    annual_leave_days = _text(record, "annual_leave_days")
+    try:
+        annual_leave_days = float(annual_leave_days) if annual_leave_days else 15.0
+    except ValueError:
+        errors.append("annual_leave_days sayı olmalıdır.")
+
+    if errors:
+        return None, errors
+
+    is_employee = _text(record, "is_employee")
+    return (
+        User(
+            username=username,
+            email=email,
+            first_name=_text(record, "first_name"),
+            last_name=_text(record, "last_name"),
+            is_employee=is_employee.lower() in TRUE_VALUES if is_employee else True,
+            annual_leave_days=annual_leave_days,
+        ),
+        _text(record, "password"),
+    ), None
+
+
+def import_employees(records, chunk_size=1000, workers=None):
+    """Validate and ``bulk_create`` employees, hashing passwords across a process pool.
+
+    ``workers=1`` hashes in the calling process. The import runs in one
+    transaction, so a failure leaves no employees behind.
+    """
+    result = ImportResult()
+    started = time.monotonic()
+    seen_usernames = set()
+
+    pool = (
+        nullcontext()
+        if workers == 1
+        else ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(), initializer=_init_worker
+        )
+    )
+    with pool as executor, transaction.atomic():
+        for chunk in _chunks(records, chunk_size):
+            candidates = []
+            for line_number, record in chunk:
+                candidate, errors = _validate_employee(record, seen_usernames)
+                if errors:
+                    result.rejected.append((line_number, errors))
+                    continue
+                seen_usernames.add(candidate[0].username)
+                candidates.append((line_number, candidate))
+
+            existing = set(
+                User.objects.filter(
+                    username__in=[user.username for _, (user, _) in candidates]
+                ).values_list("username", flat=True)
+            )
+            users, passwords = [], []
+            for line_number, (user, password) in candidates:
+                if user.username in existing:
+                    result.rejected.append((line_number, ["username zaten kayıtlı."]))
+                    continue
+                users.append(user)
+                passwords.append(password)
+
+            for user, hashed in zip(users, _hash_passwords(passwords, executor)):
+                user.password = hashed
+
+            User.objects.bulk_create(users, batch_size=chunk_size)
+            result.created += len(users)
+
+    result.elapsed = time.monotonic() - started
+    return result
+
+
+def _parse_moment(value):
+    moment = parse_datetime(value) if value else None
+    if moment is not None and timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def import_attendance(records, chunk_size=1000):
+    """Load historical attendance with ``bulk_create`` and rebuild the affected summaries.
+
+    The import runs in one transaction, so a failure leaves no rows behind.
+    """
+    with transaction.atomic():
+        return _import_attendance(records, chunk_size)
+
+
+def _import_attendance(records, chunk_size):
+    result = ImportResult()
+    started = time.monotonic()
+    first_day = last_day = None
+    resolve_shift = shift_resolver()
+
+    for chunk in _chunks(records, chunk_size):
+        usernames = {_text(record, "username") for _, record in chunk}
+        users = {
+            username: (user_id, schedule_id)
+            for username, user_id, schedule_id in User.objects.filter(
+                username__in=usernames
+            ).values_list("username", "id", "work_schedule_id")
+        }
+
+        candidates = []
+        for line_number, record in chunk:
+            if not record:
+                result.rejected.append((line_number, ["Geçersiz satır."]))
+                continue
+            errors = []
+            user_id, schedule_id = users.get(_text(record, "username"), (None, None))
+            if user_id is None:
+                errors.append("Kullanıcı bulunamadı.")
+            try:
+                start_time = _parse_moment(_text(record, "start_time"))
+                end_time = _parse_moment(_text(record, "end_time"))
+                day = parse_date(_text(record, "date")) if _text(record, "date") else None
+            except ValueError:
+                start_time = end_time = day = None
+                errors.append("Geçersiz tarih veya saat.")
+            if not errors and start_time is None:
+                errors.append("start_time gereklidir.")
+            if end_time is not None and start_time is not None and end_time < start_time:
+                errors.append("end_time start_time'dan önce olamaz.")
+            if errors:
+                result.rejected.append((line_number, errors))
+                continue
+
+            shift = resolve_shift(schedule_id)
+            candidates.append(
+                (
+                    line_number,
+                    Attendance(
+                        user_id=user_id,
+                        date=day or shift.local_date(start_time),
+                        start_time=start_time,
+                        end_time=end_time,
+                        late_minutes=shift.late_minutes(start_time),
+                        work_duration=end_time - start_time if end_time else None,
+                    ),
+                )
+            )
+
+        existing = set(
+            Attendance.objects.filter(
+                user_id__in={attendance.user_id for _, attendance in candidates},
+                date__in={attendance.date for _, attendance in candidates},
+            ).values_list("user_id", "date")
+        )
+        attendances = []
+        for line_number, attendance in candidates:
+            key = (attendance.user_id, attendance.date)
+            if key in existing:
+                result.rejected.append((line_number, ["Bu gün için kayıt zaten var."]))
+                continue
+            existing.add(key)
+            attendances.append(attendance)
+            first_day = min(first_day or attendance.date, attendance.date)
+            last_day = max(last_day or attendance.date, attendance.date)
+
+        Attendance.objects.bulk_create(attendances, batch_size=chunk_size)
+        result.created += len(attendances)
+
+    # bulk_create skips signals, so refresh the rollups in one pass
+    if result.created:
+        rebuild_work_summaries(first_day, last_day)
+
+    result.elapsed = time.monotonic() - started
+    return result
@@ -0,0 +1,56 @@
+import smtplib
+import threading
+
+from celery.signals import worker_process_shutdown
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.mail.backends.smtp import EmailBackend
+
+_connection = None
+_connection_lock = threading.Lock()
+
+
+class PooledEmailBackend(EmailBackend):
+    """SMTP backend that keeps its authenticated connection open between sends.
+
+    Django's SMTP backend opens and closes a TLS session for every
+    ``send_mail`` call. This one leaves the session open until
+    ``force_close()`` and reconnects once per message if the server dropped it.
+    """
+
+    def close(self):
+        # send_messages() closes connections it opened; keep ours alive.
+        pass
+
+    def force_close(self):
+        super().close()
+
+    def send_messages(self, email_messages):
+        sent = 0
+        with self._lock:
+            for message in email_messages:
+                try:
+                    sent += super().send_messages([message])
+                except (smtplib.SMTPServerDisconnected, ConnectionError):
+                    # Only this message is retried; earlier ones were delivered
+                    self.force_close()
+                    sent += super().send_messages([message])
+        return sent
+
+
+def get_pooled_connection():
+    """Return the process-wide notification mail connection."""
+    global _connection
+    with _connection_lock:
+        if _connection is None:
+            _connection = get_connection(settings.NOTIFICATION_EMAIL_BACKEND)
+        return _connection
+
+
+@worker_process_shutdown.connect
+def close_pooled_connection(**kwargs):
+    global _connection
+    with _connection_lock:
+        if _connection is not None and hasattr(_connection, "force_close"):
+            _connection.force_close()
+        _connection = None
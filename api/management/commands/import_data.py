@@ -0,0 +1,67 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from api.importers import (
+    IMPORT_CONFLICT_ERROR,
+    IMPORT_FORMATS,
+    import_attendance,
+    import_employees,
+    iter_records,
+)
+
+
+class Command(BaseCommand):
+    help = "Çalışanları veya geçmiş katılım kayıtlarını CSV/NDJSON dosyasından toplu içe aktarır."
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=["employees", "attendance"])
+        parser.add_argument("path", help="İçe aktarılacak dosyanın yolu.")
+        parser.add_argument(
+            "--format",
+            dest="file_format",
+            choices=IMPORT_FORMATS,
+            help="Dosya biçimi; belirtilmezse uzantıdan anlaşılır.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=None,
+            help="Parola özetleme için süreç sayısı (varsayılan: CPU sayısı).",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["file_format"] or (
+            "ndjson" if path.endswith((".ndjson", ".jsonl")) else "csv"
+        )
+
+        try:
+            stream = open(path, encoding="utf-8-sig", newline="")
+        except OSError as e:
+            raise CommandError(f"Dosya açılamadı: {e}")
+
+        with stream:
+            records = iter_records(stream, file_format)
+            try:
+                if options["kind"] == "employees":
+                    result = import_employees(
+                        records,
+                        chunk_size=options["chunk_size"],
+                        workers=options["workers"],
+                    )
+                else:
+                    result = import_attendance(
+                        records, chunk_size=options["chunk_size"]
+                    )
+            except IntegrityError:
+                raise CommandError(IMPORT_CONFLICT_ERROR)
+
+        for line, errors in sorted(result.rejected):
+            self.stderr.write(f"Satır {line}: {' '.join(errors)}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result.created} kayıt oluşturuldu, {len(result.rejected)} satır reddedildi "
+                f"({result.elapsed:.2f} sn, {result.rows_per_second} satır/sn)."
+            )
+        )
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from api.summaries import rebuild_work_summaries
+
+
+class Command(BaseCommand):
+    help = "Günlük ve aylık çalışma özetlerini ham katılım kayıtlarından yeniden oluşturur."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--from",
+            dest="date_from",
+            help="Başlangıç tarihi (YYYY-MM-DD); ayın başına yuvarlanır.",
+        )
+        parser.add_argument(
+            "--to",
+            dest="date_to",
+            help="Bitiş tarihi (YYYY-MM-DD); ayın sonuna yuvarlanır.",
+        )
+
+    def handle(self, *args, **options):
+        start_date = self._parse(options["date_from"])
+        end_date = self._parse(options["date_to"])
+        if start_date and end_date and start_date > end_date:
+            raise CommandError("Başlangıç tarihi bitiş tarihinden sonra olamaz.")
+
+        written = rebuild_work_summaries(start_date, end_date)
+        self.stdout.write(
+            self.style.SUCCESS(f"{written} günlük özet yeniden oluşturuldu.")
+        )
+
+    def _parse(self, value):
+        if not value:
+            return None
+        try:
+            parsed = parse_date(value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise CommandError(f"Geçersiz tarih: {value}")
+        return parsed
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from api.schedules import recompute_late_minutes
+
+
+class Command(BaseCommand):
+    help = (
+        "Katılım kayıtlarındaki geç kalma dakikalarını çalışanların güncel "
+        "çalışma programına göre yeniden hesaplar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--schedule", type=int, help="Yalnızca bu programa bağlı çalışanlar."
+        )
+        parser.add_argument("--user", type=int, help="Yalnızca bu kullanıcı.")
+        parser.add_argument(
+            "--from", dest="date_from", help="Başlangıç tarihi (YYYY-MM-DD)."
+        )
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        start_date = None
+        if options["date_from"]:
+            try:
+                start_date = parse_date(options["date_from"])
+            except ValueError:
+                start_date = None
+            if start_date is None:
+                raise CommandError(f"Geçersiz tarih: {options['date_from']}")
+
+        changed = recompute_late_minutes(
+            schedule_id=options["schedule"],
+            user_id=options["user"],
+            start_date=start_date,
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"{changed} kayıt güncellendi."))
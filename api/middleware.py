@@ -1,16 +1,92 @@
+import time
 from urllib.parse import parse_qs
 from channels.db import database_sync_to_async
+from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache, caches
 from rest_framework.authtoken.models import Token
 from channels.middleware import BaseMiddleware
 
+from .cache import TTLCache
+
+TOKEN_CACHE_KEY_PREFIX = 'ws-token-user:'
+# Bumped on every revocation; entries cached under an older version are ignored,
+# so a token deleted in one worker stops working in all of them at once
+TOKEN_CACHE_VERSION_KEY = 'ws-token-cache-version'
+
+token_user_cache = TTLCache(
+    max_size=settings.WS_TOKEN_CACHE_SIZE, ttl=settings.WS_TOKEN_CACHE_TTL
+)
+
+
+def _shared_cache():
+    if settings.WS_TOKEN_SHARED_CACHE:
+        return caches[settings.WS_TOKEN_SHARED_CACHE]
+    return None
+
+
+async def token_cache_version():
+    return await cache.aget_or_set(TOKEN_CACHE_VERSION_KEY, time.time_ns, None)
+
+
+def _bump_token_cache_version():
+    try:
+        cache.incr(TOKEN_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(TOKEN_CACHE_VERSION_KEY, time.time_ns(), None)
+
+
+def invalidate_token(token_key):
+    token_user_cache.delete(token_key)
+    _bump_token_cache_version()
+    shared = _shared_cache()
+    if shared is not None:
+        shared.delete(TOKEN_CACHE_KEY_PREFIX + token_key)
+
+
+def invalidate_user_tokens(user):
+    token_user_cache.delete_where(lambda cached: cached[1].pk == user.pk)
+    _bump_token_cache_version()
+    shared = _shared_cache()
+    if shared is not None:
+        keys = Token.objects.filter(user=user).values_list('key', flat=True)
+        shared.delete_many([TOKEN_CACHE_KEY_PREFIX + key for key in keys])
+
+
 @database_sync_to_async
-def get_user(token_key):
+def _fetch_user(token_key):
+    shared = _shared_cache()
+    if shared is not None:
+        user = shared.get(TOKEN_CACHE_KEY_PREFIX + token_key)
+        if user is not None:
+            return user
+
     try:
-        token = Token.objects.get(key=token_key)
-        return token.user
+        token = Token.objects.select_related('user').get(key=token_key)
     except Token.DoesNotExist:
+        return None
+
+    user = token.user
+    if not user.is_active:
+        return None
+    if shared is not None:
+        shared.set(
+            TOKEN_CACHE_KEY_PREFIX + token_key, user, settings.WS_TOKEN_CACHE_TTL
+        )
+    return user
+
+
+async def get_user(token_key):
+    version = await token_cache_version()
+    cached = token_user_cache.get(token_key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    user = await _fetch_user(token_key)
+    if user is None:
         return AnonymousUser()
+    token_user_cache.set(token_key, (version, user))
+    return user
 
 class TokenAuthMiddleware(BaseMiddleware):
     async def __call__(self, scope, receive, send):
@@ -27,4 +103,4 @@ class TokenAuthMiddleware(BaseMiddleware):
         return await super().__call__(scope, receive, send)
 
 def TokenAuthMiddlewareStack(inner):
-    return TokenAuthMiddleware(inner)
\ No newline at end of file
+    return TokenAuthMiddleware(inner)
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.3 on 2026-10-18 07:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['start_time', 'user'], name='attendance_start_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(condition=models.Q(('end_time__isnull', False)), fields=['start_time', 'user'], name='attendance_closed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(condition=models.Q(('end_time__isnull', True)), fields=['user', 'date'], name='attendance_open_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='leaverequest',
+            index=models.Index(condition=models.Q(('status', 'PENDING')), fields=['start_date', 'id'], name='leave_pending_idx'),
+        ),
+    ]
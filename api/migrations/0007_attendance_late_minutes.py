@@ -0,0 +1,44 @@
+# Generated by Django 5.1.3 on 2026-10-18 08:06
+
+from django.db import migrations, models
+from django.utils import timezone
+
+BATCH_SIZE = 2000
+
+
+def backfill_late_minutes(apps, schema_editor):
+    # Lateness is measured against 08:00 on the local day of each check-in
+    Attendance = apps.get_model('api', 'Attendance')
+    batch = []
+    for attendance in Attendance.objects.only('id', 'start_time').iterator(chunk_size=BATCH_SIZE):
+        local_start = timezone.localtime(attendance.start_time)
+        work_start = local_start.replace(hour=8, minute=0, second=0, microsecond=0)
+        late_minutes = max(0, int((local_start - work_start).total_seconds() // 60))
+        if late_minutes:
+            attendance.late_minutes = late_minutes
+            batch.append(attendance)
+        if len(batch) >= BATCH_SIZE:
+            Attendance.objects.bulk_update(batch, ['late_minutes'])
+            batch = []
+    if batch:
+        Attendance.objects.bulk_update(batch, ['late_minutes'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attendance',
+            name='late_minutes',
+            field=models.PositiveIntegerField(default=0, verbose_name='Geç kalma (dakika)'),
+        ),
+        migrations.RunPython(backfill_late_minutes, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(condition=models.Q(('late_minutes__gt', 0)), fields=['date', 'user'], name='attendance_late_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.3 on 2026-10-18 08:07
+
+from django.db import migrations, models
+from django.db.models import DurationField, ExpressionWrapper, F
+
+
+def backfill_work_duration(apps, schema_editor):
+    Attendance = apps.get_model('api', 'Attendance')
+    Attendance.objects.filter(end_time__isnull=False).update(
+        work_duration=ExpressionWrapper(
+            F('end_time') - F('start_time'), output_field=DurationField()
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_attendance_late_minutes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attendance',
+            name='work_duration',
+            field=models.DurationField(blank=True, null=True, verbose_name='Çalışma süresi'),
+        ),
+        migrations.RunPython(backfill_work_duration, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.1.3 on 2026-10-18 09:40
+
+from django.db import migrations
+
+PERIOD = "daterange(start_date, end_date, '[]')"
+
+
+def add_overlap_constraint(apps, schema_editor):
+    # Range types and exclusion constraints only exist on PostgreSQL; other
+    # backends rely on the overlap validation in LeaveRequestSerializer.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    table = schema_editor.quote_name(apps.get_model('api', 'LeaveRequest')._meta.db_table)
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+    # Team availability lookups ("who is on leave between A and B")
+    schema_editor.execute(
+        f"CREATE INDEX leave_period_gist_idx ON {table} USING gist ({PERIOD}) "
+        f"WHERE status <> 'REJECTED'"
+    )
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT a.id, b.id FROM {table} a JOIN {table} b "
+            f"ON a.user_id = b.user_id AND a.id < b.id "
+            f"AND daterange(a.start_date, a.end_date, '[]') "
+            f"&& daterange(b.start_date, b.end_date, '[]') "
+            f"WHERE a.status <> 'REJECTED' AND b.status <> 'REJECTED' "
+            f"ORDER BY a.id, b.id LIMIT 20"
+        )
+        overlaps = cursor.fetchall()
+    if overlaps:
+        # The schema must not depend on the data: fail until the rows are fixed
+        pairs = ', '.join(f'{a}/{b}' for a, b in overlaps)
+        raise RuntimeError(
+            f'Çakışan izin talepleri bulundu (ilk {len(overlaps)} çift: {pairs}); '
+            f'leave_no_overlap kısıtı eklenemez. Talepleri reddedip veya tarihlerini '
+            f'düzelttikten sonra "migrate api" komutunu yeniden çalıştırın.'
+        )
+
+    schema_editor.execute(
+        f"ALTER TABLE {table} ADD CONSTRAINT leave_no_overlap "
+        f"EXCLUDE USING gist (user_id WITH =, {PERIOD} WITH &&) "
+        f"WHERE (status <> 'REJECTED')"
+    )
+
+
+def remove_overlap_constraint(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    table = schema_editor.quote_name(apps.get_model('api', 'LeaveRequest')._meta.db_table)
+    schema_editor.execute(f'ALTER TABLE {table} DROP CONSTRAINT IF EXISTS leave_no_overlap')
+    schema_editor.execute('DROP INDEX IF EXISTS leave_period_gist_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_overlap_constraint, remove_overlap_constraint),
+    ]
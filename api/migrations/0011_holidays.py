@@ -0,0 +1,22 @@
+# Generated by Django 5.1.3 on 2026-10-18 08:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_leave_period_overlap'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Holiday',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True)),
+                ('name', models.CharField(max_length=100)),
+                ('kind', models.CharField(choices=[('PUBLIC', 'Resmi tatil'), ('CLOSURE', 'Şirket tatili')], default='PUBLIC', max_length=10)),
+            ],
+        ),
+    ]
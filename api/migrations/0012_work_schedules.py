@@ -0,0 +1,30 @@
+# Generated by Django 5.1.3 on 2026-10-18 08:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_holidays'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkSchedule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='Ad')),
+                ('timezone', models.CharField(default='Europe/Istanbul', max_length=63, verbose_name='Saat dilimi')),
+                ('start_time', models.TimeField(verbose_name='Başlangıç saati')),
+                ('end_time', models.TimeField(verbose_name='Bitiş saati')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='work_schedule',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='users', to='api.workschedule', verbose_name='Çalışma programı'),
+        ),
+    ]
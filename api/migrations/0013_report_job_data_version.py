@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-18 08:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_work_schedules'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reportjob',
+            name='data_version',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.3 on 2026-10-18 08:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_report_job_data_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('EMPLOYEES', 'Çalışanlar'), ('ATTENDANCES', 'Katılım kayıtları')], max_length=12)),
+                ('file_format', models.CharField(default='csv', max_length=10)),
+                ('file', models.FileField(blank=True, null=True, upload_to='imports/')),
+                ('status', models.CharField(choices=[('PENDING', 'Beklemede'), ('RUNNING', 'Hazırlanıyor'), ('DONE', 'Tamamlandı'), ('FAILED', 'Başarısız')], default='PENDING', max_length=10)),
+                ('result', models.JSONField(blank=True, null=True)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('requested_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='import_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
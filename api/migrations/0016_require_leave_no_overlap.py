@@ -0,0 +1,52 @@
+# Generated by Django 5.1.3 on 2026-10-18 10:20
+
+from django.db import migrations
+
+PERIOD = "daterange(start_date, end_date, '[]')"
+
+
+def require_overlap_constraint(apps, schema_editor):
+    # Before this migration 0010 skipped the constraint when leaves already
+    # overlapped; add it now on databases that were migrated that way.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    table = schema_editor.quote_name(apps.get_model('api', 'LeaveRequest')._meta.db_table)
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_constraint WHERE conname = 'leave_no_overlap'")
+        if cursor.fetchone():
+            return
+        cursor.execute(
+            f"SELECT a.id, b.id FROM {table} a JOIN {table} b "
+            f"ON a.user_id = b.user_id AND a.id < b.id "
+            f"AND daterange(a.start_date, a.end_date, '[]') "
+            f"&& daterange(b.start_date, b.end_date, '[]') "
+            f"WHERE a.status <> 'REJECTED' AND b.status <> 'REJECTED' "
+            f"ORDER BY a.id, b.id LIMIT 20"
+        )
+        overlaps = cursor.fetchall()
+    if overlaps:
+        pairs = ', '.join(f'{a}/{b}' for a, b in overlaps)
+        raise RuntimeError(
+            f'Çakışan izin talepleri bulundu (ilk {len(overlaps)} çift: {pairs}); '
+            f'leave_no_overlap kısıtı eklenemez. Talepleri reddedip veya tarihlerini '
+            f'düzelttikten sonra "migrate api" komutunu yeniden çalıştırın.'
+        )
+
+    schema_editor.execute(
+        f"ALTER TABLE {table} ADD CONSTRAINT leave_no_overlap "
+        f"EXCLUDE USING gist (user_id WITH =, {PERIOD} WITH &&) "
+        f"WHERE (status <> 'REJECTED')"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_keyset_ordering_indexes'),
+    ]
+
+    operations = [
+        # Reversing leaves the constraint to 0010's reverse
+        migrations.RunPython(require_overlap_constraint, migrations.RunPython.noop),
+    ]
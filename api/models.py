@@ -1,27 +1,229 @@
+from zoneinfo import available_timezones
+
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.core.exceptions import ValidationError
+from django.db import connections, models, transaction
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .constants import LOW_LEAVE_THRESHOLD
+from .schedules import shift_for
+
+
+class TrackedFieldsMixin:
+    """Keeps a snapshot of ``tracked_fields`` as loaded from the database.
+
+    Lets signal handlers compare old and new values without re-reading the row.
+    """
+
+    tracked_fields = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_tracked_fields()
+        return instance
+
+    def _snapshot_tracked_fields(self):
+        self._loaded_values = {
+            field: self.__dict__[field]
+            for field in self.tracked_fields
+            if field in self.__dict__
+        }
+
+    def is_tracked(self, field):
+        return field in getattr(self, '_loaded_values', {})
+
+    def get_loaded_value(self, field, default=None):
+        return getattr(self, '_loaded_values', {}).get(field, default)
+
+    def has_changed(self, field):
+        if not self.is_tracked(field):
+            return True
+        return getattr(self, field) != self._loaded_values[field]
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._snapshot_tracked_fields()
+
+
+class WorkSchedule(models.Model):
+    """A shift shared by a team; users without one follow company hours."""
+
+    name = models.CharField(max_length=100, unique=True, verbose_name='Ad')
+    timezone = models.CharField(max_length=63, default=settings.TIME_ZONE, verbose_name='Saat dilimi')
+    start_time = models.TimeField(verbose_name='Başlangıç saati')
+    end_time = models.TimeField(verbose_name='Bitiş saati')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def clean(self):
+        if self.timezone not in available_timezones():
+            raise ValidationError({'timezone': 'Geçersiz saat dilimi.'})
+        if self.start_time and self.end_time and self.end_time <= self.start_time:
+            raise ValidationError({'end_time': 'Bitiş saati başlangıç saatinden sonra olmalı.'})
+
+    def __str__(self):
+        return f'{self.name} ({self.start_time:%H:%M}-{self.end_time:%H:%M})'
+
+
+class User(TrackedFieldsMixin, AbstractUser):
+    tracked_fields = ('annual_leave_days',)
 
-class User(AbstractUser):
     is_employee = models.BooleanField(default=False, verbose_name='Çalışan mı?')
     annual_leave_days = models.FloatField(default=15.0, verbose_name='Yıllık izin günleri')
     resume = models.FileField(upload_to='resumes/', null=True, blank=True, verbose_name='Özgeçmiş')
     low_leave_notified = models.BooleanField(default=False, verbose_name='Düşük izin bildirimi gönderildi')
+    work_schedule = models.ForeignKey(
+        WorkSchedule,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='users',
+        verbose_name='Çalışma programı',
+    )
+
+    def deduct_leave_days(self, days):
+        """Subtract ``days`` from this user's balance; see ``bulk_deduct_leave_days``.
 
+        The in-memory values are dropped so they are reloaded on next access.
+        """
+        User.bulk_deduct_leave_days({self.pk: days})
+
+        for field in ('annual_leave_days', 'low_leave_notified'):
+            self.__dict__.pop(field, None)
+        getattr(self, '_loaded_values', {}).pop('annual_leave_days', None)
+
+    @staticmethod
+    def bulk_deduct_leave_days(days_by_user):
+        """Subtract per-user day counts in a single UPDATE, never below zero.
+
+        Concurrent deductions cannot overwrite each other, and only the balance
+        and notification flag columns are written. Users pushed below
+        ``LOW_LEAVE_THRESHOLD`` are flagged and their admin notification is
+        queued on commit.
+        """
+        from .tasks import send_low_leave_notification_task
+
+        if not days_by_user:
+            return
+
+        if len(days_by_user) == 1:
+            (days,) = days_by_user.values()
+            deduction = Value(float(days))
+        else:
+            deduction = Case(
+                *[When(pk=pk, then=Value(float(days))) for pk, days in days_by_user.items()],
+                default=Value(0.0),
+                output_field=models.FloatField(),
+            )
+
+        with transaction.atomic(savepoint=False):
+            User.objects.filter(pk__in=days_by_user).update(
+                annual_leave_days=Greatest(F('annual_leave_days') - deduction, Value(0.0))
+            )
+            # The UPDATE above holds the row locks, so this read is stable
+            crossed = list(
+                User.objects.filter(
+                    pk__in=days_by_user,
+                    annual_leave_days__lt=LOW_LEAVE_THRESHOLD,
+                    low_leave_notified=False,
+                ).values_list('pk', flat=True)
+            )
+            if crossed:
+                User.objects.filter(pk__in=crossed).update(low_leave_notified=True)
+
+        for pk in crossed:
+            transaction.on_commit(
+                lambda pk=pk: send_low_leave_notification_task.delay(pk)
+            )
+
+class Attendance(TrackedFieldsMixin, models.Model):
+    tracked_fields = ('start_time',)
 
-class Attendance(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='attendances')
-    date = models.DateField(auto_now_add=True)
+    date = models.DateField(default=timezone.localdate)
     start_time = models.DateTimeField()
     end_time = models.DateTimeField(null=True, blank=True)
+    late_minutes = models.PositiveIntegerField(default=0, verbose_name='Geç kalma (dakika)')
+    work_duration = models.DurationField(null=True, blank=True, verbose_name='Çalışma süresi')
+    updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         unique_together = ['user', 'date']
+        indexes = [
+            # Late arrivals and date-range scans over start_time
+            models.Index(fields=['start_time', 'user'], name='attendance_start_user_idx'),
+            # Date-range filters without a user; id keeps ?ordering=date pages keyset
+            models.Index(fields=['date', 'id'], name='attendance_date_idx'),
+            # Work reports only aggregate closed sessions
+            models.Index(
+                fields=['start_time', 'user'],
+                condition=models.Q(end_time__isnull=False),
+                name='attendance_closed_idx',
+            ),
+            # Late arrival lists and lateness stats over any date range
+            models.Index(
+                fields=['date', 'user'],
+                condition=models.Q(late_minutes__gt=0),
+                name='attendance_late_idx',
+            ),
+            # Check-out looks up today's open session of a user
+            models.Index(
+                fields=['user', 'date'],
+                condition=models.Q(end_time__isnull=True),
+                name='attendance_open_idx',
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Derived columns are stored so list endpoints and reports never recompute them
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or {'start_time', 'end_time'} & set(update_fields):
+            if self.has_changed('start_time'):
+                self.late_minutes = shift_for(self.user).late_minutes(self.start_time)
+            self.work_duration = self.end_time - self.start_time if self.end_time else None
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {
+                    'late_minutes', 'work_duration', 'updated_at'
+                }
+        super().save(*args, **kwargs)
     
     def __str__(self):
         return f'{self.user} - {self.date}'
 
 
+class LeaveRequestQuerySet(models.QuerySet):
+
+    def active(self):
+        """Leaves that still block the calendar (pending or approved)."""
+        return self.exclude(status='REJECTED')
+
+    def overlapping(self, start_date, end_date):
+        """Leaves sharing at least one day with the inclusive range.
+
+        On PostgreSQL the filter is written as ``daterange(...) && daterange(...)``
+        so it can use the GiST index added in migration 0010; elsewhere it falls
+        back to plain bound comparisons.
+        """
+        if connections[self.db].vendor != 'postgresql':
+            return self.filter(start_date__lte=end_date, end_date__gte=start_date)
+
+        from django.contrib.postgres.fields import DateRangeField
+        from django.db.backends.postgresql.psycopg_any import DateRange
+
+        return self.annotate(
+            period=models.Func(
+                F('start_date'),
+                F('end_date'),
+                Value('[]'),
+                function='daterange',
+                output_field=DateRangeField(),
+            )
+        ).filter(period__overlap=DateRange(start_date, end_date, '[]'))
+
+
 class LeaveRequest(models.Model):
     
     STATUS_CHOICES = (
@@ -35,9 +237,134 @@ class LeaveRequest(models.Model):
     end_date = models.DateField()
     reason = models.TextField()
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='PENDING')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = LeaveRequestQuerySet.as_manager()
     
     class Meta:
         unique_together = ['user', 'start_date', 'end_date']
+        indexes = [
+            # Status filters and overlap ranges on the leave list
+            models.Index(fields=['status', 'start_date'], name='leave_status_start_idx'),
+            # Keyset pages for ?ordering=start_date / end_date
+            models.Index(fields=['start_date', 'id'], name='leave_start_id_idx'),
+            models.Index(fields=['end_date', 'id'], name='leave_end_id_idx'),
+            # Admin approval queue
+            models.Index(
+                fields=['start_date', 'id'],
+                condition=models.Q(status='PENDING'),
+                name='leave_pending_idx',
+            ),
+        ]
     
     def __str__(self):
         return f'{self.user} - {self.start_date} to {self.end_date}'
+
+
+class DailyWorkSummary(models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='daily_work_summaries')
+    date = models.DateField()
+    total_seconds = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ['user', 'date']
+        indexes = [
+            models.Index(fields=['date', 'user'], name='daily_summary_date_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.user} - {self.date}'
+
+
+class MonthlyWorkSummary(models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='monthly_work_summaries')
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+    total_seconds = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ['user', 'year', 'month']
+        indexes = [
+            models.Index(fields=['year', 'month'], name='monthly_summary_period_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.user} - {self.month}/{self.year}'
+
+
+class ReportJob(models.Model):
+
+    KIND_CHOICES = (
+        ('MONTHLY', 'Aylık'),
+        ('YEARLY', 'Yıllık'),
+        ('RANGE', 'Tarih aralığı'),
+    )
+
+    STATUS_CHOICES = (
+        ('PENDING', 'Beklemede'),
+        ('RUNNING', 'Hazırlanıyor'),
+        ('DONE', 'Tamamlandı'),
+        ('FAILED', 'Başarısız'),
+    )
+
+    requested_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='report_jobs')
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    start_date = models.DateField()
+    end_date = models.DateField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='PENDING')
+    progress = models.PositiveSmallIntegerField(default=0)
+    file = models.FileField(upload_to='reports/', null=True, blank=True)
+    error = models.TextField(blank=True)
+    # report_cache_version() when the job was requested; a DONE job is only
+    # reused while closed-period data is still at this version
+    data_version = models.BigIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Identical requests are served from an existing job
+            models.Index(fields=['kind', 'start_date', 'end_date', 'status'], name='report_job_lookup_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.get_kind_display()} {self.start_date} - {self.end_date}'
+
+
+class ImportJob(models.Model):
+
+    KIND_CHOICES = (
+        ('EMPLOYEES', 'Çalışanlar'),
+        ('ATTENDANCES', 'Katılım kayıtları'),
+    )
+
+    STATUS_CHOICES = ReportJob.STATUS_CHOICES
+
+    requested_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='import_jobs')
+    kind = models.CharField(max_length=12, choices=KIND_CHOICES)
+    file_format = models.CharField(max_length=10, default='csv')
+    file = models.FileField(upload_to='imports/', null=True, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='PENDING')
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f'{self.get_kind_display()} içe aktarma #{self.pk}'
+
+
+class Holiday(models.Model):
+    """A non-working weekday: public holiday or company closure."""
+
+    KIND_CHOICES = (
+        ('PUBLIC', 'Resmi tatil'),
+        ('CLOSURE', 'Şirket tatili'),
+    )
+
+    date = models.DateField(unique=True)
+    name = models.CharField(max_length=100)
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES, default='PUBLIC')
+
+    def __str__(self):
+        return f'{self.name} ({self.date})'
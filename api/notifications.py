@@ -0,0 +1,74 @@
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+from django.db import transaction
+
+from .tasks import send_bulk_notifications_task
+
+
+class NotificationDispatcher:
+    """Bounded in-process queue between request handlers and the Celery broker.
+
+    Handlers only append to the queue; a daemon thread publishes to the broker,
+    so a slow or unreachable broker never holds up a request. While the broker
+    is down the thread retries every ``retry_interval`` seconds; when the queue
+    is full the oldest notifications are dropped.
+    """
+
+    def __init__(self, max_size, retry_interval):
+        self.retry_interval = retry_interval
+        self._pending = deque(maxlen=max_size)
+        self._ready = threading.Condition()
+        self._thread = None
+
+    def submit(self, notifications):
+        with self._ready:
+            self._pending.extend(notifications)
+            # Also restarts the thread in a process forked after it started
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._ready.notify()
+
+    def _run(self):
+        while True:
+            with self._ready:
+                while not self._pending:
+                    self._ready.wait()
+                batch = list(self._pending)
+                self._pending.clear()
+            try:
+                send_bulk_notifications_task.delay(batch)
+            except Exception as e:
+                print(f"Notification enqueue failed, retrying: {e}")
+                with self._ready:
+                    self._pending.extendleft(reversed(batch))
+                time.sleep(self.retry_interval)
+
+
+dispatcher = NotificationDispatcher(
+    max_size=settings.NOTIFICATION_QUEUE_SIZE,
+    retry_interval=settings.NOTIFICATION_RETRY_INTERVAL,
+)
+
+
+def _dispatch(notifications):
+    dispatcher.submit(notifications)
+
+
+def enqueue_notifications(notifications):
+    """Queue ``{user_id, message, notif_type}`` notifications once the transaction commits.
+
+    Request handlers never wait on the broker or the channel layer; the
+    dispatcher thread publishes and delivery happens in a Celery worker.
+    """
+    if notifications:
+        transaction.on_commit(lambda: _dispatch(notifications))
+
+
+def enqueue_notification(user_id, message, notif_type='info'):
+    enqueue_notifications(
+        [{'user_id': user_id, 'message': message, 'notif_type': notif_type}]
+    )
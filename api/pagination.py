@@ -0,0 +1,120 @@
+import json
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+
+
+def _reverse(ordering):
+    return tuple(field[1:] if field.startswith("-") else f"-{field}" for field in ordering)
+
+
+class DefaultCursorPagination(CursorPagination):
+    """Keyset pagination over the whole ordering.
+
+    DRF positions its cursor on the first ordering field only and skips runs of
+    equal values with an offset, so ``?ordering=date`` pages cost O(rows on that
+    date). Here the ordering always ends in ``id``, the cursor stores every
+    field of it, and the next page is a lexicographic comparison that a
+    composite index answers as a range scan.
+    """
+
+    page_size_query_param = "page_size"
+    max_page_size = settings.API_MAX_PAGE_SIZE
+    ordering = ("-id",)
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not {"id", "-id", "pk", "-pk"} & set(ordering):
+            ordering += ("-id" if ordering[-1].startswith("-") else "id",)
+        return ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        reverse = bool(self.cursor and self.cursor.reverse)
+        position = self.cursor.position if self.cursor else None
+
+        ordering = _reverse(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self._after(ordering, self._decode_position(position)))
+
+        results = list(queryset[: self.page_size + 1])
+        self.page = results[: self.page_size]
+        following_position = (
+            self._get_position_from_instance(results[-1], self.ordering)
+            if len(results) > len(self.page)
+            else None
+        )
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = position is not None
+            self.has_previous = following_position is not None
+            self.next_position = position
+            self.previous_position = following_position
+        else:
+            self.has_next = following_position is not None
+            self.has_previous = position is not None
+            self.next_position = following_position
+            self.previous_position = position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def _after(self, ordering, values):
+        """Rows strictly after ``values`` in ``ordering``.
+
+        ``(a > x) OR (a = x AND (b > y OR ...))``, plus a redundant bound on the
+        first field so the index scan starts at the cursor.
+        """
+        condition = None
+        for field, value in reversed(list(zip(ordering, values))):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            step = Q(**{f"{name}__{lookup}": value})
+            if condition is not None:
+                step |= Q(**{name: value}) & condition
+            condition = step
+        first = ordering[0]
+        bound = "lte" if first.startswith("-") else "gte"
+        return Q(**{f"{first.lstrip('-')}__{bound}": values[0]}) & condition
+
+    def _decode_position(self, position):
+        try:
+            values = json.loads(position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = [
+            instance[field.lstrip("-")]
+            if isinstance(instance, dict)
+            else getattr(instance, field.lstrip("-"))
+            for field in ordering
+        ]
+        return json.dumps([str(value) for value in values])
+
+
+class AttendanceCursorPagination(DefaultCursorPagination):
+    ordering = ("-start_time", "-id")
+
+
+class EmployeeCursorPagination(DefaultCursorPagination):
+    ordering = ("id",)
+
+
+class PendingLeaveCursorPagination(DefaultCursorPagination):
+    ordering = ("start_date", "id")
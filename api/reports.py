@@ -0,0 +1,65 @@
+import csv
+import io
+import tempfile
+
+from django.core.files import File
+from django.db.models import Sum
+
+from .models import DailyWorkSummary, MonthlyWorkSummary
+from .utils import month_date_range
+from .workdays import get_calendar
+
+PROGRESS_STEP = 500
+
+
+def _report_rows(job):
+    if job.kind == "YEARLY":
+        queryset = (
+            MonthlyWorkSummary.objects.filter(
+                year__gte=job.start_date.year,
+                year__lte=job.end_date.year,
+                total_seconds__gt=0,
+            )
+            .order_by("user_id", "year", "month")
+            .values_list("user_id", "user__username", "year", "month", "total_seconds")
+        )
+        header = ["user_id", "username", "year", "month", "total_work_hours", "working_days"]
+    else:
+        queryset = (
+            DailyWorkSummary.objects.filter(date__range=(job.start_date, job.end_date))
+            .values("user_id", "user__username")
+            .annotate(total=Sum("total_seconds"))
+            .filter(total__gt=0)
+            .order_by("user_id")
+            .values_list("user_id", "user__username", "total")
+        )
+        header = ["user_id", "username", "total_work_hours", "working_days"]
+    return header, queryset
+
+
+def write_report(job, on_progress=None):
+    """Render the job's report to CSV and attach it to ``job.file``."""
+    header, queryset = _report_rows(job)
+    total = queryset.count() or 1
+    calendar = get_calendar()
+    range_working_days = calendar.working_days_between(job.start_date, job.end_date)
+
+    def working_days(row):
+        if job.kind == "YEARLY":
+            return calendar.working_days_between(*month_date_range(row[2], row[3]))
+        return range_working_days
+
+    with tempfile.TemporaryFile() as raw:
+        text = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+        writer = csv.writer(text)
+        writer.writerow(header)
+        for index, row in enumerate(queryset.iterator(chunk_size=PROGRESS_STEP), 1):
+            writer.writerow(row[:-1] + (round(row[-1] / 3600, 2), working_days(row)))
+            if on_progress and index % PROGRESS_STEP == 0:
+                on_progress(min(99, index * 100 // total))
+        text.flush()
+        text.detach()
+
+        raw.seek(0)
+        filename = f"{job.kind.lower()}-{job.start_date}-{job.end_date}.csv"
+        job.file.save(filename, File(raw), save=False)
@@ -0,0 +1,158 @@
+"""Work schedules resolved from a process-local cache.
+
+Users without a schedule follow the company hours in ``constants``. All
+schedules are loaded in one query per process and reloaded only when the
+version in the shared cache moves, so resolving a user's shift from
+``user.work_schedule_id`` needs no database query.
+"""
+
+import threading
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .constants import WORK_END_TIME, WORK_START_TIME
+
+SCHEDULE_VERSION_KEY = "schedules:version"
+
+
+class Shift:
+    __slots__ = ("schedule_id", "start_time", "end_time", "tzinfo")
+
+    def __init__(self, start_time, end_time, tz_name, schedule_id=None):
+        self.schedule_id = schedule_id
+        self.start_time = start_time
+        self.end_time = end_time
+        self.tzinfo = ZoneInfo(tz_name)
+
+    @property
+    def minutes_per_day(self):
+        start = self.start_time.hour * 60 + self.start_time.minute
+        end = self.end_time.hour * 60 + self.end_time.minute
+        return end - start
+
+    def local_date(self, moment):
+        """Calendar day ``moment`` falls on in the schedule's timezone."""
+        return moment.astimezone(self.tzinfo).date()
+
+    def bounds(self, day):
+        """Aware start and end of the shift on ``day``."""
+        return (
+            datetime.combine(day, self.start_time, tzinfo=self.tzinfo),
+            datetime.combine(day, self.end_time, tzinfo=self.tzinfo),
+        )
+
+    def late_minutes(self, moment):
+        """Whole minutes ``moment`` is past the shift start of its local day."""
+        shift_start, _ = self.bounds(self.local_date(moment))
+        return max(0, int((moment - shift_start).total_seconds() // 60))
+
+
+DEFAULT_SHIFT = Shift(WORK_START_TIME, WORK_END_TIME, settings.TIME_ZONE)
+
+_shifts = {}
+_shifts_version = None
+_lock = threading.Lock()
+
+
+def schedule_version():
+    return cache.get_or_set(SCHEDULE_VERSION_KEY, time.time_ns, None)
+
+
+def invalidate_schedules():
+    """Make every process reload its schedules on next use."""
+    try:
+        cache.incr(SCHEDULE_VERSION_KEY)
+    except ValueError:
+        cache.set(SCHEDULE_VERSION_KEY, time.time_ns(), None)
+
+
+def _current_shifts():
+    """Schedule id to Shift map, reloaded when the shared version moved."""
+    global _shifts, _shifts_version
+
+    version = schedule_version()
+    if _shifts_version != version:
+        from .models import WorkSchedule
+
+        with _lock:
+            _shifts = {
+                schedule.id: Shift(
+                    schedule.start_time,
+                    schedule.end_time,
+                    schedule.timezone,
+                    schedule_id=schedule.id,
+                )
+                for schedule in WorkSchedule.objects.all()
+            }
+            _shifts_version = version
+    return _shifts
+
+
+def get_shift(schedule_id):
+    """Shift for a ``WorkSchedule`` id; ``None`` means company hours."""
+    if schedule_id is None:
+        return DEFAULT_SHIFT
+    return _current_shifts().get(schedule_id, DEFAULT_SHIFT)
+
+
+def shift_resolver():
+    """``get_shift`` for batches: the version is checked once, not per row."""
+    shifts = _current_shifts()
+
+    def resolve(schedule_id):
+        if schedule_id is None:
+            return DEFAULT_SHIFT
+        return shifts.get(schedule_id, DEFAULT_SHIFT)
+
+    return resolve
+
+
+def shift_for(user):
+    return get_shift(user.work_schedule_id)
+
+
+def recompute_late_minutes(schedule_id=None, user_id=None, start_date=None, batch_size=2000):
+    """Rewrite stored ``late_minutes`` after a schedule change.
+
+    Only lateness is recomputed; leave days already deducted for past late
+    arrivals are left untouched. Returns the number of rows changed.
+    """
+    from .models import Attendance
+
+    attendances = Attendance.objects.all()
+    if schedule_id is not None:
+        attendances = attendances.filter(user__work_schedule_id=schedule_id)
+    if user_id is not None:
+        attendances = attendances.filter(user_id=user_id)
+    if start_date is not None:
+        attendances = attendances.filter(date__gte=start_date)
+
+    rows = (
+        attendances.order_by("id")
+        .values_list("id", "user__work_schedule_id", "start_time", "late_minutes")
+        .iterator(chunk_size=batch_size)
+    )
+
+    changed = 0
+    batch = []
+    now = timezone.now()
+    resolve_shift = shift_resolver()
+    for attendance_id, user_schedule_id, start_time, late_minutes in rows:
+        new_late_minutes = resolve_shift(user_schedule_id).late_minutes(start_time)
+        if new_late_minutes != late_minutes:
+            batch.append(
+                Attendance(id=attendance_id, late_minutes=new_late_minutes, updated_at=now)
+            )
+        if len(batch) >= batch_size:
+            Attendance.objects.bulk_update(batch, ["late_minutes", "updated_at"])
+            changed += len(batch)
+            batch = []
+    if batch:
+        Attendance.objects.bulk_update(batch, ["late_minutes", "updated_at"])
+        changed += len(batch)
+    return changed
@@ -1,8 +1,18 @@
+from datetime import MAXYEAR, MINYEAR
+from zoneinfo import available_timezones
+
 from rest_framework import serializers
+from django.conf import settings
 from django.contrib.auth.models import User
-from django.utils import timezone
+from django.core.files.storage import default_storage
+from django.urls import reverse
 
 from .models import *
+from .utils import month_date_range
+from .workdays import within_calendar
+
+LEAVE_OVERLAP_ERROR = "Bu tarihlerle çakışan bir izin talebi zaten var."
+CALENDAR_RANGE_ERROR = "Tarihler desteklenen takvim aralığının dışında."
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -39,9 +49,129 @@ class UserSerializer(serializers.ModelSerializer):
         return user
 
 
+class ValuesListSerializer:
+    """Read-only list serializer over ``.values()`` rows.
+
+    List endpoints return thousands of rows; building plain dicts from
+    ``values_fields`` skips model instantiation and per-field DRF machinery.
+    Output matches the corresponding ModelSerializer.
+    """
+
+    values_fields = ()
+
+    _date = serializers.DateField()
+    _datetime = serializers.DateTimeField()
+    _duration = serializers.DurationField()
+
+    def __init__(self, rows, context=None):
+        self.rows = rows
+        self.context = context or {}
+
+    @property
+    def data(self):
+        return [self.to_representation(row) for row in self.rows]
+
+    def format_date(self, value):
+        return self._date.to_representation(value) if value is not None else None
+
+    def format_datetime(self, value):
+        return self._datetime.to_representation(value) if value is not None else None
+
+    def format_duration(self, value):
+        return self._duration.to_representation(value) if value is not None else None
+
+    def to_representation(self, row):
+        raise NotImplementedError
+
+
+class UserListSerializer(ValuesListSerializer):
+    """UserSerializer fields without password and the groups/permissions M2M."""
+
+    values_fields = (
+        "id",
+        "last_login",
+        "is_superuser",
+        "username",
+        "first_name",
+        "last_name",
+        "email",
+        "is_staff",
+        "is_active",
+        "date_joined",
+        "is_employee",
+        "annual_leave_days",
+        "resume",
+        "low_leave_notified",
+        "work_schedule_id",
+    )
+
+    def to_representation(self, row):
+        data = dict(row)
+        data["work_schedule"] = data.pop("work_schedule_id")
+        data["last_login"] = self.format_datetime(row["last_login"])
+        data["date_joined"] = self.format_datetime(row["date_joined"])
+        data["resume"] = self.format_file(row["resume"])
+        return data
+
+    def format_file(self, name):
+        if not name:
+            return None
+        url = default_storage.url(name)
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request else url
+
+
+class AttendanceListSerializer(ValuesListSerializer):
+    values_fields = (
+        "id",
+        "user__username",
+        "date",
+        "start_time",
+        "end_time",
+        "late_minutes",
+        "work_duration",
+    )
+
+    def to_representation(self, row):
+        return {
+            "id": row["id"],
+            "user": row["user__username"],
+            "date": self.format_date(row["date"]),
+            "start_time": self.format_datetime(row["start_time"]),
+            "end_time": self.format_datetime(row["end_time"]),
+            "late_time": row["late_minutes"],
+            "work_duration": self.format_duration(row["work_duration"]),
+        }
+
+
+class LeaveRequestListSerializer(ValuesListSerializer):
+    values_fields = (
+        "id",
+        "user_id",
+        "start_date",
+        "end_date",
+        "reason",
+        "status",
+        "updated_at",
+    )
+
+    def to_representation(self, row):
+        return {
+            "id": row["id"],
+            "user": row["user_id"],
+            "start_date": self.format_date(row["start_date"]),
+            "end_date": self.format_date(row["end_date"]),
+            "reason": row["reason"],
+            "status": row["status"],
+            "updated_at": self.format_datetime(row["updated_at"]),
+        }
+
+
 class AttendanceSerializer(serializers.ModelSerializer):
-    late_time = serializers.SerializerMethodField(
-        help_text="Planlanan başlangıç saatinden sonra geç kalma dakikası."
+    late_time = serializers.IntegerField(
+        source="late_minutes",
+        read_only=True,
+        help_text="Planlanan başlangıç saatinden sonra geç kalma dakikası.",
     )
     user = serializers.CharField(
         source="user.username", read_only=True, help_text="Katılımcının kullanıcı adı."
@@ -50,15 +180,16 @@ class AttendanceSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Attendance
-        fields = "__all__"
-        read_only_fields = ["user", "date", "start_time", "end_time", "late_time"]
-
-    def get_late_time(self, obj):
-        job_start_time = timezone.localtime().replace(hour=8, minute=0, second=0)
-        if obj.start_time > job_start_time:
-            late_minutes = (obj.start_time - job_start_time).seconds // 60
-            return late_minutes
-        return None
+        fields = [
+            "id",
+            "user",
+            "date",
+            "start_time",
+            "end_time",
+            "late_time",
+            "work_duration",
+        ]
+        read_only_fields = fields
 
 
 class LeaveRequestSerializer(serializers.ModelSerializer):
@@ -72,12 +203,214 @@ class LeaveRequestSerializer(serializers.ModelSerializer):
         model = LeaveRequest
         fields = "__all__"
 
+    def validate(self, attrs):
+        user = attrs.get("user", getattr(self.instance, "user", None))
+        start_date = attrs.get("start_date", getattr(self.instance, "start_date", None))
+        end_date = attrs.get("end_date", getattr(self.instance, "end_date", None))
+        if start_date and end_date and start_date > end_date:
+            raise serializers.ValidationError(
+                "Başlangıç tarihi bitiş tarihinden sonra olamaz."
+            )
+        if start_date and end_date and not within_calendar(start_date, end_date):
+            raise serializers.ValidationError(CALENDAR_RANGE_ERROR)
+        if user is not None and attrs.get("status") != "REJECTED":
+            conflicts = LeaveRequest.objects.filter(user=user).active().overlapping(
+                start_date, end_date
+            )
+            if self.instance is not None:
+                conflicts = conflicts.exclude(pk=self.instance.pk)
+            if conflicts.exists():
+                raise serializers.ValidationError(LEAVE_OVERLAP_ERROR)
+        return attrs
+
+
+class HolidaySerializer(serializers.ModelSerializer):
+    date = serializers.DateField(help_text="Tatil günü.")
+    name = serializers.CharField(help_text="Tatilin adı.")
+
+    class Meta:
+        model = Holiday
+        fields = "__all__"
+
+
+class WorkScheduleSerializer(serializers.ModelSerializer):
+    timezone = serializers.ChoiceField(
+        choices=sorted(available_timezones()),
+        default=settings.TIME_ZONE,
+        help_text="Vardiya saatlerinin yorumlandığı saat dilimi.",
+    )
+    start_time = serializers.TimeField(help_text="Vardiya başlangıç saati.")
+    end_time = serializers.TimeField(help_text="Vardiya bitiş saati.")
+
+    class Meta:
+        model = WorkSchedule
+        fields = "__all__"
+
+    def validate(self, attrs):
+        start_time = attrs.get("start_time", getattr(self.instance, "start_time", None))
+        end_time = attrs.get("end_time", getattr(self.instance, "end_time", None))
+        if start_time and end_time and end_time <= start_time:
+            raise serializers.ValidationError(
+                "Bitiş saati başlangıç saatinden sonra olmalı."
+            )
+        return attrs
+
+
+class LatenessRecomputeSerializer(serializers.Serializer):
+    start_date = serializers.DateField(
+        required=False,
+        help_text="Bu tarihten itibaren yeniden hesapla (varsayılan: tüm kayıtlar).",
+    )
+
+
+class LeaveOverlapQuerySerializer(serializers.Serializer):
+    start_date = serializers.DateField(help_text="Kontrol edilecek başlangıç tarihi.")
+    end_date = serializers.DateField(help_text="Kontrol edilecek bitiş tarihi (dahil).")
+    user = serializers.PrimaryKeyRelatedField(
+        queryset=User.objects.all(),
+        required=False,
+        help_text="Kontrol edilecek kullanıcı (yalnızca yöneticiler, varsayılan: kendiniz).",
+    )
+
+    def validate(self, attrs):
+        if attrs["start_date"] > attrs["end_date"]:
+            raise serializers.ValidationError(
+                "Başlangıç tarihi bitiş tarihinden sonra olamaz."
+            )
+        return attrs
+
+
+class LeaveRequestBulkActionSerializer(serializers.Serializer):
+    ACTION_CHOICES = (
+        ("approve", "Onayla"),
+        ("reject", "Reddet"),
+    )
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=1000,
+        help_text="İşlenecek izin taleplerinin kimlikleri.",
+    )
+    action = serializers.ChoiceField(
+        choices=ACTION_CHOICES, help_text="Uygulanacak işlem."
+    )
+
 
 class MonthlyWorkReportSerializer(serializers.Serializer):
     user_id = serializers.IntegerField(help_text="Kullanıcının kimliği.")
     username = serializers.CharField(help_text="Kullanıcının kullanıcı adı.")
-    month = serializers.IntegerField(help_text="Raporun ayı.")
-    year = serializers.IntegerField(help_text="Raporun yılı.")
+    month = serializers.IntegerField(
+        allow_null=True, help_text="Raporun ayı (tarih aralığı raporlarında boş)."
+    )
+    year = serializers.IntegerField(
+        allow_null=True, help_text="Raporun yılı (tarih aralığı raporlarında boş)."
+    )
+    start_date = serializers.DateField(help_text="Rapor aralığının ilk günü.")
+    end_date = serializers.DateField(help_text="Rapor aralığının son günü (dahil).")
     total_work_hours = serializers.FloatField(
         help_text="Ay boyunca toplam çalışma saatleri."
     )
+    working_days = serializers.IntegerField(
+        help_text="Dönemdeki iş günü sayısı (hafta sonu ve tatiller hariç)."
+    )
+
+
+class ReportJobSerializer(serializers.ModelSerializer):
+    download_url = serializers.SerializerMethodField(
+        help_text="Rapor hazır olduğunda indirme adresi."
+    )
+
+    class Meta:
+        model = ReportJob
+        fields = [
+            "id",
+            "kind",
+            "start_date",
+            "end_date",
+            "status",
+            "progress",
+            "error",
+            "download_url",
+            "created_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
+
+    def get_download_url(self, obj):
+        if obj.status != "DONE" or not obj.file:
+            return None
+        url = reverse("reports-download", kwargs={"pk": obj.pk})
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request else url
+
+
+class ImportJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ImportJob
+        fields = [
+            "id",
+            "kind",
+            "file_format",
+            "status",
+            "result",
+            "error",
+            "created_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
+
+
+class ReportRequestSerializer(serializers.Serializer):
+    kind = serializers.ChoiceField(
+        choices=ReportJob.KIND_CHOICES, help_text="Rapor türü."
+    )
+    year = serializers.IntegerField(
+        required=False,
+        min_value=MINYEAR,
+        max_value=MAXYEAR - 1,
+        help_text="Aylık ve yıllık raporlar için yıl.",
+    )
+    month = serializers.IntegerField(
+        required=False, min_value=1, max_value=12, help_text="Aylık rapor için ay."
+    )
+    start_date = serializers.DateField(
+        required=False, help_text="Tarih aralığı raporu için başlangıç tarihi."
+    )
+    end_date = serializers.DateField(
+        required=False, help_text="Tarih aralığı raporu için bitiş tarihi (dahil)."
+    )
+
+    def validate(self, attrs):
+        kind = attrs["kind"]
+        if kind == "MONTHLY":
+            if "year" not in attrs or "month" not in attrs:
+                raise serializers.ValidationError("Ay ve yıl parametreleri gereklidir.")
+            start_date, end_date = month_date_range(attrs["year"], attrs["month"])
+        elif kind == "YEARLY":
+            if "year" not in attrs:
+                raise serializers.ValidationError("Yıl parametresi gereklidir.")
+            start_date, _ = month_date_range(attrs["year"], 1)
+            _, end_date = month_date_range(attrs["year"], 12)
+        else:
+            start_date = attrs.get("start_date")
+            end_date = attrs.get("end_date")
+            if not start_date or not end_date or start_date > end_date:
+                raise serializers.ValidationError(
+                    "Geçersiz tarih aralığı parametreleri."
+                )
+        if not within_calendar(start_date, end_date):
+            raise serializers.ValidationError(CALENDAR_RANGE_ERROR)
+        return {"kind": kind, "start_date": start_date, "end_date": end_date}
+
+
+class LatenessStatsSerializer(serializers.Serializer):
+    user_id = serializers.IntegerField(help_text="Kullanıcının kimliği.")
+    username = serializers.CharField(help_text="Kullanıcının kullanıcı adı.")
+    late_count = serializers.IntegerField(help_text="Geç kalınan gün sayısı.")
+    total_late_minutes = serializers.IntegerField(
+        help_text="Toplam geç kalma süresi (dakika)."
+    )
+    average_late_minutes = serializers.FloatField(
+        help_text="Ortalama geç kalma süresi (dakika)."
+    )
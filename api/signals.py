@@ -1,23 +1,89 @@
-from django.db.models.signals import pre_save
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .constants import LOW_LEAVE_THRESHOLD
+from .middleware import invalidate_token, invalidate_user_tokens
 from .tasks import send_low_leave_notification_task
 
-from .models import User
+from .models import User, Attendance, Holiday, WorkSchedule
+from .schedules import invalidate_schedules
+from .summaries import invalidate_closed_reports, refresh_daily_summary, work_day
+from .workdays import invalidate_calendar
 
 @receiver(pre_save, sender=User)
-def notify_admin_low_leave(sender, instance, **kwargs):
-    if not instance.pk:
+def notify_admin_low_leave(sender, instance, update_fields=None, **kwargs):
+    if not instance.pk or instance._state.adding:
         return
-
-    try:
-        previous = User.objects.get(pk=instance.pk)
-    except User.DoesNotExist:
+    if update_fields is not None and "annual_leave_days" not in update_fields:
         return
 
-    if instance.annual_leave_days < 3 and previous.annual_leave_days >= 3:
+    if instance.is_tracked("annual_leave_days"):
+        if not instance.has_changed("annual_leave_days"):
+            return
+        previous_days = instance.get_loaded_value("annual_leave_days")
+    else:
+        # Instance was not loaded with the field; fall back to reading it
+        previous_days = (
+            User.objects.filter(pk=instance.pk)
+            .values_list("annual_leave_days", flat=True)
+            .first()
+        )
+        if previous_days is None:
+            return
+
+    if (
+        instance.annual_leave_days < LOW_LEAVE_THRESHOLD
+        and previous_days >= LOW_LEAVE_THRESHOLD
+    ):
         if not instance.low_leave_notified:
             send_low_leave_notification_task.delay(instance.id)
             instance.low_leave_notified = True
 
-    elif instance.annual_leave_days >= 3 and previous.annual_leave_days < 3:
-        instance.low_leave_notified = False
\ No newline at end of file
+    elif (
+        instance.annual_leave_days >= LOW_LEAVE_THRESHOLD
+        and previous_days < LOW_LEAVE_THRESHOLD
+    ):
+        instance.low_leave_notified = False
+
+
+@receiver(post_save, sender=Attendance)
+@receiver(post_delete, sender=Attendance)
+def update_work_summaries(sender, instance, created=False, **kwargs):
+    # A freshly opened session adds nothing to the totals; keeps check-in at one INSERT
+    if created and instance.end_time is None:
+        return
+
+    days = {work_day(instance.start_time)}
+    loaded_start_time = instance.get_loaded_value("start_time")
+    if loaded_start_time is not None:
+        days.add(work_day(loaded_start_time))
+
+    for day in days:
+        refresh_daily_summary(instance.user_id, day)
+
+
+@receiver(post_save, sender=Holiday)
+@receiver(post_delete, sender=Holiday)
+def invalidate_work_calendar(sender, instance, **kwargs):
+    # Reports include working-day counts, so cached ones are stale too
+    transaction.on_commit(invalidate_calendar)
+    transaction.on_commit(invalidate_closed_reports)
+
+
+@receiver(post_save, sender=WorkSchedule)
+@receiver(post_delete, sender=WorkSchedule)
+def reload_work_schedules(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_schedules)
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    invalidate_token(instance.key)
+
+
+@receiver(post_save, sender=User)
+def invalidate_inactive_user_tokens(sender, instance, **kwargs):
+    if not instance.is_active:
+        invalidate_user_tokens(instance)
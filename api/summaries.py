@@ -0,0 +1,141 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import Attendance, DailyWorkSummary, MonthlyWorkSummary
+from .utils import date_range_bounds, month_date_range
+
+
+REPORT_CACHE_VERSION_KEY = "work-report:version"
+
+
+def report_cache_version():
+    """Current version of closed-period work data; moves on every correction."""
+    return cache.get_or_set(REPORT_CACHE_VERSION_KEY, time.time_ns, None)
+
+
+def report_cache_key(start_date, end_date):
+    """Cache key of a closed-period work report under the current version."""
+    return f"work-report:{report_cache_version()}:{start_date}:{end_date}"
+
+
+def invalidate_closed_reports():
+    """Drop every cached work report by moving to a new version."""
+    try:
+        cache.incr(REPORT_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(REPORT_CACHE_VERSION_KEY, time.time_ns(), None)
+
+
+def work_day(start_time):
+    """Summaries are keyed on the local calendar day a session started."""
+    return timezone.localtime(start_time).date()
+
+
+def refresh_daily_summary(user_id, day):
+    """Recompute one user's day from raw attendance and push the delta to the month."""
+    range_start, range_end = date_range_bounds(day, day)
+    total = Attendance.objects.filter(
+        user_id=user_id,
+        start_time__gte=range_start,
+        start_time__lt=range_end,
+        end_time__isnull=False,
+    ).aggregate(total=Sum("work_duration"))["total"]
+    seconds = int(total.total_seconds()) if total else 0
+
+    with transaction.atomic():
+        summary = (
+            DailyWorkSummary.objects.select_for_update()
+            .filter(user_id=user_id, date=day)
+            .first()
+        )
+        if summary is None:
+            if not seconds:
+                return
+            summary = DailyWorkSummary.objects.create(
+                user_id=user_id, date=day, total_seconds=0
+            )
+
+        delta = seconds - summary.total_seconds
+        if not delta:
+            return
+
+        summary.total_seconds = seconds
+        summary.save(update_fields=["total_seconds"])
+
+        monthly, _ = MonthlyWorkSummary.objects.get_or_create(
+            user_id=user_id, year=day.year, month=day.month
+        )
+        MonthlyWorkSummary.objects.filter(pk=monthly.pk).update(
+            total_seconds=F("total_seconds") + delta
+        )
+        # Reports are only cached for past periods, so today's check-outs keep them
+        if day < timezone.localdate():
+            transaction.on_commit(invalidate_closed_reports)
+
+
+def rebuild_work_summaries(start_date=None, end_date=None):
+    """Rebuild daily and monthly summaries from raw attendance.
+
+    The range is widened to whole months so monthly totals stay consistent.
+    Returns the number of daily rows written.
+    """
+    attendances = Attendance.objects.filter(end_time__isnull=False)
+    dailies = DailyWorkSummary.objects.all()
+    monthlies = MonthlyWorkSummary.objects.all()
+
+    if start_date:
+        start_date = start_date.replace(day=1)
+        range_start, _ = date_range_bounds(start_date, start_date)
+        attendances = attendances.filter(start_time__gte=range_start)
+        dailies = dailies.filter(date__gte=start_date)
+        monthlies = monthlies.filter(
+            year__gte=start_date.year
+        ).exclude(year=start_date.year, month__lt=start_date.month)
+    if end_date:
+        _, end_date = month_date_range(end_date.year, end_date.month)
+        _, range_end = date_range_bounds(end_date, end_date)
+        attendances = attendances.filter(start_time__lt=range_end)
+        dailies = dailies.filter(date__lte=end_date)
+        monthlies = monthlies.filter(
+            year__lte=end_date.year
+        ).exclude(year=end_date.year, month__gt=end_date.month)
+
+    rows = (
+        attendances.annotate(day=TruncDate("start_time"))
+        .values("user_id", "day")
+        .annotate(total=Sum("work_duration"))
+        .order_by()
+    )
+
+    daily_objects = []
+    monthly_totals = {}
+    for row in rows.iterator():
+        seconds = int(row["total"].total_seconds())
+        day = row["day"]
+        daily_objects.append(
+            DailyWorkSummary(user_id=row["user_id"], date=day, total_seconds=seconds)
+        )
+        key = (row["user_id"], day.year, day.month)
+        monthly_totals[key] = monthly_totals.get(key, 0) + seconds
+
+    with transaction.atomic():
+        dailies.delete()
+        monthlies.delete()
+        DailyWorkSummary.objects.bulk_create(daily_objects, batch_size=1000)
+        MonthlyWorkSummary.objects.bulk_create(
+            [
+                MonthlyWorkSummary(
+                    user_id=user_id, year=year, month=month, total_seconds=seconds
+                )
+                for (user_id, year, month), seconds in monthly_totals.items()
+            ],
+            batch_size=1000,
+        )
+        transaction.on_commit(invalidate_closed_reports)
+
+    return len(daily_objects)
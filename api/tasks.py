@@ -1,10 +1,27 @@
+import json
+
 from celery import shared_task
+from django.conf import settings
 from django.core.mail import send_mail
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 
-from api.constants import create_notification, NOTIFICATION_TYPE_WARNING, NOTIFICATION_TYPE_INFO
-from api.utils import send_notification
+from api.constants import (
+    create_notification,
+    NOTIFICATION_TYPE_WARNING,
+    NOTIFICATION_TYPE_INFO,
+    NOTIFICATION_TYPE_SUCCESS,
+    NOTIFICATION_TYPE_ERROR,
+)
+from api.mail import get_pooled_connection
+from api.utils import (
+    send_notification,
+    send_notifications,
+    send_admin_notification,
+    get_redis,
+)
 
 
 @shared_task
@@ -19,6 +36,7 @@ def send_low_leave_notification_task(user_id):
             f"Çalışan {user.username}'ın kalan yıllık izin günleri {user.annual_leave_days} gün kaldı.",
             "system@company.com",
             [admin.email],
+            connection=get_pooled_connection(),
         )
 
         notification = create_notification(
@@ -39,48 +57,154 @@ def send_low_leave_notification_task(user_id):
         print(f"Email notification failed: {e}")
 
 
+LATE_ARRIVAL_BUFFER_KEY = "late-arrivals:buffer"
+LATE_ARRIVAL_FLUSH_KEY = "late-arrivals:flush-scheduled"
+
+
+def format_late_message(username, late_minutes):
+    if late_minutes > 60:
+        hours = late_minutes // 60
+        minutes = late_minutes % 60
+        return f"{username} bugün işe {hours} saat {minutes} dakika geç kaldı."
+    return f"{username} bugün işe {late_minutes} dakika geç kaldı."
+
+
+def schedule_late_arrival_flush(client, countdown):
+    """Schedule a digest flush unless one is pending; the key expires in case it is lost."""
+    if client.set(LATE_ARRIVAL_FLUSH_KEY, 1, nx=True, ex=countdown + 60):
+        flush_late_arrival_digest_task.apply_async(countdown=countdown)
+
+
 @shared_task
 def send_late_arrival_notification_task(user_id, late_minutes):
-    from .models import User
-
+    """Buffer a late arrival; admins get one digest per LATE_ARRIVAL_DIGEST_WINDOW."""
     try:
-        user = User.objects.get(id=user_id)
-        admin_emails = User.objects.filter(is_superuser=True).values_list(
-            "email", flat=True
+        client = get_redis()
+        client.rpush(
+            LATE_ARRIVAL_BUFFER_KEY,
+            json.dumps({"user_id": user_id, "late_minutes": late_minutes}),
         )
-        if late_minutes > 60:
-            hours = late_minutes // 60
-            minutes = late_minutes % 60
-            late_message = (
-                f"{user.username} bugün işe {hours} saat {minutes} dakika geç kaldı."
-            )
-        else:
-            late_message = f"{user.username} bugün işe {late_minutes} dakika geç kaldı."
+        # Only the first event of a window schedules the flush
+        schedule_late_arrival_flush(client, settings.LATE_ARRIVAL_DIGEST_WINDOW)
+    except Exception as e:
+        print(f"Late arrival buffering failed: {e}")
 
-        send_mail(
-            "Gecikme Uyarısı",
-            late_message,
-            "system@company.com",
-            list(admin_emails),
-            fail_silently=False,
-        )
 
-        notification = create_notification(
-            message=late_message, notif_type=NOTIFICATION_TYPE_WARNING
+def drain_redis_buffer(buffer_key, flush_key, max_batch, schedule_flush, handle, retry_after=None):
+    """Pass one batch of a Redis list buffer, decoded, to ``handle``.
+
+    The flush claim is released before the read, so an event pushed from here
+    on schedules its own flush; ``schedule_flush(client, 0)`` runs when more
+    than a batch was waiting. If ``handle`` raises, the batch is pushed back
+    and retried after ``retry_after`` seconds, or dropped when that is ``None``.
+    """
+    client = get_redis()
+    client.delete(flush_key)
+
+    pipeline = client.pipeline()
+    pipeline.lrange(buffer_key, 0, max_batch - 1)
+    pipeline.ltrim(buffer_key, max_batch, -1)
+    pipeline.llen(buffer_key)
+    raw_events, _, remaining = pipeline.execute()
+
+    if not raw_events:
+        return
+
+    try:
+        handle([json.loads(raw) for raw in raw_events])
+    except Exception as e:
+        print(f"Flushing {buffer_key} failed: {e}")
+        if retry_after is not None:
+            client.rpush(buffer_key, *raw_events)
+            schedule_flush(client, retry_after)
+            return
+
+    if remaining:
+        schedule_flush(client, 0)
+
+
+def send_late_arrival_digest(events):
+    from .models import User
+
+    usernames = dict(
+        User.objects.filter(
+            id__in={event["user_id"] for event in events}
+        ).values_list("id", "username")
+    )
+    lines = [
+        format_late_message(usernames[event["user_id"]], event["late_minutes"])
+        for event in events
+        if event["user_id"] in usernames
+    ]
+    if not lines:
+        return
+
+    if len(lines) == 1:
+        subject = "Gecikme Uyarısı"
+        message = lines[0]
+    else:
+        subject = f"Gecikme Özeti ({len(lines)} çalışan)"
+        message = "\n".join(
+            [f"{len(lines)} çalışan bugün işe geç kaldı."] + lines
         )
-        channel_layer = get_channel_layer()
-        for admin in User.objects.filter(is_superuser=True):
-            async_to_sync(channel_layer.group_send)(
-                f"user_{admin.id}",
-                {
-                    "type": "send_notification",
-                    "message": notification,
-                },
-            )
-    except User.DoesNotExist:
-        print("Kullanıcı bulunamadı.")
+
+    admin_emails = User.objects.filter(is_superuser=True).values_list(
+        "email", flat=True
+    )
+    send_mail(
+        subject,
+        message,
+        "system@company.com",
+        list(admin_emails),
+        fail_silently=False,
+        connection=get_pooled_connection(),
+    )
+
+    send_admin_notification(message=message, notif_type=NOTIFICATION_TYPE_WARNING)
+
+
+@shared_task
+def flush_late_arrival_digest_task():
+    # A failed digest is dropped rather than retried, so admins never get it twice
+    drain_redis_buffer(
+        LATE_ARRIVAL_BUFFER_KEY,
+        LATE_ARRIVAL_FLUSH_KEY,
+        settings.LATE_ARRIVAL_DIGEST_MAX_BATCH,
+        schedule_late_arrival_flush,
+        send_late_arrival_digest,
+    )
+
+
+@shared_task
+def flush_check_ins_task():
+    from .checkins import (
+        CHECK_IN_BUFFER_KEY,
+        CHECK_IN_FLUSH_KEY,
+        schedule_check_in_flush,
+        write_check_ins,
+    )
+
+    def write(events):
+        for attendance in write_check_ins(events):
+            send_late_arrival_notification_task(attendance.user_id, attendance.late_minutes)
+
+    # A failed batch goes back to the buffer so the check-ins are not lost
+    drain_redis_buffer(
+        CHECK_IN_BUFFER_KEY,
+        CHECK_IN_FLUSH_KEY,
+        settings.CHECK_IN_FLUSH_MAX_BATCH,
+        schedule_check_in_flush,
+        write,
+        retry_after=settings.CHECK_IN_FLUSH_WINDOW,
+    )
+
+
+@shared_task
+def send_bulk_notifications_task(notifications):
+    try:
+        send_notifications(notifications)
     except Exception as e:
-        print(f"Email notification failed: {e}")
+        print(f"Bulk notification failed: {e}")
 
 
 @shared_task
@@ -89,4 +213,124 @@ def test_notification(user_id):
         user_id=user_id,
         message="Bu bir test bildirimidir.",
         notif_type=NOTIFICATION_TYPE_INFO
-    )
\ No newline at end of file
+    )
+
+
+@shared_task
+def generate_report_task(job_id):
+    from .models import ReportJob
+    from .reports import write_report
+
+    try:
+        job = ReportJob.objects.get(id=job_id)
+    except ReportJob.DoesNotExist:
+        print("Rapor işi bulunamadı.")
+        return
+
+    ReportJob.objects.filter(pk=job.pk).update(status="RUNNING", progress=0)
+
+    def update_progress(progress):
+        ReportJob.objects.filter(pk=job.pk).update(progress=progress)
+
+    try:
+        write_report(job, on_progress=update_progress)
+        job.status = "DONE"
+        job.progress = 100
+        job.finished_at = timezone.now()
+        job.save(update_fields=["file", "status", "progress", "finished_at"])
+    except Exception as e:
+        print(f"Report generation failed: {e}")
+        ReportJob.objects.filter(pk=job.pk).update(
+            status="FAILED", error=str(e), finished_at=timezone.now()
+        )
+        if job.requested_by_id:
+            send_notification(
+                user_id=job.requested_by_id,
+                message=f"Rapor oluşturulamadı: {job}",
+                notif_type=NOTIFICATION_TYPE_ERROR,
+            )
+        return
+
+    if job.requested_by_id:
+        send_notification(
+            user_id=job.requested_by_id,
+            message=f"Raporunuz hazır: {job}",
+            notif_type=NOTIFICATION_TYPE_SUCCESS,
+        )
+
+
+@shared_task
+def recompute_lateness_task(schedule_id, start_date=None):
+    from .schedules import recompute_late_minutes
+
+    try:
+        changed = recompute_late_minutes(
+            schedule_id=schedule_id,
+            start_date=parse_date(start_date) if start_date else None,
+        )
+    except Exception as e:
+        print(f"Lateness recomputation failed: {e}")
+        return
+
+    send_admin_notification(
+        f"Geç kalma dakikaları yeniden hesaplandı: {changed} kayıt güncellendi.",
+        NOTIFICATION_TYPE_INFO,
+    )
+
+
+@shared_task
+def import_data_task(job_id):
+    from django.db import IntegrityError
+
+    from .importers import (
+        IMPORT_CONFLICT_ERROR,
+        import_attendance,
+        import_employees,
+        iter_records,
+        open_text,
+    )
+    from .models import ImportJob
+
+    try:
+        job = ImportJob.objects.get(id=job_id)
+    except ImportJob.DoesNotExist:
+        print("İçe aktarma işi bulunamadı.")
+        return
+
+    ImportJob.objects.filter(pk=job.pk).update(status="RUNNING")
+
+    try:
+        with job.file.open("rb") as upload:
+            records = iter_records(open_text(upload.file), job.file_format)
+            if job.kind == "EMPLOYEES":
+                # Prefork workers are daemonic and cannot start a process pool
+                result = import_employees(records, workers=1)
+            else:
+                result = import_attendance(records)
+    except Exception as e:
+        print(f"Import failed: {e}")
+        error = IMPORT_CONFLICT_ERROR if isinstance(e, IntegrityError) else str(e)
+        ImportJob.objects.filter(pk=job.pk).update(
+            status="FAILED", error=error, file=None, finished_at=timezone.now()
+        )
+        if job.requested_by_id:
+            send_notification(
+                user_id=job.requested_by_id,
+                message=f"İçe aktarma başarısız: {job}",
+                notif_type=NOTIFICATION_TYPE_ERROR,
+            )
+        return
+    finally:
+        # Employee files can carry plain-text passwords
+        job.file.delete(save=False)
+
+    ImportJob.objects.filter(pk=job.pk).update(
+        status="DONE", result=result.as_dict(), file=None, finished_at=timezone.now()
+    )
+    if job.requested_by_id:
+        send_notification(
+            user_id=job.requested_by_id,
+            message=f"İçe aktarma tamamlandı: {result.created} kayıt oluşturuldu, "
+            f"{len(result.rejected)} satır reddedildi.",
+            notif_type=NOTIFICATION_TYPE_SUCCESS,
+        )
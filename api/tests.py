@@ -0,0 +1,604 @@
+import json
+import smtplib
+import threading
+import time
+from datetime import datetime, time as clock_time, timedelta
+from functools import partial
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import IntegrityError, connection
+from django.core import mail
+from django.core.mail import EmailMessage, get_connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import AnonymousUser
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient, APITestCase
+
+from .cache import TTLCache
+from .mail import PooledEmailBackend
+from .middleware import get_user
+from .notifications import NotificationDispatcher
+from .tasks import drain_redis_buffer, flush_late_arrival_digest_task
+from .models import Attendance, LeaveRequest, User
+from .serializers import LEAVE_OVERLAP_ERROR
+
+TEST_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ListQueryCountTests(APITestCase):
+    """List endpoints must run a fixed number of queries whatever the page holds."""
+
+    SMALL, LARGE = 3, 30
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser("admin", "admin@example.com", "pw")
+
+    def setUp(self):
+        self.client.force_authenticate(self.admin)
+
+    def create_rows(self, count):
+        # bulk_create skips the signals, which would otherwise queue Celery tasks
+        today = timezone.localdate()
+        start_time = timezone.make_aware(datetime.combine(today, datetime.min.time()))
+        offset = User.objects.count()
+        users = User.objects.bulk_create(
+            User(username=f"employee{offset + i}", is_employee=True)
+            for i in range(count)
+        )
+        Attendance.objects.bulk_create(
+            Attendance(
+                user=user,
+                date=today,
+                start_time=start_time + timedelta(hours=9, minutes=15),
+                end_time=start_time + timedelta(hours=17),
+                work_duration=timedelta(hours=7, minutes=45),
+                late_minutes=15,
+            )
+            for user in users
+        )
+        LeaveRequest.objects.bulk_create(
+            LeaveRequest(
+                user=user,
+                start_date=today + timedelta(days=7),
+                end_date=today + timedelta(days=8),
+                reason="Tatil",
+            )
+            for user in users
+        )
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(response.data["results"]), len(context.captured_queries)
+
+    def assert_constant_queries(self, url):
+        self.create_rows(self.SMALL)
+        small_rows, small_queries = self.count_queries(url)
+        self.create_rows(self.LARGE - self.SMALL)
+        large_rows, large_queries = self.count_queries(url)
+
+        self.assertGreater(large_rows, small_rows)
+        self.assertEqual(small_queries, large_queries)
+
+    def test_attendances(self):
+        self.assert_constant_queries("/api/v1/attendances/")
+
+    def test_leave_requests(self):
+        self.assert_constant_queries("/api/v1/leave-requests/")
+
+    def test_late_arrivals(self):
+        self.assert_constant_queries("/api/v1/late-arrivals/")
+
+    def test_pending_leaves(self):
+        self.assert_constant_queries("/api/v1/pending-leaves/")
+
+    def test_employees(self):
+        self.assert_constant_queries("/api/v1/employees/")
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ConditionalListTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        self.employee = User.objects.create_user("employee", is_employee=True)
+        today = timezone.localdate()
+        Attendance.objects.bulk_create(
+            Attendance(
+                user=self.employee,
+                date=today - timedelta(days=i),
+                start_time=timezone.make_aware(
+                    datetime.combine(today - timedelta(days=i), clock_time(9))
+                ),
+            )
+            for i in range(3)
+        )
+        self.client.force_authenticate(self.admin)
+
+    def get(self, etag=None):
+        headers = {"if_none_match": etag} if etag else {}
+        return self.client.get("/api/v1/attendances/", headers=headers)
+
+    def test_unchanged_page_is_not_modified(self):
+        etag = self.get()["ETag"]
+
+        self.assertEqual(self.get(etag).status_code, 304)
+
+    def test_renamed_user_changes_the_etag(self):
+        # Attendance rows serialize the username, which lives on another table
+        etag = self.get()["ETag"]
+        User.objects.filter(pk=self.employee.pk).update(username="renamed")
+
+        response = self.get(etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class CursorOrderingTests(APITestCase):
+    """Client orderings on non-unique fields must page by keyset, without offsets."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        users = User.objects.bulk_create(
+            User(username=f"employee{i}", is_employee=True) for i in range(7)
+        )
+        today = timezone.localdate()
+        start_time = timezone.make_aware(datetime.combine(today, clock_time(9)))
+        # Five rows share today's date, so the ordering field alone has ties
+        Attendance.objects.bulk_create(
+            Attendance(
+                user=user,
+                date=today - timedelta(days=max(0, i - 4)),
+                start_time=start_time - timedelta(days=max(0, i - 4)),
+            )
+            for i, user in enumerate(users)
+        )
+
+    def setUp(self):
+        self.client.force_authenticate(self.admin)
+
+    def walk(self, url):
+        ids, queries = [], []
+        while url:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids += [row["id"] for row in response.data["results"]]
+            queries += [query["sql"] for query in context.captured_queries]
+            url = response.data["next"]
+        return ids, queries
+
+    def test_pages_cover_ties_in_order(self):
+        for ordering, tie_breaker in (("date", 1), ("-date", -1)):
+            with self.subTest(ordering=ordering):
+                ids, queries = self.walk(
+                    f"/api/v1/attendances/?ordering={ordering}&page_size=2"
+                )
+                expected = [
+                    attendance.id
+                    for attendance in Attendance.objects.order_by(
+                        ordering, "id" if tie_breaker > 0 else "-id"
+                    )
+                ]
+                self.assertEqual(ids, expected)
+                self.assertFalse([sql for sql in queries if "OFFSET" in sql])
+
+    def test_previous_link_returns_the_earlier_page(self):
+        first = self.client.get("/api/v1/attendances/?ordering=date&page_size=2")
+        second = self.client.get(first.data["next"])
+        back = self.client.get(second.data["previous"])
+
+        self.assertEqual(back.data["results"], first.data["results"])
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ConcurrentLeaveDeductionTests(TransactionTestCase):
+    """Parallel approvals and check-in deductions must not lose decrements."""
+
+    THREADS = 8
+
+    def setUp(self):
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            self.skipTest("Shared-cache in-memory SQLite locks whole tables across threads.")
+        self.admin = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        self.employee = User.objects.create_user(
+            "employee", "employee@example.com", "pw", is_employee=True, annual_leave_days=100
+        )
+        # One single-day leave per week, each on a Monday inside the calendar window
+        today = timezone.localdate()
+        monday = today + timedelta(days=7 - today.weekday())
+        self.leave_requests = [
+            LeaveRequest.objects.create(
+                user=self.employee,
+                start_date=monday + timedelta(weeks=i),
+                end_date=monday + timedelta(weeks=i),
+                reason="Tatil",
+            )
+            for i in range(self.THREADS)
+        ]
+
+    def run_in_parallel(self, jobs):
+        barrier = threading.Barrier(len(jobs))
+        errors = []
+
+        def run(job):
+            try:
+                barrier.wait()
+                job()
+            except Exception as e:
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=run, args=(job,)) for job in jobs]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def approve(self, leave_request):
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        response = client.post(f"/api/v1/leave-requests/{leave_request.pk}/approve/")
+        self.assertEqual(response.status_code, 200)
+
+    def deduct(self):
+        User.objects.get(pk=self.employee.pk).deduct_leave_days(0.5)
+
+    def test_stale_instances_deduct_in_sequence(self):
+        first = User.objects.get(pk=self.employee.pk)
+        second = User.objects.get(pk=self.employee.pk)
+
+        first.deduct_leave_days(2)
+        second.deduct_leave_days(3)
+
+        self.employee.refresh_from_db()
+        self.assertEqual(self.employee.annual_leave_days, 95)
+
+    @mock.patch("api.notifications._dispatch")
+    def test_parallel_approvals_and_deductions(self, _dispatch):
+        jobs = [partial(self.approve, leave_request) for leave_request in self.leave_requests]
+        jobs += [self.deduct] * self.THREADS
+        self.run_in_parallel(jobs)
+
+        self.employee.refresh_from_db()
+        self.assertEqual(self.employee.annual_leave_days, 100 - self.THREADS * 1.5)
+        self.assertFalse(
+            LeaveRequest.objects.filter(
+                pk__in=[leave_request.pk for leave_request in self.leave_requests]
+            )
+            .exclude(status="APPROVED")
+            .exists()
+        )
+
+    @mock.patch("api.notifications._dispatch")
+    def test_parallel_approvals_of_one_request(self, _dispatch):
+        leave_request = self.leave_requests[0]
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        responses = []
+
+        def approve():
+            responses.append(
+                client.post(f"/api/v1/leave-requests/{leave_request.pk}/approve/").status_code
+            )
+
+        self.run_in_parallel([approve] * self.THREADS)
+
+        self.assertEqual(sorted(responses), [200] + [400] * (self.THREADS - 1))
+        self.employee.refresh_from_db()
+        self.assertEqual(self.employee.annual_leave_days, 99)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class NotificationDispatchTests(APITestCase):
+    """Approvals must not wait on the Celery broker, even while it is down."""
+
+    def setUp(self):
+        admin = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        self.employee = User.objects.create_user(
+            "employee", "employee@example.com", "pw", is_employee=True, annual_leave_days=30
+        )
+        today = timezone.localdate()
+        monday = today + timedelta(days=7 - today.weekday())
+        self.leave_request = LeaveRequest.objects.create(
+            user=self.employee, start_date=monday, end_date=monday, reason="Tatil"
+        )
+        self.client.force_authenticate(admin)
+        self.published = []
+        self.delay = mock.Mock()
+        for patcher in (
+            mock.patch(
+                "api.notifications.dispatcher",
+                NotificationDispatcher(max_size=10, retry_interval=0),
+            ),
+            mock.patch("api.notifications.send_bulk_notifications_task.delay", self.delay),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def approve(self, delay):
+        self.delay.side_effect = delay
+        started = time.monotonic()
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                f"/api/v1/leave-requests/{self.leave_request.pk}/approve/"
+            )
+        self.assertEqual(response.status_code, 200)
+        return time.monotonic() - started
+
+    def wait_for_publish(self):
+        deadline = time.monotonic() + 5
+        while not self.published and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(self.published), 1)
+        self.assertEqual(self.published[0][0]["user_id"], self.employee.pk)
+
+    def test_unreachable_broker_does_not_block_approve(self):
+        broker_back = threading.Event()
+
+        def delay(batch):
+            # A publish to an unreachable broker hangs until the connection times out
+            broker_back.wait(5)
+            self.published.append(batch)
+
+        elapsed = self.approve(delay)
+        broker_back.set()
+
+        self.assertLess(elapsed, 1)
+        self.wait_for_publish()
+
+    def test_failed_publish_is_retried(self):
+        calls = []
+
+        def delay(batch):
+            calls.append(batch)
+            if len(calls) == 1:
+                raise ConnectionError("Error 111 connecting to localhost:6379")
+            self.published.append(batch)
+
+        self.approve(delay)
+
+        self.wait_for_publish()
+        self.assertEqual(len(calls), 2)
+
+
+@override_settings(CACHES=TEST_CACHES, CHECK_IN_FAST_PATH=False)
+class CheckInTests(APITestCase):
+    def setUp(self):
+        self.employee = User.objects.create_user(
+            "employee", "employee@example.com", "pw", is_employee=True, annual_leave_days=30
+        )
+        self.client.force_authenticate(self.employee)
+        # Stored Idempotency-Key responses would outlive the rolled-back rows
+        self.addCleanup(cache.clear)
+        today = timezone.localdate()
+        monday = today + timedelta(days=7 - today.weekday())
+        # Half an hour past the default 08:00 shift start
+        self.now = timezone.make_aware(datetime.combine(monday, clock_time(8, 30)))
+        for patcher in (
+            mock.patch("api.views.timezone.now", return_value=self.now),
+            mock.patch("api.views.is_working_day", return_value=True),
+            mock.patch("api.views.send_late_arrival_notification_task"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def check_in(self, **headers):
+        return self.client.post("/api/v1/check-in/", headers=headers)
+
+    def test_check_in_is_one_insert(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.check_in()
+
+        self.assertEqual(response.status_code, 200)
+        writes = [
+            query["sql"]
+            for query in context.captured_queries
+            if "api_attendance" in query["sql"] or "SAVEPOINT" in query["sql"]
+        ]
+        self.assertEqual(len(writes), 1)
+        self.assertIn("ON CONFLICT", writes[0])
+
+        attendance = Attendance.objects.get(user=self.employee)
+        self.assertEqual(attendance.start_time, self.now)
+        self.assertEqual(attendance.late_minutes, 30)
+        self.employee.refresh_from_db()
+        self.assertAlmostEqual(self.employee.annual_leave_days, 30 - 30 / 600)
+
+    def test_second_check_in_is_rejected(self):
+        self.assertEqual(self.check_in().status_code, 200)
+
+        response = self.check_in()
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Attendance.objects.filter(user=self.employee).count(), 1)
+
+    def test_retry_while_first_request_runs(self):
+        retries = []
+
+        def insert_check_in(*args):
+            # The client retries with the same key before the first response arrives
+            retries.append(self.check_in(idempotency_key="abc"))
+            return True
+
+        with mock.patch("api.views.insert_check_in", side_effect=insert_check_in):
+            first = self.check_in(idempotency_key="abc")
+        replayed = self.check_in(idempotency_key="abc")
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(retries[0].status_code, 409)
+        self.assertEqual(replayed.status_code, 200)
+        self.assertEqual(replayed["Idempotent-Replayed"], "true")
+        self.assertEqual(replayed.data, first.data)
+
+    def test_retry_after_failure_runs_again(self):
+        with mock.patch("api.views.insert_check_in", return_value=False):
+            self.assertEqual(self.check_in(idempotency_key="abc").status_code, 400)
+
+        response = self.check_in(idempotency_key="abc")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Idempotent-Replayed", response)
+
+
+class LateArrivalDigestTests(TestCase):
+    def test_digest_mail_starts_with_the_summary_line(self):
+        User.objects.create_superuser("admin", "admin@example.com", "pw")
+        employees = [User.objects.create_user(f"employee{i}") for i in range(2)]
+        raw_events = [
+            json.dumps({"user_id": employee.pk, "late_minutes": 15}) for employee in employees
+        ]
+        redis = mock.Mock()
+        redis.pipeline.return_value.execute.return_value = (raw_events, True, 0)
+
+        with mock.patch("api.tasks.get_redis", return_value=redis), mock.patch(
+            "api.tasks.get_pooled_connection",
+            return_value=get_connection("django.core.mail.backends.locmem.EmailBackend"),
+        ), mock.patch("api.tasks.send_admin_notification") as send_admin_notification:
+            flush_late_arrival_digest_task()
+
+        self.assertEqual(len(mail.outbox), 1)
+        body = mail.outbox[0].body.splitlines()
+        self.assertEqual(body[0], "2 çalışan bugün işe geç kaldı.")
+        self.assertEqual(len(body), 3)
+        self.assertEqual(send_admin_notification.call_args.kwargs["message"], mail.outbox[0].body)
+
+
+class DrainRedisBufferTests(SimpleTestCase):
+    def drain(self, raw_events, remaining, handle, retry_after=None):
+        redis = mock.Mock()
+        redis.pipeline.return_value.execute.return_value = (raw_events, True, remaining)
+        schedule_flush = mock.Mock()
+        with mock.patch("api.tasks.get_redis", return_value=redis):
+            drain_redis_buffer("buffer", "flush", 2, schedule_flush, handle, retry_after)
+        return redis, schedule_flush
+
+    def test_remaining_events_schedule_the_next_flush_now(self):
+        handle = mock.Mock()
+
+        redis, schedule_flush = self.drain(['{"id": 1}', '{"id": 2}'], 3, handle)
+
+        redis.delete.assert_called_once_with("flush")
+        handle.assert_called_once_with([{"id": 1}, {"id": 2}])
+        schedule_flush.assert_called_once_with(redis, 0)
+
+    def test_failed_batch_is_pushed_back_when_retried(self):
+        handle = mock.Mock(side_effect=RuntimeError("database is down"))
+
+        redis, schedule_flush = self.drain(['{"id": 1}'], 3, handle, retry_after=2)
+
+        redis.rpush.assert_called_once_with("buffer", '{"id": 1}')
+        schedule_flush.assert_called_once_with(redis, 2)
+
+    def test_failed_batch_is_dropped_without_retry(self):
+        handle = mock.Mock(side_effect=RuntimeError("SMTP is down"))
+
+        redis, schedule_flush = self.drain(['{"id": 1}'], 0, handle)
+
+        redis.rpush.assert_not_called()
+        schedule_flush.assert_not_called()
+
+
+@override_settings(CACHES=TEST_CACHES)
+class TokenCacheRevocationTests(TransactionTestCase):
+    """A token revoked in one ASGI worker must stop working in every worker."""
+
+    def setUp(self):
+        self.addCleanup(cache.clear)
+        self.user = User.objects.create_user("employee")
+        self.token = Token.objects.create(user=self.user)
+
+    def in_other_worker(self):
+        # The signal handlers only clear this process-local cache instance
+        return mock.patch("api.middleware.token_user_cache", TTLCache(max_size=10, ttl=60))
+
+    def test_deleted_token(self):
+        # delete() clears the primary key, which for tokens is the key itself
+        key = self.token.key
+        self.assertEqual(async_to_sync(get_user)(key), self.user)
+
+        with self.in_other_worker():
+            self.token.delete()
+
+        self.assertIsInstance(async_to_sync(get_user)(key), AnonymousUser)
+
+    def test_deactivated_user(self):
+        self.assertEqual(async_to_sync(get_user)(self.token.key), self.user)
+
+        with self.in_other_worker():
+            self.user.is_active = False
+            self.user.save()
+
+        self.assertIsInstance(async_to_sync(get_user)(self.token.key), AnonymousUser)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class LeaveRequestUpdateTests(APITestCase):
+    def setUp(self):
+        admin = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        employee = User.objects.create_user("employee", is_employee=True, annual_leave_days=30)
+        today = timezone.localdate()
+        monday = today + timedelta(days=7 - today.weekday())
+        self.leave_request = LeaveRequest.objects.create(
+            user=employee, start_date=monday, end_date=monday, reason="Tatil"
+        )
+        self.client.force_authenticate(admin)
+
+    def test_racing_overlap_on_update_is_a_validation_error(self):
+        # The serializer check passed, then a concurrent write made the range overlap
+        url = f"/api/v1/leave-requests/{self.leave_request.pk}/"
+        with mock.patch(
+            "api.serializers.LeaveRequestSerializer.save",
+            side_effect=IntegrityError("conflicting key value violates exclusion constraint"),
+        ):
+            for method in (self.client.patch, self.client.put):
+                with self.subTest(method=method.__name__):
+                    response = method(
+                        url,
+                        {
+                            "user": self.leave_request.user_id,
+                            "start_date": self.leave_request.start_date,
+                            "end_date": self.leave_request.end_date + timedelta(days=1),
+                            "reason": "Tatil",
+                        },
+                    )
+                    self.assertEqual(response.status_code, 400)
+                    self.assertEqual(response.data["detail"], LEAVE_OVERLAP_ERROR)
+
+
+class PooledEmailBackendTests(SimpleTestCase):
+    def test_dropped_session_resends_only_the_failed_message(self):
+        backend = PooledEmailBackend(host="localhost", port=25, username="", password="")
+        attempts = []
+
+        def open_connection():
+            if backend.connection:
+                return False
+            backend.connection = mock.Mock()
+            return True
+
+        def send(message):
+            attempts.append(message.subject)
+            if len(attempts) == 2:
+                raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+            return True
+
+        messages = [EmailMessage(subject=str(i), to=["admin@example.com"]) for i in range(3)]
+        with mock.patch.object(backend, "open", side_effect=open_connection), mock.patch.object(
+            backend, "_send", side_effect=send
+        ):
+            sent = backend.send_messages(messages)
+
+        self.assertEqual(sent, 3)
+        self.assertEqual(attempts, ["0", "1", "1", "2"])
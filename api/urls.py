@@ -1,4 +1,4 @@
-from django.urls import path, include
+from django.urls import path, re_path, include
 from rest_framework.routers import DefaultRouter
 
 from .views import *
@@ -8,6 +8,10 @@ router = DefaultRouter()
 router.register(r'leave-requests', LeaveRequestViewSet, basename='leave-requests')
 router.register(r'employees', EmployeeViewSet, basename='employees')
 router.register(r'attendances', AttendanceViewSet, basename='attendances')
+router.register(r'reports', ReportJobViewSet, basename='reports')
+router.register(r'import-jobs', ImportJobViewSet, basename='import-jobs')
+router.register(r'holidays', HolidayViewSet, basename='holidays')
+router.register(r'work-schedules', WorkScheduleViewSet, basename='work-schedules')
 
 urlpatterns = [
     path('login/', LoginView.as_view(), name='login'),
@@ -16,6 +20,12 @@ urlpatterns = [
     path('check-out/', CheckOutView.as_view(), name='check-out'),
     path('', include(router.urls)),
     path('late-arrivals/', LateArrivalsView.as_view(), name='late-arrivals'),
+    path('lateness-stats/', LatenessStatsView.as_view(), name='lateness-stats'),
     path('pending-leaves/', PendingLeavesView.as_view(), name='pending-leaves'),
+    path('on-leave/', OnLeaveView.as_view(), name='on-leave'),
     path('monthly-work-report/', MonthlyWorkReportView.as_view(), name='monthly-work-report'),
+    path('exports/attendances/', AttendanceExportView.as_view(), name='export-attendances'),
+    path('exports/leave-requests/', LeaveRequestExportView.as_view(), name='export-leave-requests'),
+    path('exports/monthly-work-report/', MonthlyWorkReportExportView.as_view(), name='export-monthly-work-report'),
+    re_path(r'^imports/(?P<kind>employees|attendances)/$', ImportView.as_view(), name='import'),
 ]
\ No newline at end of file
@@ -1,7 +1,19 @@
+from datetime import datetime, timedelta
+
+import asyncio
+
+import redis
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
+from django.conf import settings
+from django.utils import timezone
+
 from .constants import create_notification
 
+ADMINS_GROUP = 'admins'
+
+_redis_client = None
+
 
 def send_notification(user_id, message, notif_type='info'):
     channel_layer = get_channel_layer()
@@ -12,4 +24,65 @@ def send_notification(user_id, message, notif_type='info'):
             'type': 'send_notification',
             'message': notification,
         }
-    )
\ No newline at end of file
+    )
+
+
+def send_notifications(notifications):
+    """Send many ``{user_id, message, notif_type}`` notifications in one event loop pass."""
+    channel_layer = get_channel_layer()
+
+    async def send_all():
+        await asyncio.gather(*[
+            channel_layer.group_send(
+                f'user_{item["user_id"]}',
+                {
+                    'type': 'send_notification',
+                    'message': create_notification(
+                        message=item['message'],
+                        notif_type=item.get('notif_type', 'info'),
+                    ),
+                },
+            )
+            for item in notifications
+        ])
+
+    async_to_sync(send_all)()
+
+
+def send_admin_notification(message, notif_type='info'):
+    """Send one message to every connected admin through the shared admins group."""
+    channel_layer = get_channel_layer()
+    notification = create_notification(message=message, notif_type=notif_type)
+    async_to_sync(channel_layer.group_send)(
+        ADMINS_GROUP,
+        {
+            'type': 'send_notification',
+            'message': notification,
+        }
+    )
+
+
+def get_redis():
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(settings.REDIS_URL)
+    return _redis_client
+
+
+def date_range_bounds(start_date, end_date):
+    """Return timezone-aware half-open [start, end) bounds covering both dates."""
+    start = timezone.make_aware(datetime.combine(start_date, datetime.min.time()))
+    end = timezone.make_aware(
+        datetime.combine(end_date + timedelta(days=1), datetime.min.time())
+    )
+    return start, end
+
+
+def month_date_range(year, month):
+    """Return the first and last day of the given month."""
+    first_day = datetime(year, month, 1).date()
+    if month == 12:
+        next_month = datetime(year + 1, 1, 1).date()
+    else:
+        next_month = datetime(year, month + 1, 1).date()
+    return first_day, next_month - timedelta(days=1)
@@ -1,8 +1,22 @@
-from datetime import datetime, time
+import hashlib
+import json
+from calendar import timegm
+from datetime import timedelta
 from django.utils import timezone
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date, quote_etag
+from django.utils.dateparse import parse_date
 from django.contrib.auth import authenticate
-from django.db.models import F, Sum, ExpressionWrapper
-from django.db.models.fields import DurationField
+from django.db import IntegrityError, transaction
+from django.db.models import Avg, Count, F, Q, Sum, Value
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import FileResponse
 
 from rest_framework.permissions import IsAdminUser, AllowAny
 from rest_framework.views import APIView
@@ -10,24 +24,143 @@ from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.generics import ListAPIView
+from rest_framework.parsers import MultiPartParser
+from rest_framework.filters import OrderingFilter
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import serializers
 from rest_framework.authtoken.models import Token
 
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
-from api.tasks import send_late_arrival_notification_task
-from api.utils import send_notification
+from api.tasks import (
+    send_late_arrival_notification_task,
+    generate_report_task,
+    import_data_task,
+    recompute_lateness_task,
+)
+from api.notifications import enqueue_notification, enqueue_notifications
+from api.utils import month_date_range
+from api.checkins import buffer_check_in, insert_check_in, is_check_in_pending
+from api.schedules import shift_for
+from api.workdays import (
+    get_calendar,
+    is_working_day,
+    within_calendar,
+    working_days_between,
+)
 
-from .models import User, Attendance, LeaveRequest
+from .models import (
+    User,
+    Attendance,
+    LeaveRequest,
+    DailyWorkSummary,
+    MonthlyWorkSummary,
+    Holiday,
+    WorkSchedule,
+    ReportJob,
+    ImportJob,
+)
+from .exports import EXPORT_CONTENT_TYPES, stream_export
+from .filters import AttendanceFilter, LeaveRequestFilter
+from .importers import IMPORT_FORMATS
+from .summaries import (
+    refresh_daily_summary,
+    report_cache_key,
+    report_cache_version,
+    work_day,
+)
+from .pagination import (
+    AttendanceCursorPagination,
+    EmployeeCursorPagination,
+    PendingLeaveCursorPagination,
+)
 from .serializers import (
     MonthlyWorkReportSerializer,
     UserSerializer,
     AttendanceSerializer,
     LeaveRequestSerializer,
+    LeaveRequestBulkActionSerializer,
+    LeaveOverlapQuerySerializer,
+    HolidaySerializer,
+    WorkScheduleSerializer,
+    LatenessRecomputeSerializer,
+    LEAVE_OVERLAP_ERROR,
+    CALENDAR_RANGE_ERROR,
+    LatenessStatsSerializer,
+    AttendanceListSerializer,
+    LeaveRequestListSerializer,
+    UserListSerializer,
+    ReportJobSerializer,
+    ReportRequestSerializer,
+    ImportJobSerializer,
+)
+
+from .constants import (
+    NOTIFICATION_TYPE_SUCCESS,
+    NOTIFICATION_TYPE_ERROR,
 )
 
-from .constants import NOTIFICATION_TYPE_SUCCESS, NOTIFICATION_TYPE_ERROR
+
+class ValuesListMixin:
+    """Serve ``list`` from a ``.values()`` queryset through ``list_serializer_class``."""
+
+    list_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        queryset = (
+            self.filter_queryset(self.get_queryset())
+            .select_related(None)
+            .prefetch_related(None)
+            .values(*self.list_serializer_class.values_fields)
+        )
+        page = self.paginate_queryset(queryset)
+        rows = page if page is not None else queryset
+        data = self.list_serializer_class(rows, context={"request": request}).data
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+
+def _etag(*parts):
+    digest = hashlib.md5(":".join(map(str, parts)).encode(), usedforsecurity=False)
+    return quote_etag(digest.hexdigest())
+
+
+def conditional_response(request, etag, last_modified=None):
+    """Return a 304 response when the client's validators still match, else ``None``."""
+    return get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=last_modified and timegm(last_modified.utctimetuple()),
+    )
+
+
+def set_validators(response, etag, last_modified=None):
+    response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(timegm(last_modified.utctimetuple()))
+    # Per-user data: browsers may keep it but must revalidate on every request
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ["Authorization"])
+    return response
+
+
+class ConditionalListMixin:
+    """Answer ``list`` with 304 Not Modified while the page is unchanged.
+
+    The ETag hashes the serialized page, so it costs nothing beyond the page
+    query and covers related fields such as ``user__username``. A 304 saves
+    the transfer, not the query.
+    """
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        etag = _etag(
+            request.user.pk,
+            json.dumps(response.data, sort_keys=True, cls=DjangoJSONEncoder),
+        )
+        return set_validators(conditional_response(request, etag) or response, etag)
 
 
 class LoginView(APIView):
@@ -92,13 +225,76 @@ class ObtainUserView(APIView):
     def get(self, request):
         user = request.user
         serializer = UserSerializer(user)
-        return Response(serializer.data)
+        # The dashboard shows this total but only loads the first attendance page
+        attendance_days = Attendance.objects.filter(user=user).count()
+        return Response({**serializer.data, "attendance_days": attendance_days})
+
+
+class IdempotencyKeyMixin:
+    """Replay the stored response when a client retries with the same Idempotency-Key.
+
+    The key is reserved with ``cache.add`` before the handler runs, so a retry
+    that arrives while the first request is still running gets a 409 instead
+    of running the handler twice. Only successful responses are stored; after
+    a failure the reservation is released and a retry is evaluated again.
+    """
+
+    idempotency_scope = None
+    # Seconds a reservation survives a worker that died mid-request
+    idempotency_reservation_ttl = 60
+    IN_PROGRESS = "in-progress"
+
+    def idempotent(self, request, handler):
+        key = request.headers.get("Idempotency-Key")
+        if not key:
+            return handler(request)
+        if len(key) > 255:
+            return Response(
+                {"error": "Geçersiz Idempotency-Key."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        cache_key = f"idempotency:{self.idempotency_scope}:{request.user.pk}:{key}"
+        if not cache.add(cache_key, self.IN_PROGRESS, self.idempotency_reservation_ttl):
+            stored = cache.get(cache_key)
+            if stored is None or stored == self.IN_PROGRESS:
+                return Response(
+                    {"error": "Bu istek hâlâ işleniyor, lütfen tekrar deneyin."},
+                    status=status.HTTP_409_CONFLICT,
+                )
+            response = Response(stored["data"], status=stored["status"])
+            response["Idempotent-Replayed"] = "true"
+            return response
+
+        try:
+            response = handler(request)
+        except Exception:
+            cache.delete(cache_key)
+            raise
+        if status.is_success(response.status_code):
+            cache.set(
+                cache_key,
+                {"data": response.data, "status": response.status_code},
+                settings.IDEMPOTENCY_KEY_TTL,
+            )
+        else:
+            cache.delete(cache_key)
+        return response
 
 
-class CheckInView(APIView):
+class CheckInView(IdempotencyKeyMixin, APIView):
+    idempotency_scope = "check-in"
 
     @swagger_auto_schema(
         operation_description="Katılım için check-in yap.",
+        manual_parameters=[
+            openapi.Parameter(
+                "Idempotency-Key",
+                openapi.IN_HEADER,
+                description="Yeniden denemelerde aynı yanıtı almak için istemci anahtarı",
+                type=openapi.TYPE_STRING,
+            ),
+        ],
         responses={
             200: openapi.Response(
                 "Başarı",
@@ -115,65 +311,86 @@ class CheckInView(APIView):
                 ),
             ),
             401: "Yetkisiz.",
+            409: "Aynı Idempotency-Key ile gönderilen istek hâlâ işleniyor.",
         },
     )
     def post(self, request):
+        return self.idempotent(request, self.check_in)
+
+    def check_in(self, request):
         user = request.user
         now = timezone.now()
-        today = now.date()
+        shift = shift_for(user)
+        today = shift.local_date(now)
 
-        if today.weekday() >= 5:
+        if not is_working_day(today):
             return Response(
-                {"error": "Bugün hafta sonu!"}, status=status.HTTP_400_BAD_REQUEST
+                {"error": "Bugün çalışma günü değil!"},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-        company_start_time = datetime.combine(today, time(8, 0, 0))
-        company_start_time = timezone.make_aware(company_start_time)
-        company_end_time = datetime.combine(today, time(18, 0, 0))
-        company_end_time = timezone.make_aware(company_end_time)
+        shift_start, shift_end = shift.bounds(today)
 
-        if now > company_end_time:
-            _attendance.end_time = now
-            _attendance.save()
+        if now > shift_end:
             return Response(
                 {"error": "Çalışma saatleri dışında check-in yapamazsınız!"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        if now < company_start_time:
+        if now < shift_start:
             return Response(
                 {"error": "Çalışma saatlerine henüz başlamadınız!"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        attendance_exists = Attendance.objects.filter(user=user, date=today).exists()
-        if attendance_exists:
+        if settings.CHECK_IN_FAST_PATH:
+            try:
+                recorded = buffer_check_in(user.id, now, today)
+            except Exception as e:
+                # Redis unavailable: fall through to the direct database write
+                print(f"Check-in buffering failed: {e}")
+            else:
+                if not recorded:
+                    return Response(
+                        {"error": "Bugün zaten check-in yaptınız!"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                return Response(
+                    {"message": "Check-in başarılı!"}, status=status.HTTP_200_OK
+                )
+
+        # One INSERT ... ON CONFLICT DO NOTHING RETURNING: the (user, date)
+        # unique constraint decides, and concurrent double-clicks get a 400.
+        late_minutes = shift.late_minutes(now)
+        if not insert_check_in(user.id, now, today, late_minutes):
             return Response(
                 {"error": "Bugün zaten check-in yaptınız!"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        _attendance = Attendance.objects.create(user=user, start_time=now, date=today)
-
-        if now > company_start_time:
-            delta = now - company_start_time
-            late_minutes = int(delta.total_seconds() / 60)
+        if late_minutes > 0:
+            late_days = late_minutes / shift.minutes_per_day
 
-            work_hours_per_day = 10
-            late_days = late_minutes / (work_hours_per_day * 60)
-
-            user.annual_leave_days = max(0, user.annual_leave_days - late_days)
-            user.save()
+            user.deduct_leave_days(late_days)
 
             send_late_arrival_notification_task.delay(user.id, late_minutes)
 
         return Response({"message": "Check-in başarılı!"}, status=status.HTTP_200_OK)
 
 
-class CheckOutView(APIView):
+class CheckOutView(IdempotencyKeyMixin, APIView):
+    idempotency_scope = "check-out"
 
     @swagger_auto_schema(
         operation_description="Katılım için check-out yap.",
+        manual_parameters=[
+            openapi.Parameter(
+                "Idempotency-Key",
+                openapi.IN_HEADER,
+                description="Yeniden denemelerde aynı yanıtı almak için istemci anahtarı",
+                type=openapi.TYPE_STRING,
+            ),
+        ],
         responses={
             200: openapi.Response(
                 "Başarı",
@@ -190,34 +407,62 @@ class CheckOutView(APIView):
                 ),
             ),
             401: "Yetkisiz.",
+            409: "Check-in henüz işleniyor ya da aynı Idempotency-Key ile gönderilen istek hâlâ işleniyor.",
         },
     )
     def post(self, request):
+        return self.idempotent(request, self.check_out)
+
+    def check_out(self, request):
         user = request.user
         now = timezone.now()
-        today = now.date()
+        shift = shift_for(user)
+        today = shift.local_date(now)
 
-        try:
-            attendance = Attendance.objects.get(
+        with transaction.atomic():
+            # One conditional UPDATE closes the open session; a repeated
+            # check-out matches no row.
+            closed = Attendance.objects.filter(
                 user=user, date=today, end_time__isnull=True
+            ).update(
+                end_time=now,
+                work_duration=Value(now) - F("start_time"),
+                updated_at=now,
             )
-
-            attendance.end_time = now
-            attendance.save()
-
+            if closed:
+                # update() sends no post_save, so refresh the rollups here. The
+                # session started within today's shift, which may straddle two
+                # company-local days.
+                for day in {work_day(moment) for moment in shift.bounds(today)}:
+                    refresh_daily_summary(user.id, day)
+
+        if closed:
             return Response(
                 {"message": "Check-out başarılı!"}, status=status.HTTP_200_OK
             )
-        except Attendance.DoesNotExist:
+        if (
+            settings.CHECK_IN_FAST_PATH
+            and not Attendance.objects.filter(user=user, date=today).exists()
+            and is_check_in_pending(user.id, today)
+        ):
             return Response(
-                {"error": "Bugün check-in yapmadınız!"},
-                status=status.HTTP_400_BAD_REQUEST,
+                {"error": "Check-in kaydınız henüz işleniyor, lütfen tekrar deneyin."},
+                status=status.HTTP_409_CONFLICT,
             )
+        return Response(
+            {"error": "Bugün check-in yapmadınız!"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
 
 
-class AttendanceViewSet(viewsets.ModelViewSet):
-    queryset = Attendance.objects.all()
+class AttendanceViewSet(ConditionalListMixin, ValuesListMixin, viewsets.ModelViewSet):
+    queryset = Attendance.objects.select_related("user")
     serializer_class = AttendanceSerializer
+    list_serializer_class = AttendanceListSerializer
+    pagination_class = AttendanceCursorPagination
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_class = AttendanceFilter
+    ordering_fields = ["start_time", "date"]
 
     @swagger_auto_schema(
         operation_description="Tüm katılım kayıtlarını listele.",
@@ -231,15 +476,19 @@ class AttendanceViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
+        queryset = Attendance.objects.select_related("user")
         if user.is_staff or user.is_superuser:
-            return Attendance.objects.all()
-        return Attendance.objects.filter(user=user)
+            return queryset
+        return queryset.filter(user=user)
 
 
-class LeaveRequestViewSet(viewsets.ModelViewSet):
-    queryset = LeaveRequest.objects.all()
+class LeaveRequestViewSet(ConditionalListMixin, ValuesListMixin, viewsets.ModelViewSet):
+    queryset = LeaveRequest.objects.select_related("user")
     serializer_class = LeaveRequestSerializer
-    filterset_fields = ["status"]
+    list_serializer_class = LeaveRequestListSerializer
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_class = LeaveRequestFilter
+    ordering_fields = ["start_date", "end_date", "id"]
 
     @swagger_auto_schema(
         operation_description="Tüm izin taleplerini listele.",
@@ -253,9 +502,10 @@ class LeaveRequestViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
+        queryset = LeaveRequest.objects.select_related("user")
         if user.is_staff or user.is_superuser:
-            return LeaveRequest.objects.all()
-        return LeaveRequest.objects.filter(user=user)
+            return queryset
+        return queryset.filter(user=user)
 
     @swagger_auto_schema(
         operation_description="Yeni bir izin talebi oluştur.",
@@ -283,19 +533,76 @@ class LeaveRequestViewSet(viewsets.ModelViewSet):
         user = serializer.validated_data["user"]
         start_date = serializer.validated_data["start_date"]
         end_date = serializer.validated_data["end_date"]
-        total_days = (end_date - start_date).days + 1
+        total_days = working_days_between(start_date, end_date)
 
+        if not total_days:
+            raise serializers.ValidationError(
+                {"detail": "Seçilen tarih aralığında iş günü yok."}
+            )
         if total_days > user.annual_leave_days:
             raise serializers.ValidationError(
                 {"detail": "Yeterli yıllık izin gününüz yok."}
             )
 
         status_value = serializer.validated_data.get("status", "PENDING")
-        serializer.save(user=user, status=status_value)
+        try:
+            with transaction.atomic():
+                serializer.save(user=user, status=status_value)
+
+                if self.request.user.is_staff or self.request.user.is_superuser:
+                    user.deduct_leave_days(total_days)
+        except IntegrityError:
+            # A concurrent request won the race; the exclusion constraint on
+            # PostgreSQL (or unique_together elsewhere) rejected this one.
+            raise serializers.ValidationError({"detail": LEAVE_OVERLAP_ERROR})
+
+    def perform_update(self, serializer):
+        # PUT and PATCH race the same way as create
+        try:
+            with transaction.atomic():
+                serializer.save()
+        except IntegrityError:
+            raise serializers.ValidationError({"detail": LEAVE_OVERLAP_ERROR})
 
-        if self.request.user.is_staff or self.request.user.is_superuser:
-            user.annual_leave_days = max(0, user.annual_leave_days - total_days)
-            user.save()
+    @swagger_auto_schema(
+        operation_description="Verilen tarih aralığının mevcut izin talepleriyle "
+        "çakışıp çakışmadığını kontrol et.",
+        query_serializer=LeaveOverlapQuerySerializer,
+        responses={
+            200: openapi.Response(
+                "Çakışma sonucu",
+                openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "overlaps": openapi.Schema(type=openapi.TYPE_BOOLEAN),
+                        "conflicts": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(type=openapi.TYPE_OBJECT),
+                        ),
+                    },
+                ),
+            ),
+            400: "Hata",
+            401: "Yetkisiz.",
+        },
+    )
+    @action(detail=False, methods=["GET"], url_path="overlaps")
+    def overlaps(self, request):
+        query = LeaveOverlapQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        user = request.user
+        if request.user.is_staff or request.user.is_superuser:
+            user = query.validated_data.get("user", user)
+
+        conflicts = (
+            LeaveRequest.objects.filter(user=user)
+            .active()
+            .overlapping(query.validated_data["start_date"], query.validated_data["end_date"])
+            .order_by("start_date")
+            .values(*LeaveRequestListSerializer.values_fields)
+        )
+        data = LeaveRequestListSerializer(conflicts, context={"request": request}).data
+        return Response({"overlaps": bool(data), "conflicts": data})
 
     @swagger_auto_schema(
         operation_description="Bir izin talebini onayla.",
@@ -308,27 +615,31 @@ class LeaveRequestViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["POST"], permission_classes=[IsAdminUser])
     def approve(self, request, pk=None):
         leave_request = self.get_object()
-
-        if leave_request.status != "PENDING":
+        if not within_calendar(leave_request.start_date, leave_request.end_date):
             return Response(
-                {"detail": "Bu izin talebi zaten işlendi."},
-                status=status.HTTP_400_BAD_REQUEST,
+                {"detail": CALENDAR_RANGE_ERROR}, status=status.HTTP_400_BAD_REQUEST
+            )
+        total_days = working_days_between(leave_request.start_date, leave_request.end_date)
+
+        with transaction.atomic():
+            # Conditional UPDATE so two admins cannot approve the same request twice
+            updated = LeaveRequest.objects.filter(
+                pk=leave_request.pk, status="PENDING"
+            ).update(status="APPROVED", updated_at=timezone.now())
+            if not updated:
+                return Response(
+                    {"detail": "Bu izin talebi zaten işlendi."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            user = leave_request.user
+            user.deduct_leave_days(total_days)
+
+            enqueue_notification(
+                user_id=user.id,
+                message=f"İzin talebiniz onaylandı: {leave_request.start_date} - {leave_request.end_date}",
+                notif_type=NOTIFICATION_TYPE_SUCCESS,
             )
-
-        total_days = (leave_request.end_date - leave_request.start_date).days + 1
-
-        leave_request.status = "APPROVED"
-        leave_request.save()
-
-        user = leave_request.user
-        user.annual_leave_days = max(0, user.annual_leave_days - total_days)
-        user.save()
-
-        send_notification(
-            user_id=user.id,
-            message=f"İzin talebiniz onaylandı: {leave_request.start_date} - {leave_request.end_date}",
-            notif_type=NOTIFICATION_TYPE_SUCCESS,
-        )
 
         return Response({"detail": "İzin talebi onaylandı."}, status=status.HTTP_200_OK)
 
@@ -343,32 +654,151 @@ class LeaveRequestViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["post"], url_path="reject")
     def reject(self, request, pk=None):
         leave_request = self.get_object()
-        if leave_request.status != "PENDING":
+        updated = LeaveRequest.objects.filter(
+            pk=leave_request.pk, status="PENDING"
+        ).update(status="REJECTED", updated_at=timezone.now())
+        if not updated:
             return Response(
                 {"detail": "Bu izin talebi zaten işlendi."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        leave_request.status = "REJECTED"
-        leave_request.save()
-
-        send_notification(
-            user_id=leave_request.user.id,
+        enqueue_notification(
+            user_id=leave_request.user_id,
             message=f"İzin talebiniz reddedildi: {leave_request.start_date} - {leave_request.end_date}",
-            notif_type="error",
+            notif_type=NOTIFICATION_TYPE_ERROR,
         )
 
         return Response(
             {"detail": "İzin talebi reddedildi."}, status=status.HTTP_200_OK
         )
 
+    @swagger_auto_schema(
+        operation_description="Birden fazla izin talebini tek seferde onayla veya reddet.",
+        request_body=LeaveRequestBulkActionSerializer,
+        responses={
+            200: openapi.Response(
+                "Her talep için sonuç",
+                openapi.Schema(
+                    type=openapi.TYPE_OBJECT,
+                    properties={
+                        "results": openapi.Schema(
+                            type=openapi.TYPE_ARRAY,
+                            items=openapi.Schema(
+                                type=openapi.TYPE_OBJECT,
+                                properties={
+                                    "id": openapi.Schema(type=openapi.TYPE_INTEGER),
+                                    "success": openapi.Schema(type=openapi.TYPE_BOOLEAN),
+                                    "error": openapi.Schema(type=openapi.TYPE_STRING),
+                                },
+                            ),
+                        )
+                    },
+                ),
+            ),
+            400: "Hata",
+            401: "Yetkisiz.",
+        },
+    )
+    @action(detail=False, methods=["POST"], url_path="bulk", permission_classes=[IsAdminUser])
+    def bulk(self, request):
+        serializer = LeaveRequestBulkActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = list(dict.fromkeys(serializer.validated_data["ids"]))
+        approve = serializer.validated_data["action"] == "approve"
+
+        results = {}
+        notifications = []
+        with transaction.atomic():
+            leave_requests = (
+                LeaveRequest.objects.select_for_update()
+                .filter(id__in=ids)
+                .values("id", "user_id", "start_date", "end_date", "status")
+            )
+            pending = []
+            for leave_request in leave_requests:
+                if leave_request["status"] != "PENDING":
+                    results[leave_request["id"]] = "Bu izin talebi zaten işlendi."
+                elif approve and not within_calendar(
+                    leave_request["start_date"], leave_request["end_date"]
+                ):
+                    results[leave_request["id"]] = CALENDAR_RANGE_ERROR
+                else:
+                    pending.append(leave_request)
+
+            LeaveRequest.objects.filter(
+                id__in=[leave_request["id"] for leave_request in pending]
+            ).update(
+                status="APPROVED" if approve else "REJECTED",
+                updated_at=timezone.now(),
+            )
 
-class LateArrivalsView(ListAPIView):
+            days_by_user = {}
+            calendar = get_calendar() if approve and pending else None
+            for leave_request in pending:
+                results[leave_request["id"]] = None
+                period = f"{leave_request['start_date']} - {leave_request['end_date']}"
+                if approve:
+                    total_days = calendar.working_days_between(
+                        leave_request["start_date"], leave_request["end_date"]
+                    )
+                    user_id = leave_request["user_id"]
+                    days_by_user[user_id] = days_by_user.get(user_id, 0) + total_days
+                    notifications.append(
+                        {
+                            "user_id": user_id,
+                            "message": f"İzin talebiniz onaylandı: {period}",
+                            "notif_type": NOTIFICATION_TYPE_SUCCESS,
+                        }
+                    )
+                else:
+                    notifications.append(
+                        {
+                            "user_id": leave_request["user_id"],
+                            "message": f"İzin talebiniz reddedildi: {period}",
+                            "notif_type": NOTIFICATION_TYPE_ERROR,
+                        }
+                    )
+
+            User.bulk_deduct_leave_days(days_by_user)
+
+            enqueue_notifications(notifications)
+
+        response = []
+        for leave_request_id in ids:
+            if leave_request_id not in results:
+                response.append(
+                    {
+                        "id": leave_request_id,
+                        "success": False,
+                        "error": "İzin talebi bulunamadı.",
+                    }
+                )
+            elif results[leave_request_id]:
+                response.append(
+                    {
+                        "id": leave_request_id,
+                        "success": False,
+                        "error": results[leave_request_id],
+                    }
+                )
+            else:
+                response.append({"id": leave_request_id, "success": True})
+
+        return Response({"results": response}, status=status.HTTP_200_OK)
+
+
+class LateArrivalsView(ConditionalListMixin, ValuesListMixin, ListAPIView):
     permission_classes = [IsAdminUser]
     serializer_class = AttendanceSerializer
+    list_serializer_class = AttendanceListSerializer
+    pagination_class = AttendanceCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = AttendanceFilter
 
     @swagger_auto_schema(
-        operation_description="Tüm geç gelen kayıtları listele.",
+        operation_description="Geç gelen kayıtları listele. Tarih aralığı verilmezse "
+        "bugünün kayıtları döner.",
         responses={
             200: AttendanceSerializer(many=True),
             401: "Yetkisiz.",
@@ -378,13 +808,86 @@ class LateArrivalsView(ListAPIView):
         return super().get(request, *args, **kwargs)
 
     def get_queryset(self):
-        company_start_time = timezone.localtime().replace(hour=8, minute=0, second=0)
-        return Attendance.objects.filter(start_time__gt=company_start_time)
+        queryset = Attendance.objects.select_related("user").filter(late_minutes__gt=0)
+        params = self.request.query_params
+        if "date_from" not in params and "date_to" not in params:
+            queryset = queryset.filter(date=timezone.localdate())
+        return queryset
+
+
+class LatenessStatsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_description="Çalışan bazında geç kalma istatistiklerini al. Tarih "
+        "aralığı verilmezse içinde bulunulan ay kullanılır.",
+        manual_parameters=[
+            openapi.Parameter(
+                "from",
+                openapi.IN_QUERY,
+                description="Başlangıç tarihi (YYYY-MM-DD)",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "to",
+                openapi.IN_QUERY,
+                description="Bitiş tarihi, dahil (YYYY-MM-DD)",
+                type=openapi.TYPE_STRING,
+            ),
+        ],
+        responses={
+            200: LatenessStatsSerializer(many=True),
+            400: "Geçersiz İstek",
+            401: "Yetkisiz",
+        },
+    )
+    def get(self, request):
+        today = timezone.localdate()
+        default_start, default_end = month_date_range(today.year, today.month)
+        try:
+            start_date = parse_date(request.query_params.get("from", "")) or default_start
+            end_date = parse_date(request.query_params.get("to", "")) or default_end
+        except ValueError:
+            start_date = end_date = None
+        if not start_date or not end_date or start_date > end_date:
+            return Response(
+                {"error": "Geçersiz tarih aralığı parametreleri."}, status=400
+            )
+
+        stats = (
+            Attendance.objects.filter(
+                late_minutes__gt=0, date__range=(start_date, end_date)
+            )
+            .values("user_id", "user__username")
+            .annotate(
+                late_count=Count("id"),
+                total_late_minutes=Sum("late_minutes"),
+                average_late_minutes=Avg("late_minutes"),
+            )
+            .order_by("-total_late_minutes")
+        )
+
+        serializer = LatenessStatsSerializer(
+            [
+                {
+                    "user_id": entry["user_id"],
+                    "username": entry["user__username"],
+                    "late_count": entry["late_count"],
+                    "total_late_minutes": entry["total_late_minutes"],
+                    "average_late_minutes": round(entry["average_late_minutes"], 1),
+                }
+                for entry in stats
+            ],
+            many=True,
+        )
+        return Response(serializer.data, status=200)
 
 
-class PendingLeavesView(ListAPIView):
+class PendingLeavesView(ConditionalListMixin, ValuesListMixin, ListAPIView):
     permission_classes = [IsAdminUser]
     serializer_class = LeaveRequestSerializer
+    list_serializer_class = LeaveRequestListSerializer
+    pagination_class = PendingLeaveCursorPagination
 
     @swagger_auto_schema(
         operation_description="Tüm bekleyen izin taleplerini listele.",
@@ -397,13 +900,151 @@ class PendingLeavesView(ListAPIView):
         return super().get(request, *args, **kwargs)
 
     def get_queryset(self):
-        return LeaveRequest.objects.filter(status="PENDING")
+        return LeaveRequest.objects.select_related("user").filter(status="PENDING")
+
+
+class OnLeaveView(ConditionalListMixin, ValuesListMixin, ListAPIView):
+    permission_classes = [IsAdminUser]
+    serializer_class = LeaveRequestSerializer
+    list_serializer_class = LeaveRequestListSerializer
+    pagination_class = PendingLeaveCursorPagination
+
+    @swagger_auto_schema(
+        operation_description="Verilen tarih aralığında izinde olan çalışanları listele. "
+        "Tarih verilmezse bugün kullanılır.",
+        manual_parameters=[
+            openapi.Parameter(
+                "from",
+                openapi.IN_QUERY,
+                description="Başlangıç tarihi (YYYY-MM-DD)",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "to",
+                openapi.IN_QUERY,
+                description="Bitiş tarihi, dahil (YYYY-MM-DD)",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "include_pending",
+                openapi.IN_QUERY,
+                description="Bekleyen talepleri de dahil et",
+                type=openapi.TYPE_BOOLEAN,
+            ),
+        ],
+        responses={
+            200: LeaveRequestSerializer(many=True),
+            400: "Geçersiz İstek",
+            401: "Yetkisiz.",
+        },
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def get_queryset(self):
+        params = self.request.query_params
+        today = timezone.localdate()
+        try:
+            start_date = parse_date(params.get("from", "")) or today
+            end_date = parse_date(params.get("to", "")) or start_date
+        except ValueError:
+            start_date = end_date = None
+        if not start_date or not end_date or start_date > end_date:
+            raise serializers.ValidationError(
+                {"error": "Geçersiz tarih aralığı parametreleri."}
+            )
+
+        queryset = LeaveRequest.objects.active().overlapping(start_date, end_date)
+        if params.get("include_pending", "").lower() not in ("1", "true"):
+            queryset = queryset.filter(status="APPROVED")
+        return queryset
 
 
-class EmployeeViewSet(viewsets.ModelViewSet):
-    queryset = User.objects.filter(is_employee=True)
+class HolidayViewSet(viewsets.ModelViewSet):
+    queryset = Holiday.objects.all()
+    serializer_class = HolidaySerializer
+
+    def get_permissions(self):
+        # Everyone can see the calendar; only admins maintain it
+        if self.request.method in ("GET", "HEAD", "OPTIONS"):
+            return super().get_permissions()
+        return [IsAdminUser()]
+
+    @swagger_auto_schema(
+        operation_description="Resmi tatilleri ve şirket tatillerini listele.",
+        manual_parameters=[
+            openapi.Parameter(
+                "year",
+                openapi.IN_QUERY,
+                description="Yalnızca bu yılın tatilleri",
+                type=openapi.TYPE_INTEGER,
+            ),
+        ],
+        responses={
+            200: HolidaySerializer(many=True),
+            401: "Yetkisiz.",
+        },
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    def get_queryset(self):
+        queryset = Holiday.objects.all()
+        year = self.request.query_params.get("year")
+        if year and year.isdigit():
+            queryset = queryset.filter(date__year=int(year))
+        return queryset
+
+
+class WorkScheduleViewSet(viewsets.ModelViewSet):
+    queryset = WorkSchedule.objects.all()
+    serializer_class = WorkScheduleSerializer
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_description="Çalışma programlarını listele.",
+        responses={
+            200: WorkScheduleSerializer(many=True),
+            401: "Yetkisiz.",
+        },
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @swagger_auto_schema(
+        operation_description="Programa bağlı çalışanların geç kalma dakikalarını "
+        "arka planda yeniden hesapla. Düşülen izin günleri değişmez.",
+        request_body=LatenessRecomputeSerializer,
+        responses={
+            202: "Yeniden hesaplama kuyruğa alındı.",
+            400: "Hata",
+            401: "Yetkisiz.",
+        },
+    )
+    @action(detail=True, methods=["POST"], url_path="recompute-lateness")
+    def recompute_lateness(self, request, pk=None):
+        schedule = self.get_object()
+        serializer = LatenessRecomputeSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        start_date = serializer.validated_data.get("start_date")
+
+        recompute_lateness_task.delay(
+            schedule.id, start_date.isoformat() if start_date else None
+        )
+        return Response(
+            {"detail": "Yeniden hesaplama kuyruğa alındı."},
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class EmployeeViewSet(ValuesListMixin, viewsets.ModelViewSet):
+    queryset = User.objects.filter(is_employee=True).prefetch_related(
+        "groups", "user_permissions"
+    )
     serializer_class = UserSerializer
+    list_serializer_class = UserListSerializer
     permission_classes = [IsAdminUser]
+    pagination_class = EmployeeCursorPagination
 
     @swagger_auto_schema(
         operation_description="Tüm çalışanları listele.",
@@ -452,6 +1093,18 @@ class MonthlyWorkReportView(APIView):
                 description="Rapor için yıl (örneğin, 2024)",
                 type=openapi.TYPE_INTEGER,
             ),
+            openapi.Parameter(
+                "from",
+                openapi.IN_QUERY,
+                description="Aralık başlangıç tarihi (YYYY-MM-DD, ay/yıl yerine)",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                "to",
+                openapi.IN_QUERY,
+                description="Aralık bitiş tarihi, dahil (YYYY-MM-DD)",
+                type=openapi.TYPE_STRING,
+            ),
         ],
         responses={
             200: MonthlyWorkReportSerializer(many=True),
@@ -462,48 +1115,390 @@ class MonthlyWorkReportView(APIView):
     def get(self, request, _format=None):
         month = request.query_params.get("month")
         year = request.query_params.get("year")
+        date_from = request.query_params.get("from")
+        date_to = request.query_params.get("to")
+
+        if date_from or date_to:
+            try:
+                start_date = parse_date(date_from or "")
+                end_date = parse_date(date_to or "")
+            except ValueError:
+                start_date = end_date = None
+            if not start_date or not end_date or start_date > end_date:
+                return Response(
+                    {"error": "Geçersiz tarih aralığı parametreleri."}, status=400
+                )
+            month = year = None
+        else:
+            if not month or not year:
+                return Response(
+                    {"error": "Ay ve yıl parametreleri gereklidir."}, status=400
+                )
+
+            try:
+                month = int(month)
+                year = int(year)
+                if month < 1 or month > 12:
+                    raise ValueError
+                start_date, end_date = month_date_range(year, month)
+            except ValueError:
+                return Response(
+                    {"error": "Geçersiz ay veya yıl parametreleri."}, status=400
+                )
+
+        if not within_calendar(start_date, end_date):
+            return Response({"error": CALENDAR_RANGE_ERROR}, status=400)
+
+        # Past periods no longer change except through corrections, which bump
+        # the cache version from refresh_daily_summary.
+        cache_key = None
+        if end_date < timezone.localdate():
+            cache_key = report_cache_key(start_date, end_date)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return self.report_response(request, cached["data"], cached["etag"])
+
+        # Reports read the rollups maintained on check-out instead of
+        # re-aggregating raw attendance rows.
+        if month:
+            report_data = MonthlyWorkSummary.objects.filter(
+                year=year, month=month, total_seconds__gt=0
+            ).values("user_id", "user__username", "total_seconds")
+        else:
+            report_data = (
+                DailyWorkSummary.objects.filter(date__range=(start_date, end_date))
+                .values("user_id", "user__username")
+                .annotate(total_seconds=Sum("total_seconds"))
+                .filter(total_seconds__gt=0)
+                .order_by()
+            )
 
-        if not month or not year:
-            return Response(
-                {"error": "Ay ve yıl parametreleri gereklidir."}, status=400
+        working_days = working_days_between(start_date, end_date)
+        reports = []
+        for entry in report_data:
+            total_hours = entry["total_seconds"] / 3600
+            reports.append(
+                {
+                    "user_id": entry["user_id"],
+                    "username": entry["user__username"],
+                    "month": month,
+                    "year": year,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "total_work_hours": round(total_hours, 2),
+                    "working_days": working_days,
+                }
             )
 
-        try:
-            month = int(month)
-            year = int(year)
-            if month < 1 or month > 12:
-                raise ValueError
-        except ValueError:
-            return Response(
-                {"error": "Geçersiz ay veya yıl parametreleri."}, status=400
+        data = MonthlyWorkReportSerializer(reports, many=True).data
+        etag = _etag(json.dumps(data, sort_keys=True, cls=DjangoJSONEncoder))
+        if cache_key:
+            cache.set(
+                cache_key,
+                {"data": list(data), "etag": etag},
+                settings.WORK_REPORT_CACHE_TTL,
             )
+        return self.report_response(request, data, etag)
+
+    def report_response(self, request, data, etag):
+        response = conditional_response(request, etag)
+        if response is None:
+            response = Response(data, status=200)
+        return set_validators(response, etag)
+
+
+class BaseExportView(APIView):
+    permission_classes = [IsAdminUser]
+    export_parameters = [
+        openapi.Parameter(
+            "output",
+            openapi.IN_QUERY,
+            description="Çıktı biçimi: csv (varsayılan) veya ndjson",
+            type=openapi.TYPE_STRING,
+        ),
+        openapi.Parameter(
+            "from",
+            openapi.IN_QUERY,
+            description="Başlangıç tarihi (YYYY-MM-DD)",
+            type=openapi.TYPE_STRING,
+        ),
+        openapi.Parameter(
+            "to",
+            openapi.IN_QUERY,
+            description="Bitiş tarihi, dahil (YYYY-MM-DD)",
+            type=openapi.TYPE_STRING,
+        ),
+    ]
+
+    def get_export_params(self, request):
+        output_format = request.query_params.get("output", "csv")
+        if output_format not in EXPORT_CONTENT_TYPES:
+            raise serializers.ValidationError(
+                {"error": "Geçersiz çıktı biçimi. csv veya ndjson kullanın."}
+            )
+
+        dates = []
+        for name in ("from", "to"):
+            value = request.query_params.get(name)
+            try:
+                parsed = parse_date(value) if value else None
+            except ValueError:
+                parsed = None
+            if value and parsed is None:
+                raise serializers.ValidationError(
+                    {"error": "Geçersiz tarih aralığı parametreleri."}
+                )
+            dates.append(parsed)
+
+        return output_format, dates[0], dates[1]
+
+
+class AttendanceExportView(BaseExportView):
+
+    @swagger_auto_schema(
+        operation_description="Katılım kayıtlarını CSV/NDJSON olarak akış halinde dışa aktar.",
+        manual_parameters=BaseExportView.export_parameters,
+        responses={200: "Dosya akışı", 400: "Geçersiz İstek", 401: "Yetkisiz"},
+    )
+    def get(self, request):
+        output_format, start_date, end_date = self.get_export_params(request)
+
+        queryset = Attendance.objects.order_by("start_time", "id")
+        if start_date:
+            queryset = queryset.filter(date__gte=start_date)
+        if end_date:
+            queryset = queryset.filter(date__lte=end_date)
+
+        return stream_export(
+            queryset,
+            ["id", "user_id", "user__username", "date", "start_time", "end_time"],
+            output_format,
+            "attendances",
+            headers=["id", "user_id", "username", "date", "start_time", "end_time"],
+        )
+
+
+class LeaveRequestExportView(BaseExportView):
 
-        attendances = Attendance.objects.filter(
-            start_time__year=year, start_time__month=month, end_time__isnull=False
+    @swagger_auto_schema(
+        operation_description="İzin taleplerini CSV/NDJSON olarak akış halinde dışa aktar.",
+        manual_parameters=BaseExportView.export_parameters,
+        responses={200: "Dosya akışı", 400: "Geçersiz İstek", 401: "Yetkisiz"},
+    )
+    def get(self, request):
+        output_format, start_date, end_date = self.get_export_params(request)
+
+        queryset = LeaveRequest.objects.order_by("start_date", "id")
+        if start_date:
+            queryset = queryset.filter(end_date__gte=start_date)
+        if end_date:
+            queryset = queryset.filter(start_date__lte=end_date)
+
+        return stream_export(
+            queryset,
+            [
+                "id",
+                "user_id",
+                "user__username",
+                "start_date",
+                "end_date",
+                "status",
+                "reason",
+            ],
+            output_format,
+            "leave-requests",
+            headers=[
+                "id",
+                "user_id",
+                "username",
+                "start_date",
+                "end_date",
+                "status",
+                "reason",
+            ],
         )
 
-        attendances = attendances.annotate(
-            work_duration=ExpressionWrapper(
-                F("end_time") - F("start_time"), output_field=DurationField()
+
+class MonthlyWorkReportExportView(BaseExportView):
+
+    @swagger_auto_schema(
+        operation_description="Aylık çalışma raporlarını CSV/NDJSON olarak akış halinde dışa aktar.",
+        manual_parameters=BaseExportView.export_parameters,
+        responses={200: "Dosya akışı", 400: "Geçersiz İstek", 401: "Yetkisiz"},
+    )
+    def get(self, request):
+        output_format, start_date, end_date = self.get_export_params(request)
+
+        queryset = MonthlyWorkSummary.objects.filter(total_seconds__gt=0).order_by(
+            "year", "month", "user_id"
+        )
+        if start_date:
+            queryset = queryset.filter(year__gte=start_date.year).exclude(
+                year=start_date.year, month__lt=start_date.month
             )
+        if end_date:
+            queryset = queryset.filter(year__lte=end_date.year).exclude(
+                year=end_date.year, month__gt=end_date.month
+            )
+
+        month_working_days = {}
+
+        def transform(row):
+            period = (row[2], row[3])
+            if period not in month_working_days:
+                first_day, last_day = month_date_range(*period)
+                month_working_days[period] = (
+                    working_days_between(first_day, last_day)
+                    if within_calendar(first_day, last_day)
+                    else None
+                )
+            return row[:4] + (round(row[4] / 3600, 2), month_working_days[period])
+
+        return stream_export(
+            queryset,
+            ["user_id", "user__username", "year", "month", "total_seconds"],
+            output_format,
+            "monthly-work-report",
+            headers=[
+                "user_id",
+                "username",
+                "year",
+                "month",
+                "total_work_hours",
+                "working_days",
+            ],
+            transform=transform,
         )
 
-        report_data = attendances.values("user__id", "user__username").annotate(
-            total_duration=Sum("work_duration")
+
+class ReportJobViewSet(viewsets.ReadOnlyModelViewSet):
+    queryset = ReportJob.objects.all()
+    serializer_class = ReportJobSerializer
+    permission_classes = [IsAdminUser]
+
+    @swagger_auto_schema(
+        operation_description="Arka planda bir rapor oluşturma işi başlat. "
+        "Aynı kapalı dönem için hazır bir rapor varsa o döndürülür.",
+        request_body=ReportRequestSerializer,
+        responses={
+            200: ReportJobSerializer(),
+            202: ReportJobSerializer(),
+            400: "Geçersiz İstek",
+            401: "Yetkisiz",
+        },
+    )
+    def create(self, request, *args, **kwargs):
+        request_serializer = ReportRequestSerializer(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        params = request_serializer.validated_data
+
+        data_version = report_cache_version()
+        # A job whose task was lost would otherwise be joined forever
+        in_flight = Q(
+            status__in=("PENDING", "RUNNING"),
+            created_at__gte=timezone.now()
+            - timedelta(seconds=settings.REPORT_JOB_STALE_AFTER),
+        )
+        if params["end_date"] < timezone.localdate():
+            # Closed periods only change through corrections, which move the version
+            in_flight |= Q(status="DONE")
+        job = (
+            ReportJob.objects.filter(in_flight, data_version=data_version, **params)
+            .order_by("-created_at")
+            .first()
         )
+        if job is not None:
+            serializer = self.get_serializer(job)
+            return Response(serializer.data, status=status.HTTP_200_OK)
 
-        reports = []
-        for entry in report_data:
-            total_hours = entry["total_duration"].total_seconds() / 3600
-            reports.append(
-                {
-                    "user_id": entry["user__id"],
-                    "username": entry["user__username"],
-                    "month": month,
-                    "year": year,
-                    "total_work_hours": round(total_hours, 2),
-                }
+        job = ReportJob.objects.create(
+            requested_by=request.user, data_version=data_version, **params
+        )
+        transaction.on_commit(lambda: generate_report_task.delay(job.id))
+
+        serializer = self.get_serializer(job)
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+    @swagger_auto_schema(
+        operation_description="Tamamlanan rapor dosyasını indir.",
+        responses={
+            200: "CSV dosyası",
+            400: "Rapor henüz hazır değil.",
+            401: "Yetkisiz",
+        },
+    )
+    @action(detail=True, methods=["GET"])
+    def download(self, request, pk=None):
+        job = self.get_object()
+        if job.status != "DONE" or not job.file:
+            return Response(
+                {"error": "Rapor henüz hazır değil."},
+                status=status.HTTP_400_BAD_REQUEST,
             )
+        return FileResponse(
+            job.file.open("rb"),
+            as_attachment=True,
+            filename=job.file.name.rsplit("/", 1)[-1],
+        )
 
-        serializer = MonthlyWorkReportSerializer(reports, many=True)
-        return Response(serializer.data, status=200)
+
+class ImportView(APIView):
+    permission_classes = [IsAdminUser]
+    parser_classes = [MultiPartParser]
+
+    @swagger_auto_schema(
+        operation_description="Çalışanları (employees) veya geçmiş katılım kayıtlarını "
+        "(attendances) CSV/NDJSON dosyasından arka planda toplu içe aktar. "
+        "Sonuç import-jobs uç noktasından izlenir.",
+        manual_parameters=[
+            openapi.Parameter(
+                "file",
+                openapi.IN_FORM,
+                description="İçe aktarılacak dosya",
+                type=openapi.TYPE_FILE,
+                required=True,
+            ),
+            openapi.Parameter(
+                "file_format",
+                openapi.IN_FORM,
+                description="csv (varsayılan) veya ndjson",
+                type=openapi.TYPE_STRING,
+            ),
+        ],
+        responses={
+            202: ImportJobSerializer(),
+            400: "Geçersiz İstek",
+            401: "Yetkisiz",
+        },
+    )
+    def post(self, request, kind):
+        upload = request.FILES.get("file")
+        file_format = request.data.get("file_format", "csv")
+        if upload is None:
+            return Response(
+                {"error": "Dosya gereklidir."}, status=status.HTTP_400_BAD_REQUEST
+            )
+        if file_format not in IMPORT_FORMATS:
+            return Response(
+                {"error": "Geçersiz dosya biçimi. csv veya ndjson kullanın."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        job = ImportJob.objects.create(
+            requested_by=request.user,
+            kind=kind.upper(),
+            file_format=file_format,
+            file=upload,
+        )
+        transaction.on_commit(lambda: import_data_task.delay(job.id))
+
+        serializer = ImportJobSerializer(job)
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+
+class ImportJobViewSet(viewsets.ReadOnlyModelViewSet):
+    """Status and result of imports started from ``ImportView``."""
+
+    queryset = ImportJob.objects.all()
+    serializer_class = ImportJobSerializer
+    permission_classes = [IsAdminUser]
@@ -0,0 +1,125 @@
+"""Working-day calendar: weekends, public holidays and company closures.
+
+The calendar is a prefix sum of working days, so counting the working days
+between two dates is two list lookups. It is built once per process and only
+rebuilt when the holiday version in the shared cache moves or the year
+changes. It covers ``WORK_CALENDAR_YEARS`` on either side of today.
+"""
+
+import threading
+import time
+from datetime import MAXYEAR, MINYEAR, date, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .constants import WEEKEND_DAYS
+
+CALENDAR_VERSION_KEY = "workdays:version"
+
+
+class WorkCalendar:
+    def __init__(self, first_day, last_day, closed_days=()):
+        self.first_day = first_day
+        self.last_day = last_day
+        closed_days = set(closed_days)
+
+        prefix = [0]
+        running = 0
+        for offset in range((last_day - first_day).days + 1):
+            day = first_day + timedelta(days=offset)
+            if day.weekday() not in WEEKEND_DAYS and day not in closed_days:
+                running += 1
+            prefix.append(running)
+        self._prefix = prefix
+
+    def covers(self, start_date, end_date):
+        return self.first_day <= start_date and end_date <= self.last_day
+
+    def working_days_between(self, start_date, end_date):
+        """Working days in the inclusive range ``start_date``..``end_date``."""
+        if start_date > end_date:
+            return 0
+        if not self.covers(start_date, end_date):
+            raise ValueError(f"{start_date}..{end_date} is outside the loaded calendar")
+        start = (start_date - self.first_day).days
+        end = (end_date - self.first_day).days + 1
+        return self._prefix[end] - self._prefix[start]
+
+    def is_working_day(self, day):
+        return self.working_days_between(day, day) == 1
+
+
+_calendar = None
+_calendar_version = None
+_lock = threading.Lock()
+
+
+def calendar_version():
+    return cache.get_or_set(CALENDAR_VERSION_KEY, time.time_ns, None)
+
+
+def invalidate_calendar():
+    """Make every process rebuild its calendar on next use."""
+    try:
+        cache.incr(CALENDAR_VERSION_KEY)
+    except ValueError:
+        cache.set(CALENDAR_VERSION_KEY, time.time_ns(), None)
+
+
+def calendar_window(today=None):
+    """First and last day the calendar covers: WORK_CALENDAR_YEARS around today.
+
+    Dates come from user input, so the window is fixed instead of growing to
+    whatever range a request asks for.
+    """
+    year = (today or timezone.localdate()).year
+    years = settings.WORK_CALENDAR_YEARS
+    return (
+        date(max(MINYEAR, year - years), 1, 1),
+        date(min(MAXYEAR, year + years), 12, 31),
+    )
+
+
+def within_calendar(start_date, end_date):
+    first_day, last_day = calendar_window()
+    return first_day <= start_date and end_date <= last_day
+
+
+def get_calendar():
+    """Return the calendar for the current window, rebuilding it when holidays changed.
+
+    Batch callers should fetch the calendar once and query it directly instead
+    of going through the module-level helpers per row.
+    """
+    global _calendar, _calendar_version
+    from .models import Holiday
+
+    first_day, last_day = calendar_window()
+    version = calendar_version()
+
+    calendar = _calendar
+    if (
+        calendar is not None
+        and _calendar_version == version
+        and (calendar.first_day, calendar.last_day) == (first_day, last_day)
+    ):
+        return calendar
+
+    with _lock:
+        closed_days = Holiday.objects.filter(
+            date__range=(first_day, last_day)
+        ).values_list("date", flat=True)
+        calendar = WorkCalendar(first_day, last_day, closed_days)
+        _calendar, _calendar_version = calendar, version
+    return calendar
+
+
+def working_days_between(start_date, end_date):
+    """Working days in the inclusive range; raises ``ValueError`` outside ``calendar_window``."""
+    return get_calendar().working_days_between(start_date, end_date)
+
+
+def is_working_day(day):
+    return get_calendar().is_working_day(day)
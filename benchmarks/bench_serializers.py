@@ -0,0 +1,119 @@
+"""Serialization throughput of the list endpoints, ModelSerializer vs ``.values()``.
+
+Opt-in: install ``benchmarks/requirements.txt`` and run from the repository root::
+
+    pytest benchmarks --benchmark-group-by=group,param:rows
+
+Each case fetches and serializes every row, as a list request does without
+pagination. Row counts come from ``BENCH_ROWS`` (default ``10000,100000``).
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from benchmarks.common import seed_attendance, seed_employees, seed_leave_requests
+
+ROWS = [int(rows) for rows in os.getenv("BENCH_ROWS", "10000,100000").split(",")]
+ROUNDS = 3
+
+
+@pytest.fixture(scope="session", params=ROWS, ids=lambda rows: f"{rows}rows")
+def rows(request, django_database):
+    """Reseed so employees, attendance and leave requests each hold ``rows`` rows."""
+    from api.models import Attendance, LeaveRequest, User
+
+    # Plain DELETEs: Model.delete() would load every row and run the per-row
+    # post_delete rollup receiver, swamping the benchmark with setup time
+    for model in (Attendance, LeaveRequest, User):
+        queryset = model.objects.all()
+        queryset._raw_delete(queryset.db)
+
+    user_ids = seed_employees(request.param)
+    seed_attendance(user_ids, request.param)
+    seed_leave_requests(user_ids, request.param)
+    return request.param
+
+
+def run(benchmark, serialize):
+    data = benchmark.pedantic(serialize, rounds=ROUNDS, iterations=1)
+    assert data
+
+
+@pytest.mark.benchmark(group="attendance")
+def bench_attendance_model_serializer(benchmark, rows):
+    from api.models import Attendance
+    from api.serializers import AttendanceSerializer
+
+    run(
+        benchmark,
+        lambda: AttendanceSerializer(
+            Attendance.objects.select_related("user"), many=True
+        ).data,
+    )
+
+
+@pytest.mark.benchmark(group="attendance")
+def bench_attendance_values(benchmark, rows):
+    from api.models import Attendance
+    from api.serializers import AttendanceListSerializer
+
+    run(
+        benchmark,
+        lambda: AttendanceListSerializer(
+            Attendance.objects.values(*AttendanceListSerializer.values_fields)
+        ).data,
+    )
+
+
+@pytest.mark.benchmark(group="leave-requests")
+def bench_leave_request_model_serializer(benchmark, rows):
+    from api.models import LeaveRequest
+    from api.serializers import LeaveRequestSerializer
+
+    run(
+        benchmark,
+        lambda: LeaveRequestSerializer(LeaveRequest.objects.all(), many=True).data,
+    )
+
+
+@pytest.mark.benchmark(group="leave-requests")
+def bench_leave_request_values(benchmark, rows):
+    from api.models import LeaveRequest
+    from api.serializers import LeaveRequestListSerializer
+
+    run(
+        benchmark,
+        lambda: LeaveRequestListSerializer(
+            LeaveRequest.objects.values(*LeaveRequestListSerializer.values_fields)
+        ).data,
+    )
+
+
+@pytest.mark.benchmark(group="employees")
+def bench_user_model_serializer(benchmark, rows):
+    from api.models import User
+    from api.serializers import UserSerializer
+
+    # The groups/permissions M2M the full serializer includes
+    run(
+        benchmark,
+        lambda: UserSerializer(
+            User.objects.prefetch_related("groups", "user_permissions"), many=True
+        ).data,
+    )
+
+
+@pytest.mark.benchmark(group="employees")
+def bench_user_values(benchmark, rows):
+    from api.models import User
+    from api.serializers import UserListSerializer
+
+    run(
+        benchmark,
+        lambda: UserListSerializer(
+            User.objects.values(*UserListSerializer.values_fields)
+        ).data,
+    )
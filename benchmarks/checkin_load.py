@@ -0,0 +1,137 @@
+"""Accounts for the check-in load test in ``benchmarks/locustfile.py``.
+
+Unlike the other benchmarks this works on the configured database, because
+the server under test reads it. Everything it creates is prefixed
+``loadtest-``::
+
+    python -m benchmarks.checkin_load seed --users 2000
+    python -m benchmarks.checkin_load reset     # between runs
+    python -m benchmarks.checkin_load delete    # when done
+
+``seed`` writes one API token per line to ``LOADTEST_TOKENS``. The accounts
+share a work schedule that starts at the minute ``seed``/``reset`` ran and
+ends at 23:59, so a run started right after a reset models the shift-start
+rush with on-time arrivals on any working day.
+"""
+
+import argparse
+import os
+import tempfile
+from datetime import time
+
+from benchmarks.common import SEED_BATCH_SIZE, setup_django
+
+USERNAME_PREFIX = "loadtest-"
+SCHEDULE_NAME = "Yük testi"
+TOKENS_PATH = os.getenv(
+    "LOADTEST_TOKENS", os.path.join(tempfile.gettempdir(), "loadtest-tokens.txt")
+)
+
+
+def start_shift_now():
+    from django.utils import timezone
+
+    from api.models import WorkSchedule
+
+    now = timezone.localtime()
+    schedule, _ = WorkSchedule.objects.update_or_create(
+        name=SCHEDULE_NAME,
+        defaults={
+            "timezone": str(now.tzinfo),
+            "start_time": time(now.hour, now.minute),
+            "end_time": time(23, 59),
+        },
+    )
+    return schedule
+
+
+def seed(count):
+    from rest_framework.authtoken.models import Token
+
+    from api.models import User
+
+    schedule = start_shift_now()
+    User.objects.bulk_create(
+        (
+            User(
+                username=f"{USERNAME_PREFIX}{i}",
+                password="!",
+                is_employee=True,
+                annual_leave_days=30,
+                work_schedule=schedule,
+            )
+            for i in range(count)
+        ),
+        batch_size=SEED_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    users = User.objects.filter(username__startswith=USERNAME_PREFIX)
+    Token.objects.bulk_create(
+        # bulk_create skips Token.save(), which is where keys are generated
+        (
+            Token(user=user, key=Token.generate_key())
+            for user in users.filter(auth_token__isnull=True)
+        ),
+        batch_size=SEED_BATCH_SIZE,
+    )
+    tokens = Token.objects.filter(user__in=users).values_list("key", flat=True)
+    with open(TOKENS_PATH, "w") as output:
+        output.writelines(f"{key}\n" for key in tokens)
+    print(f"{users.count()} accounts; tokens written to {TOKENS_PATH}.")
+
+
+def reset():
+    """Forget today's check-ins so the accounts can check in again."""
+    from django.utils import timezone
+
+    from api.checkins import check_in_marker_key
+    from api.models import Attendance, User
+    from api.utils import get_redis
+
+    schedule = start_shift_now()
+    user_ids = list(
+        User.objects.filter(username__startswith=USERNAME_PREFIX).values_list("id", flat=True)
+    )
+    day = timezone.localdate()
+    deleted, _ = Attendance.objects.filter(user_id__in=user_ids, date=day).delete()
+    try:
+        client = get_redis()
+        for i in range(0, len(user_ids), SEED_BATCH_SIZE):
+            client.delete(
+                *(check_in_marker_key(user_id, day) for user_id in user_ids[i : i + SEED_BATCH_SIZE])
+            )
+    except Exception as e:
+        print(f"Check-in markers not cleared: {e}")
+    print(f"{deleted} check-ins removed; the shift now starts at {schedule.start_time}.")
+
+
+def delete():
+    from api.models import User, WorkSchedule
+
+    deleted, _ = User.objects.filter(username__startswith=USERNAME_PREFIX).delete()
+    WorkSchedule.objects.filter(name=SCHEDULE_NAME).delete()
+    if os.path.exists(TOKENS_PATH):
+        os.remove(TOKENS_PATH)
+    print(f"{deleted} rows deleted.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    seed_parser = subparsers.add_parser("seed")
+    seed_parser.add_argument("--users", type=int, default=2000)
+    subparsers.add_parser("reset")
+    subparsers.add_parser("delete")
+    args = parser.parse_args()
+
+    setup_django()
+    if args.command == "seed":
+        seed(args.users)
+    elif args.command == "reset":
+        reset()
+    else:
+        delete()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""Shared setup for the benchmark scripts.
+
+Run the scripts from the repository root, e.g. ``python -m benchmarks.query_plans``.
+They use the database configured in ``core.settings`` (``DB_*`` environment
+variables) but seed into a throwaway test database that is dropped at the
+end, so existing data is never touched.
+"""
+
+import os
+import random
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SEED_BATCH_SIZE = 10000
+
+
+def setup_django():
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def benchmark_database(keepdb=False):
+    """Create the test database for the configured backend and drop it afterwards."""
+    from django.db import connection
+
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=1, autoclobber=True, keepdb=keepdb)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=1, keepdb=keepdb)
+
+
+def measure(func, repeat=5, warmup=1):
+    """Run ``func`` and return the wall-clock seconds of each timed run."""
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def format_latency(samples):
+    return (
+        f"median {statistics.median(samples) * 1000:8.2f} ms  "
+        f"p95 {percentile(samples, 95) * 1000:8.2f} ms"
+    )
+
+
+def seed_employees(count):
+    from api.models import User
+
+    offset = User.objects.count()
+    User.objects.bulk_create(
+        (
+            User(username=f"bench{offset + i}", password="!", is_employee=True)
+            for i in range(count)
+        ),
+        batch_size=SEED_BATCH_SIZE,
+    )
+    return list(
+        User.objects.filter(username__startswith="bench")
+        .order_by("id")
+        .values_list("id", flat=True)
+    )
+
+
+def _batched(rows):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= SEED_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def seed_attendance(user_ids, rows, open_today=0, seed=1):
+    """Insert about ``rows`` closed sessions spread over consecutive past days.
+
+    ``open_today`` users also get a session for today without a check-out,
+    the shape ``CheckOutView`` looks up.
+    """
+    from django.utils import timezone
+
+    from api.models import Attendance
+    from api.schedules import DEFAULT_SHIFT
+
+    rng = random.Random(seed)
+    today = timezone.localdate()
+    days = max(1, rows // len(user_ids))
+
+    def sessions():
+        for offset in range(days, 0, -1):
+            day = today - timedelta(days=offset)
+            shift_start, _ = DEFAULT_SHIFT.bounds(day)
+            for user_id in user_ids:
+                start_time = shift_start + timedelta(minutes=rng.randint(-30, 45))
+                end_time = start_time + timedelta(minutes=rng.randint(420, 600))
+                yield Attendance(
+                    user_id=user_id,
+                    date=day,
+                    start_time=start_time,
+                    end_time=end_time,
+                    late_minutes=DEFAULT_SHIFT.late_minutes(start_time),
+                    work_duration=end_time - start_time,
+                )
+        shift_start, _ = DEFAULT_SHIFT.bounds(today)
+        for user_id in user_ids[:open_today]:
+            start_time = shift_start + timedelta(minutes=rng.randint(-30, 45))
+            yield Attendance(
+                user_id=user_id,
+                date=today,
+                start_time=start_time,
+                late_minutes=DEFAULT_SHIFT.late_minutes(start_time),
+            )
+
+    created = 0
+    for batch in _batched(sessions()):
+        Attendance.objects.bulk_create(batch)
+        created += len(batch)
+    return created
+
+
+def seed_leave_requests(user_ids, rows, pending_ratio=0.02, seed=1):
+    """Insert ``rows`` non-overlapping leave requests per user, most of them decided."""
+    from django.utils import timezone
+
+    from api.models import LeaveRequest
+
+    rng = random.Random(seed)
+    per_user = max(1, rows // len(user_ids))
+    first_day = timezone.localdate() - timedelta(days=per_user * 10)
+
+    def leave_requests():
+        for user_id in user_ids:
+            start_date = first_day + timedelta(days=rng.randint(0, 4))
+            for _ in range(per_user):
+                end_date = start_date + timedelta(days=rng.randint(0, 4))
+                roll = rng.random()
+                if roll < pending_ratio:
+                    status = "PENDING"
+                elif roll < 0.9:
+                    status = "APPROVED"
+                else:
+                    status = "REJECTED"
+                yield LeaveRequest(
+                    user_id=user_id,
+                    start_date=start_date,
+                    end_date=end_date,
+                    reason="Benchmark",
+                    status=status,
+                )
+                # Leaves of one user never overlap, as leave_no_overlap requires
+                start_date = end_date + timedelta(days=rng.randint(1, 10))
+
+    created = 0
+    for batch in _batched(leave_requests()):
+        LeaveRequest.objects.bulk_create(batch)
+        created += len(batch)
+    return created
+
+
+def analyze(connection):
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+
+def local_midnight(day):
+    from django.utils import timezone
+
+    return timezone.make_aware(datetime.combine(day, datetime.min.time()))
@@ -0,0 +1,10 @@
+import pytest
+
+from benchmarks.common import benchmark_database, setup_django
+
+
+@pytest.fixture(scope="session")
+def django_database():
+    setup_django()
+    with benchmark_database() as connection:
+        yield connection
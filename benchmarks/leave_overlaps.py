@@ -0,0 +1,94 @@
+"""Latency of leave overlap and team availability lookups.
+
+Seeds leave requests, then times the queries behind ``on-leave/`` and
+``leave-requests/overlaps/`` with and without the leave indexes (on
+PostgreSQL also the ``leave_period_gist_idx`` index and the
+``leave_no_overlap`` exclusion constraint)::
+
+    DB_ENGINE=django.db.backends.postgresql python -m benchmarks.leave_overlaps --rows 1000000
+
+Other backends only have the bound comparisons, which a B-tree cannot
+answer for a day in the middle of the data; expect no gain there.
+"""
+
+import argparse
+from datetime import timedelta
+
+from benchmarks.common import (
+    analyze,
+    benchmark_database,
+    format_latency,
+    measure,
+    seed_employees,
+    seed_leave_requests,
+    setup_django,
+)
+
+
+def lookups(user_id):
+    from django.db.models import Max, Min
+
+    from api.models import LeaveRequest
+
+    bounds = LeaveRequest.objects.aggregate(first=Min("start_date"), last=Max("end_date"))
+    day = bounds["first"] + (bounds["last"] - bounds["first"]) / 2
+    week_end = day + timedelta(days=6)
+    approved = LeaveRequest.objects.active().filter(status="APPROVED")
+
+    return {
+        # OnLeaveView: who is out on one day, first page and total
+        "on leave (day, page)": lambda: list(
+            approved.overlapping(day, day).order_by("-id")[:50]
+        ),
+        "on leave (day, count)": lambda: approved.overlapping(day, day).count(),
+        "on leave (week, count)": lambda: approved.overlapping(day, week_end).count(),
+        # LeaveRequestViewSet.overlaps / serializer validation for one employee
+        "overlap check (user)": lambda: LeaveRequest.objects.filter(user_id=user_id)
+        .active()
+        .overlapping(day, week_end)
+        .exists(),
+    }
+
+
+def run_lookups(user_id, repeat):
+    for label, lookup in lookups(user_id).items():
+        print(f"  {label:<24} {format_latency(measure(lookup, repeat=repeat))}")
+
+
+def drop_indexes(connection):
+    from api.models import LeaveRequest
+
+    table = connection.ops.quote_name(LeaveRequest._meta.db_table)
+    with connection.schema_editor() as schema_editor:
+        for index in LeaveRequest._meta.indexes:
+            schema_editor.remove_index(LeaveRequest, index)
+        if connection.vendor == "postgresql":
+            schema_editor.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS leave_no_overlap")
+            schema_editor.execute("DROP INDEX IF EXISTS leave_period_gist_idx")
+    analyze(connection)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000, help="Leave rows to seed.")
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database() as connection:
+        user_ids = seed_employees(args.users)
+        rows = seed_leave_requests(user_ids, args.rows)
+        analyze(connection)
+        print(f"Seeded {rows} leave rows on {connection.vendor}.")
+
+        print("With indexes:")
+        run_lookups(user_ids[0], args.repeat)
+
+        drop_indexes(connection)
+        print("Without indexes:")
+        run_lookups(user_ids[0], args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Check-in rush load test: every account checks in once, as fast as possible.
+
+Needs ``pip install locust``. Run each mode against a local server, e.g.::
+
+    python -m benchmarks.checkin_load seed --users 2000
+    CHECK_IN_FAST_PATH=false daphne core.asgi:application
+    locust -f benchmarks/locustfile.py --headless -u 2000 -r 200 -t 60s \\
+        --host http://127.0.0.1:8000
+    python -m benchmarks.checkin_load reset
+    # restart the server with CHECK_IN_FAST_PATH=true and run locust again
+
+Locust's summary gives requests/s and the 50%/99% response times of the
+``check-in`` request for each mode.
+"""
+
+import itertools
+import os
+import tempfile
+
+from locust import HttpUser, constant, task
+from locust.exception import StopUser
+
+# Same default as benchmarks.checkin_load; locust does not put the repo on sys.path
+TOKENS_PATH = os.getenv(
+    "LOADTEST_TOKENS", os.path.join(tempfile.gettempdir(), "loadtest-tokens.txt")
+)
+
+with open(TOKENS_PATH) as tokens_file:
+    TOKENS = tokens_file.read().split()
+_next_token = itertools.count()
+
+
+class CheckInUser(HttpUser):
+    wait_time = constant(0)
+
+    def on_start(self):
+        index = next(_next_token)
+        if index >= len(TOKENS):
+            raise StopUser()
+        self.client.headers["Authorization"] = f"Token {TOKENS[index]}"
+
+    @task
+    def check_in(self):
+        with self.client.post(
+            "/api/v1/check-in/", name="check-in", catch_response=True
+        ) as response:
+            if response.status_code != 200:
+                response.failure(f"{response.status_code}: {response.text[:200]}")
+        # One check-in per account per day
+        raise StopUser()
@@ -0,0 +1,120 @@
+"""Query plans and latency of the hot attendance and leave queries.
+
+Seeds a throwaway database, then runs each query with and without the
+indexes declared on ``Attendance`` and ``LeaveRequest``::
+
+    DB_ENGINE=django.db.backends.postgresql python -m benchmarks.query_plans --rows 1000000
+
+The numbers only mean something on PostgreSQL with a realistic row count;
+SQLite works for a quick smoke run.
+"""
+
+import argparse
+from datetime import timedelta
+
+from benchmarks.common import (
+    analyze,
+    benchmark_database,
+    format_latency,
+    local_midnight,
+    measure,
+    seed_attendance,
+    seed_employees,
+    seed_leave_requests,
+    setup_django,
+)
+
+
+def hot_queries(user_id):
+    """Query shapes of the endpoints the indexes were added for."""
+    from django.db.models import Sum
+    from django.utils import timezone
+
+    from api.models import Attendance, LeaveRequest
+
+    today = timezone.localdate()
+    yesterday = today - timedelta(days=1)
+    month_start = local_midnight(yesterday.replace(day=1))
+    page = 50
+
+    return {
+        # LateArrivalsView: one day's late arrivals, newest first
+        "late arrivals (day)": Attendance.objects.select_related("user")
+        .filter(late_minutes__gt=0, date=yesterday)
+        .order_by("-start_time", "-id")[:page],
+        # AttendanceViewSet with ?date_from=&date_to=
+        "attendance (date range)": Attendance.objects.filter(
+            date__range=(yesterday - timedelta(days=6), yesterday)
+        ).order_by("-start_time", "-id")[:page],
+        # rebuild_work_summaries / range reports: closed sessions of one month
+        "closed sessions (month)": Attendance.objects.filter(
+            start_time__gte=month_start,
+            start_time__lt=local_midnight(today),
+            end_time__isnull=False,
+        )
+        .values("user_id")
+        .annotate(total=Sum("work_duration")),
+        # CheckOutView: the user's open session for today
+        "open session (check-out)": Attendance.objects.filter(
+            user_id=user_id, date=today, end_time__isnull=True
+        )[:1],
+        # PendingLeavesView: admin approval queue
+        "pending leaves": LeaveRequest.objects.select_related("user")
+        .filter(status="PENDING")
+        .order_by("start_date", "id")[:page],
+        # LeaveRequestViewSet with ?status=APPROVED
+        "approved leaves": LeaveRequest.objects.filter(status="APPROVED").order_by("-id")[
+            :page
+        ],
+    }
+
+
+def run_queries(user_id, repeat, show_plans):
+    for label, queryset in hot_queries(user_id).items():
+        samples = measure(lambda: list(queryset.all()), repeat=repeat)
+        print(f"  {label:<26} {format_latency(samples)}")
+        if show_plans:
+            for line in queryset.explain().splitlines():
+                print(f"      {line}")
+
+
+def drop_indexes(connection):
+    from api.models import Attendance, LeaveRequest
+
+    with connection.schema_editor() as schema_editor:
+        for model in (Attendance, LeaveRequest):
+            for index in model._meta.indexes:
+                schema_editor.remove_index(model, index)
+    analyze(connection)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000, help="Attendance rows to seed.")
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--leaves", type=int, default=200000, help="Leave rows to seed.")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--plans", action="store_true", help="Print EXPLAIN output.")
+    args = parser.parse_args()
+
+    setup_django()
+    with benchmark_database() as connection:
+        user_ids = seed_employees(args.users)
+        print(
+            f"Seeded {seed_attendance(user_ids, args.rows, open_today=args.users // 2)} "
+            f"attendance and {seed_leave_requests(user_ids, args.leaves)} leave rows "
+            f"on {connection.vendor}."
+        )
+        analyze(connection)
+        user_id = user_ids[0]
+
+        print("With indexes:")
+        run_queries(user_id, args.repeat, args.plans)
+
+        drop_indexes(connection)
+        print("Without indexes:")
+        run_queries(user_id, args.repeat, args.plans)
+
+
+if __name__ == "__main__":
+    main()
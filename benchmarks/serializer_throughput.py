@@ -0,0 +1,78 @@
+"""Rows per second when serializing attendance lists.
+
+Compares the old per-row ``late_time`` computation with the stored
+``late_minutes`` column, and the ``.values()`` list path the attendance
+endpoints use::
+
+    python -m benchmarks.serializer_throughput --rows 50000
+
+Rows are fetched once; only serialization is timed.
+"""
+
+import argparse
+import statistics
+
+from benchmarks.common import (
+    benchmark_database,
+    measure,
+    seed_attendance,
+    seed_employees,
+    setup_django,
+)
+
+
+def legacy_serializer_class():
+    """``AttendanceSerializer`` as it was before ``late_minutes`` was stored."""
+    from django.utils import timezone
+    from rest_framework import serializers
+
+    from api.serializers import AttendanceSerializer
+
+    class ComputedLateTimeSerializer(AttendanceSerializer):
+        late_time = serializers.SerializerMethodField()
+
+        def get_late_time(self, obj):
+            job_start_time = timezone.localtime().replace(hour=8, minute=0, second=0)
+            if obj.start_time > job_start_time:
+                return (obj.start_time - job_start_time).seconds // 60
+            return None
+
+    return ComputedLateTimeSerializer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    from api.models import Attendance
+    from api.serializers import AttendanceListSerializer, AttendanceSerializer
+
+    with benchmark_database():
+        rows = seed_attendance(seed_employees(args.users), args.rows)
+        instances = list(Attendance.objects.select_related("user").order_by("-start_time"))
+        values = list(
+            Attendance.objects.order_by("-start_time").values(
+                *AttendanceListSerializer.values_fields
+            )
+        )
+
+        legacy_serializer = legacy_serializer_class()
+        cases = {
+            "computed late_time (before)": lambda: legacy_serializer(
+                instances, many=True
+            ).data,
+            "stored late_minutes": lambda: AttendanceSerializer(instances, many=True).data,
+            "values() list serializer": lambda: AttendanceListSerializer(values).data,
+        }
+        print(f"{rows} attendance rows:")
+        for label, serialize in cases.items():
+            seconds = statistics.median(measure(serialize, repeat=args.repeat))
+            print(f"  {label:<28} {rows / seconds:10.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
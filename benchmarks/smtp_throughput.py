@@ -0,0 +1,169 @@
+"""Messages per second through the notification mail backends.
+
+Starts a local SMTP stand-in and sends the same messages three ways: a
+new connection per message (Django's SMTP backend, as ``send_mail`` did
+before), one pooled connection (``api.mail.PooledEmailBackend``, as the
+notification tasks send) and pooled ``send_messages`` batches::
+
+    python -m benchmarks.smtp_throughput --messages 2000 --connect-latency 0.05
+
+``--connect-latency`` delays the greeting to stand in for the TLS handshake
+and AUTH of a real server. ``--drop-every`` makes the stand-in hang up after
+that many messages, to check that the pooled backend reconnects.
+"""
+
+import argparse
+import socketserver
+import threading
+import time
+
+from benchmarks.common import setup_django
+
+
+class SMTPStandIn(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, connect_latency=0.0, drop_every=0):
+        super().__init__(("127.0.0.1", 0), SMTPHandler)
+        self.connect_latency = connect_latency
+        self.drop_every = drop_every
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.received = 0
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough ESMTP for smtplib: no TLS, no AUTH, messages are discarded."""
+
+    def reply(self, *lines):
+        # One write per reply, as real servers do; split replies stall on delayed ACKs
+        self.wfile.write("".join(f"{line}\r\n" for line in lines).encode())
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        time.sleep(server.connect_latency)
+        self.reply("220 localhost SMTP stand-in")
+
+        received = 0
+        while line := self.rfile.readline():
+            command = line.decode(errors="replace").strip().upper()
+            if command.startswith("EHLO"):
+                self.reply("250-localhost", "250 8BITMIME")
+            elif command.startswith(("HELO", "MAIL", "RCPT", "RSET", "NOOP")):
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                with server.lock:
+                    server.received += 1
+                received += 1
+                self.reply("250 OK")
+                if server.drop_every and received % server.drop_every == 0:
+                    return
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+def build_messages(count):
+    from django.core.mail import EmailMessage
+
+    return [
+        EmailMessage(
+            subject="Düşük İzin Bakiyesi Uyarısı",
+            body=f"Çalışan bench{i} için izin bakiyesi 3 günün altına düştü.",
+            from_email="noreply@example.com",
+            to=[f"admin{i % 10}@example.com"],
+        )
+        for i in range(count)
+    ]
+
+
+def run(label, server, send):
+    connections, received = server.connections, server.received
+    started = time.perf_counter()
+    sent = send()
+    elapsed = time.perf_counter() - started
+    print(
+        f"  {label:<26} {sent / elapsed:9.1f} msgs/s  "
+        f"{server.received - received} received over "
+        f"{server.connections - connections} connections"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument(
+        "--connect-latency",
+        type=float,
+        default=0.0,
+        help="Seconds the stand-in waits before greeting each new connection.",
+    )
+    parser.add_argument(
+        "--drop-every",
+        type=int,
+        default=0,
+        help="Hang up after this many messages on one connection.",
+    )
+    args = parser.parse_args()
+
+    setup_django()
+    from django.core.mail import get_connection
+
+    server = SMTPStandIn(args.connect_latency, args.drop_every)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    options = {
+        "host": "127.0.0.1",
+        "port": server.port,
+        "username": "",
+        "password": "",
+        "use_tls": False,
+    }
+    messages = build_messages(args.messages)
+
+    def per_message():
+        for message in messages:
+            message.connection = get_connection(
+                "django.core.mail.backends.smtp.EmailBackend", **options
+            )
+            message.send()
+        return len(messages)
+
+    def pooled():
+        connection = get_connection("api.mail.PooledEmailBackend", **options)
+        try:
+            return sum(connection.send_messages([message]) for message in messages)
+        finally:
+            connection.force_close()
+
+    def pooled_batches():
+        connection = get_connection("api.mail.PooledEmailBackend", **options)
+        try:
+            return sum(
+                connection.send_messages(messages[i : i + args.batch_size])
+                for i in range(0, len(messages), args.batch_size)
+            )
+        finally:
+            connection.force_close()
+
+    print(f"{args.messages} messages, connect latency {args.connect_latency * 1000:.0f} ms:")
+    run("connection per message", server, per_message)
+    run("pooled connection", server, pooled)
+    run(f"pooled, batches of {args.batch_size}", server, pooled_batches)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
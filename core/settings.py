@@ -97,6 +97,22 @@ CHANNEL_LAYERS = {
     },
 }
 
+REDIS_URL = os.getenv('REDIS_URL', 'redis://127.0.0.1:6379/0')
+
+# Cache
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('CACHE_REDIS_URL', 'redis://127.0.0.1:6379/1'),
+    },
+}
+
+# WebSocket token -> user cache (in-process LRU, optionally backed by a shared cache alias).
+# Revocations bump a version key in the default cache, which every worker checks
+WS_TOKEN_CACHE_TTL = int(os.getenv('WS_TOKEN_CACHE_TTL', '60'))
+WS_TOKEN_CACHE_SIZE = int(os.getenv('WS_TOKEN_CACHE_SIZE', '10000'))
+WS_TOKEN_SHARED_CACHE = os.getenv('WS_TOKEN_SHARED_CACHE') or None
+
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
@@ -108,6 +124,15 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD', '123456789'),
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '5432'),
+        'TEST': {
+            # SQLite tests otherwise run in memory, where the threaded
+            # concurrency tests cannot see each other's writes
+            'NAME': os.getenv('DB_TEST_NAME') or (
+                str(BASE_DIR / 'test_db.sqlite3')
+                if os.getenv('DB_ENGINE', '').endswith('sqlite3')
+                else None
+            ),
+        },
     }
 }
 
@@ -148,6 +173,11 @@ USE_TZ = True
 
 STATIC_URL = '/static/'
 
+MEDIA_URL = '/media/'
+# Generated reports and uploaded import files (which may hold plaintext
+# passwords); keep this outside the repository in deployments
+MEDIA_ROOT = os.getenv('MEDIA_ROOT', str(BASE_DIR / 'media'))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
@@ -166,8 +196,27 @@ REST_FRAMEWORK = {
         'django_filters.rest_framework.DjangoFilterBackend',
     ],
     'DEFAULT_SCHEMA_CLASS': 'rest_framework.schemas.coreapi.AutoSchema',
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.DefaultCursorPagination',
+    'PAGE_SIZE': int(os.getenv('API_PAGE_SIZE', '50')),
 }
 
+# Upper bound for the ?page_size= query parameter on list endpoints
+API_MAX_PAGE_SIZE = int(os.getenv('API_MAX_PAGE_SIZE', '500'))
+
+# Seconds a work report for an already closed period stays in the cache
+WORK_REPORT_CACHE_TTL = int(os.getenv('WORK_REPORT_CACHE_TTL', '86400'))
+
+# Seconds after which a pending or running report job is no longer joined by
+# identical requests, in case its task was lost
+REPORT_JOB_STALE_AFTER = int(os.getenv('REPORT_JOB_STALE_AFTER', '900'))
+
+# Seconds a successful check-in/check-out response is replayed for a repeated Idempotency-Key
+IDEMPOTENCY_KEY_TTL = int(os.getenv('IDEMPOTENCY_KEY_TTL', '86400'))
+
+# Years on either side of today covered by the working-day calendar; leave
+# and report dates outside this window are rejected
+WORK_CALENDAR_YEARS = int(os.getenv('WORK_CALENDAR_YEARS', '10'))
+
 # AUTH MODEL
 AUTH_USER_MODEL = 'api.User'
 
@@ -178,6 +227,8 @@ EMAIL_PORT = 587
 EMAIL_USE_TLS = True
 EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER')
 EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD')
+# Backend used by Celery notification tasks; keeps SMTP sessions open across tasks
+NOTIFICATION_EMAIL_BACKEND = os.getenv('NOTIFICATION_EMAIL_BACKEND', 'api.mail.PooledEmailBackend')
 
 # CELERY SETTINGS
 CELERY_BROKER_URL = 'redis://localhost:6379/0'
@@ -185,4 +236,19 @@ CELERY_RESULT_BACKEND = 'redis://localhost:6379/0'
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
-CELERY_TIMEZONE = 'Europe/Istanbul'
\ No newline at end of file
+CELERY_TIMEZONE = 'Europe/Istanbul'
+
+# Notifications wait in an in-process queue that a background thread publishes
+# to the broker from; while the broker is down it retries every interval
+NOTIFICATION_QUEUE_SIZE = int(os.getenv('NOTIFICATION_QUEUE_SIZE', '1000'))
+NOTIFICATION_RETRY_INTERVAL = int(os.getenv('NOTIFICATION_RETRY_INTERVAL', '5'))
+
+# Late arrivals are coalesced into one admin digest per window
+LATE_ARRIVAL_DIGEST_WINDOW = int(os.getenv('LATE_ARRIVAL_DIGEST_WINDOW', '30'))
+LATE_ARRIVAL_DIGEST_MAX_BATCH = int(os.getenv('LATE_ARRIVAL_DIGEST_MAX_BATCH', '200'))
+
+# Check-in fast path: record check-ins in Redis and write them to the
+# database in batches every CHECK_IN_FLUSH_WINDOW seconds
+CHECK_IN_FAST_PATH = os.getenv('CHECK_IN_FAST_PATH', 'false').lower() in ('1', 'true', 'yes')
+CHECK_IN_FLUSH_WINDOW = int(os.getenv('CHECK_IN_FLUSH_WINDOW', '2'))
+CHECK_IN_FLUSH_MAX_BATCH = int(os.getenv('CHECK_IN_FLUSH_MAX_BATCH', '1000'))
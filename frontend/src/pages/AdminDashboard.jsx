@@ -1,34 +1,23 @@
 // src/pages/AdminDashboard.jsx
-import React, { useState, useEffect } from "react";
+import React from "react";
 import axios from "axios";
-import { EMPLOYEES_URL, LATE_ARRIVALS_URL, PENDING_LEAVES_URL, LEAVE_REQUEST_URL } from "../services";
+import {
+    EMPLOYEES_URL,
+    LATE_ARRIVALS_URL,
+    PENDING_LEAVES_URL,
+    LEAVE_REQUEST_URL,
+    LoadMoreButton,
+    usePaginatedList,
+} from "../services";
 
 const AdminDashboard = () => {
-    const [lateArrivals, setLateArrivals] = useState([]);
-    const [pendingLeaves, setPendingLeaves] = useState([]);
-    const [employees, setEmployees] = useState([]);
-    const [loading, setLoading] = useState(true);
-
-    useEffect(() => {
-        const fetchAdminData = async () => {
-            try {
-                const lateResponse = await axios.get(LATE_ARRIVALS_URL);
-                setLateArrivals(lateResponse.data);
-
-                const pendingLeavesResponse = await axios.get(PENDING_LEAVES_URL);
-                setPendingLeaves(pendingLeavesResponse.data);
-
-                const employeesResponse = await axios.get(EMPLOYEES_URL);
-                setEmployees(employeesResponse.data);
-            } catch (error) {
-                console.error("Veri yüklenirken hata oluştu", error);
-            }
-
-            setLoading(false);
-        };
-
-        fetchAdminData();
-    }, []);
+    const lateArrivalList = usePaginatedList(LATE_ARRIVALS_URL);
+    const pendingLeaveList = usePaginatedList(PENDING_LEAVES_URL);
+    const employeeList = usePaginatedList(EMPLOYEES_URL);
+    const lateArrivals = lateArrivalList.items;
+    const { items: pendingLeaves, setItems: setPendingLeaves } = pendingLeaveList;
+    const employees = employeeList.items;
+    const loading = lateArrivalList.loading || pendingLeaveList.loading || employeeList.loading;
 
     const formatLateTime = (minutes) => {
         const absMinutes = Math.abs(minutes);
@@ -94,6 +83,7 @@ const AdminDashboard = () => {
                                     ))}
                                 </tbody>
                             </table>
+                            <LoadMoreButton list={lateArrivalList} />
                         </div>
                     </div>
                 </div>
@@ -139,6 +129,7 @@ const AdminDashboard = () => {
                                     ))}
                                 </tbody>
                             </table>
+                            <LoadMoreButton list={pendingLeaveList} />
                         </div>
                     </div>
                 </div>
@@ -167,6 +158,7 @@ const AdminDashboard = () => {
                                     ))}
                                 </tbody>
                             </table>
+                            <LoadMoreButton list={employeeList} />
                         </div>
                     </div>
                 </div>
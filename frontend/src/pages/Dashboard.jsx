@@ -4,30 +4,28 @@ import {
 	ATTENDANCES_URL,
 	LEAVE_REQUEST_URL,
 	USER_BY_TOKEN_URL,
+	LoadMoreButton,
+	usePaginatedList,
 } from "../services";
 
 const Dashboard = () => {
 	const [userData, setUserData] = useState(null);
-	const [attendanceRecords, setAttendanceRecords] = useState([]);
-	const [leaveRequests, setLeaveRequests] = useState([]);
+	const attendanceList = usePaginatedList(ATTENDANCES_URL);
+	const leaveRequestList = usePaginatedList(LEAVE_REQUEST_URL);
+	const attendanceRecords = attendanceList.items;
+	const leaveRequests = leaveRequestList.items;
 
 	useEffect(() => {
-		const fetchDashboardData = async () => {
+		const fetchUserData = async () => {
 			try {
 				const userResponse = await axios.get(USER_BY_TOKEN_URL);
 				setUserData(userResponse.data);
-
-				const attendanceResponse = await axios.get(ATTENDANCES_URL);
-				setAttendanceRecords(attendanceResponse.data);
-
-				const leaveResponse = await axios.get(LEAVE_REQUEST_URL);
-				setLeaveRequests(leaveResponse.data);
 			} catch (error) {
 				console.error("Veri yüklenirken hata oluştu", error);
 			}
 		};
 
-		fetchDashboardData();
+		fetchUserData();
 	}, []);
 
 	if (!userData)
@@ -65,7 +63,7 @@ const Dashboard = () => {
 						<div className="card-body">
 							<h3 className="card-title">Toplam Çalışma Günü</h3>
 							<p className="card-text display-6">
-								{attendanceRecords.length} gün
+								{userData.attendance_days} gün
 							</p>
 						</div>
 					</div>
@@ -113,6 +111,7 @@ const Dashboard = () => {
 										))}
 									</tbody>
 								</table>
+								<LoadMoreButton list={attendanceList} />
 							</div>
 						</div>
 					</div>
@@ -163,6 +162,7 @@ const Dashboard = () => {
 										))}
 									</tbody>
 								</table>
+								<LoadMoreButton list={leaveRequestList} />
 							</div>
 						</div>
 					</div>
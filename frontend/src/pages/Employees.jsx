@@ -1,10 +1,10 @@
 import React, { useState, useEffect } from 'react';
 import axios from 'axios';
-import { EMPLOYEES_URL, LEAVE_REQUEST_URL } from '../services';
+import { EMPLOYEES_URL, LEAVE_REQUEST_URL, LoadMoreButton, usePaginatedList } from '../services';
 
 const Employees = () => {
-    const [employees, setEmployees] = useState([]);
-    const [loading, setLoading] = useState(true);
+    const employeeList = usePaginatedList(EMPLOYEES_URL);
+    const { items: employees, loading, error, reload: fetchEmployees } = employeeList;
     const [selectedEmployee, setSelectedEmployee] = useState(null);
     const [modalMode, setModalMode] = useState(null);
     const [alert, setAlert] = useState({ type: '', message: '' });
@@ -28,20 +28,11 @@ const Employees = () => {
         status: 'APPROVED'
     });
 
-    const fetchEmployees = async () => {
-        setLoading(true);
-        try {
-            const response = await axios.get(EMPLOYEES_URL);
-            setEmployees(response.data);
-        } catch (error) {
+    useEffect(() => {
+        if (error) {
             setAlert({ type: 'danger', message: 'Çalışanlar yüklenemedi' });
         }
-        setLoading(false);
-    };
-
-    useEffect(() => {
-        fetchEmployees();
-    }, []);
+    }, [error]);
 
     const handleInputChange = (e) => {
         const { name, value, type, checked, files } = e.target;
@@ -247,6 +238,7 @@ const Employees = () => {
                     ))}
                 </tbody>
             </table>
+            <LoadMoreButton list={employeeList} />
 
             <div 
                 className="modal fade" 
@@ -1,24 +1,17 @@
-import React, { useState, useEffect } from "react";
+import React, { useState } from "react";
 import axios from "axios";
-import { LEAVE_REQUEST_URL, PENDING_LEAVES_URL } from "../services";
+import {
+	LEAVE_REQUEST_URL,
+	PENDING_LEAVES_URL,
+	LoadMoreButton,
+	usePaginatedList,
+} from "../services";
 
 const LeaveApproval = () => {
-	const [pendingLeaves, setPendingLeaves] = useState([]);
+	const pendingLeaveList = usePaginatedList(PENDING_LEAVES_URL);
+	const { items: pendingLeaves, setItems: setPendingLeaves } = pendingLeaveList;
 	const [message, setMessage] = useState("");
 
-	useEffect(() => {
-		const fetchPendingLeaves = async () => {
-			try {
-				const response = await axios.get(PENDING_LEAVES_URL);
-				setPendingLeaves(response.data);
-			} catch (error) {
-				console.error("Bekleyen izinler yüklenemedi", error);
-			}
-		};
-
-		fetchPendingLeaves();
-	}, []);
-
 	const handleApprove = async (leaveId) => {
 		try {
 			await axios.post(LEAVE_REQUEST_URL + `${leaveId}/approve/`);
@@ -92,6 +85,7 @@ const LeaveApproval = () => {
 					</tbody>
 				</table>
 			)}
+			<LoadMoreButton list={pendingLeaveList} />
 		</div>
 	);
 };
@@ -1,29 +1,8 @@
-import axios from "axios";
-import { useEffect, useState } from "react";
-import { LEAVE_REQUEST_URL } from "../services";
+import { LEAVE_REQUEST_URL, LoadMoreButton, usePaginatedList } from "../services";
 
 const LeaveRecords = () => {
-    const [leaveRecords, setLeaveRecords] = useState([]);
-    const [loading, setLoading] = useState(true);
-
-    useEffect(() => {
-        const fetchLeaveRecords = async () => {
-            try {
-                const response = await axios.get(LEAVE_REQUEST_URL, {
-                    params: {
-                        status: "APPROVED",
-                    },
-                });
-                console.log(response.data);
-                setLeaveRecords(response.data);
-                setLoading(false);
-            } catch (error) {
-                console.log(error);
-            }
-        };
-
-        fetchLeaveRecords();
-    }, []);
+    const leaveRecordList = usePaginatedList(LEAVE_REQUEST_URL, { status: "APPROVED" });
+    const { items: leaveRecords, loading } = leaveRecordList;
 
     return (
         <div className="container mt-4">
@@ -68,6 +47,7 @@ const LeaveRecords = () => {
                             ))}
                         </tbody>
                     </table>
+                    <LoadMoreButton list={leaveRecordList} />
                 </div>
             )}
         </div>
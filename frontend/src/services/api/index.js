@@ -1 +1,2 @@
-export * from './endpoints';
\ No newline at end of file
+export * from './endpoints';
+export * from './pagination';
@@ -0,0 +1,62 @@
+import { useCallback, useEffect, useState } from 'react';
+import axios from 'axios';
+
+// List endpoints are cursor-paginated. Pages render the first page and fetch the
+// next one on demand; the `next` link already carries the cursor and the filters.
+export const usePaginatedList = (url, params) => {
+    const [items, setItems] = useState([]);
+    const [next, setNext] = useState(null);
+    const [loading, setLoading] = useState(true);
+    const [loadingMore, setLoadingMore] = useState(false);
+    const [error, setError] = useState(null);
+    const paramsKey = JSON.stringify(params || {});
+
+    const reload = useCallback(async () => {
+        setLoading(true);
+        try {
+            const response = await axios.get(url, { params: JSON.parse(paramsKey) });
+            setItems(response.data.results);
+            setNext(response.data.next);
+            setError(null);
+        } catch (e) {
+            console.error("Liste yüklenemedi", e);
+            setError(e);
+        }
+        setLoading(false);
+    }, [url, paramsKey]);
+
+    useEffect(() => {
+        reload();
+    }, [reload]);
+
+    const loadMore = async () => {
+        if (!next) return;
+        setLoadingMore(true);
+        try {
+            const response = await axios.get(next);
+            // Rows removed locally (e.g. approved leaves) do not shift a cursor
+            setItems(prev => [...prev, ...response.data.results]);
+            setNext(response.data.next);
+        } catch (e) {
+            console.error("Sonraki sayfa yüklenemedi", e);
+        }
+        setLoadingMore(false);
+    };
+
+    return { items, setItems, hasMore: Boolean(next), loading, loadingMore, error, loadMore, reload };
+};
+
+export const LoadMoreButton = ({ list }) => {
+    if (!list.hasMore) return null;
+    return (
+        <div className="text-center my-2">
+            <button
+                className="btn btn-outline-secondary btn-sm"
+                onClick={list.loadMore}
+                disabled={list.loadingMore}
+            >
+                {list.loadingMore ? "Yükleniyor..." : "Daha fazla göster"}
+            </button>
+        </div>
+    );
+};